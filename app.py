@@ -4,11 +4,17 @@ import pandas as pd
 import gspread
 from google.oauth2.service_account import Credentials
 import os
-import sys
-import time
-import subprocess
-from datetime import datetime, timezone, timedelta
-from streamlit_autorefresh import st_autorefresh
+from datetime import datetime, timedelta
+from delta_log import RUNS_SHEET_NAME, expand_change_log
+from price_store import IncrementalLoader, get_store, normalize_frame, page_frame
+from classifier import get_classification_cache
+from history_diff import get_history_diff_cache
+from card_render import GRID_STYLE, get_card_render_cache, render_grid
+from search_index import get_search_index
+from part_index import build_part_index, build_search_rows, classify_frame, compute_data_version
+from scrape_coordinator import ScrapeCoordinator
+from crawl_schedule import KST, parse_status_time, read_status, scheduler_alive
+from scraper_main import CrawlConfig, SheetSink, StoreSink, load_secrets, make_session, run_crawl
 
 # --- 설정 ---
 st.set_page_config(page_title="픽스콘 단가표 모니터", layout="wide")
@@ -16,6 +22,14 @@ st.set_page_config(page_title="픽스콘 단가표 모니터", layout="wide")
 BASE_DIR = os.path.dirname(__file__)
 SERVICE_ACCOUNT_PATH = os.path.join(BASE_DIR, "service_account.json")
 SPREADSHEET_KEY = "1VfAiPUL--QsX7GatPESVzz80xG0BQ7Obj_mywUhJVcM"
+LATEST_RUNS = 1 # 첫 화면에서 읽는 최근 수집 회차 수
+HISTORY_PERIODS = {"최근 7일": 7, "최근 30일": 30, "최근 90일": 90, "전체": None}
+AUTO_UPDATE_COOLDOWN = 30 * 60 # 자동 업데이트가 실패해도 30분 안에는 다시 시도하지 않음
+LIST_PAGE_SIZES = [25, 50, 100, 200] # 전체 목록 탭 페이지 크기 선택지
+LIST_COLUMNS = ["수집일시", "카테고리", "상품명", "가격", "가격_숫자", "가격_VAT포함", "상태", "URL", "이미지"]
+LIST_DEFAULT_COLUMNS = ["수집일시", "카테고리", "상품명", "가격", "가격_VAT포함", "상태"]
+LIST_SORT_COLUMNS = ["수집일시", "가격_숫자", "상품명", "카테고리", "상태"]
+SCRAPE_STATUS_INTERVAL = 2 # 수집 진행 표시 갱신 주기(초) - 상태 패널만 다시 그림 (전체 화면 재실행 없음)
 
 # --- 함수 ---
 @st.cache_resource
@@ -37,67 +51,172 @@ def get_gsheet_client():
         
     return gspread.authorize(creds)
 
-@st.cache_data(ttl=3600)  # 1시간 캐시 (버튼 클릭할 때마다 API 호출 방지)
-def load_data():
+def load_sheet_data():
     gc = get_gsheet_client()
+    sh = gc.open_by_key(SPREADSHEET_KEY)
+    ws = sh.sheet1
+    data = ws.get_all_records()
+
+    # [Optimization] 변경분 기록 모드: sheet1은 변경 로그이므로 runs 하트비트로 회차별 스냅샷 복원
     try:
-        sh = gc.open_by_key(SPREADSHEET_KEY)
-        ws = sh.sheet1
-        data = ws.get_all_records()
-        df = pd.DataFrame(data)
-        
-        # [Optimization] 전처리 캐싱 내재화 (매 클릭마다 수천 줄 재계산 방지)
+        runs = sh.worksheet(RUNS_SHEET_NAME).get_all_records()
+    except gspread.WorksheetNotFound:
+        runs = []
+    if runs:
+        data = expand_change_log(data, runs)
+
+    return pd.DataFrame(data)
+
+def get_seeded_store():
+    """로컬 저장소를 반환합니다. 비어 있으면 (첫 배포 등) 구글 시트에서 한 번 가져와 채웁니다."""
+    store = get_store()
+    if store.is_empty():
+        df = load_sheet_data()
         if not df.empty and "수집일시" in df.columns:
-            # 1. 날짜 변환
-            df["수집일시"] = pd.to_datetime(df["수집일시"], errors='coerce')
-            # 2. 날짜 비어있는 행 제거
-            df = df.dropna(subset=["수집일시"])
-            # 3. 최신순 정렬 미리 수행
-            df = df.sort_values(by="수집일시", ascending=False)
-            
-        return df
+            store.append(normalize_frame(df))
+    return store
+
+@st.cache_data(ttl=3600)  # 1시간 캐시 (버튼 클릭할 때마다 API 호출 방지)
+def load_latest_snapshot(runs=LATEST_RUNS, last_success=None):
+    """
+    최근 N회차 데이터만 읽습니다. (부품 검색/전체 목록/업데이트 확인용)
+    last_success: 수집 상태 파일의 마지막 성공 시각 (캐시 키 전용 -> 스케줄러가 수집을 마치면 새로 읽음)
+    """
+    try:
+        return read_latest_snapshot(runs)
     except Exception as e:
         st.error(f"데이터 로드 실패: {e}")
         return pd.DataFrame()
 
-def run_scraper_script():
-    script_path = os.path.join(BASE_DIR, "scraper_main.py")
-    
-    # [Env] 환경변수 준비 (subprocess에 전달)
-    env = os.environ.copy()
-    
-    # 1. 픽스콘 계정 정보 전달
-    # 로컬: secrets.json (load_secrets가 처리하지만, 명시적으로 넘겨도 무방)
-    # 클라우드: st.secrets에서 가져와서 환경변수에 주입
-    if "monitor_login" in st.secrets:
-        env["FIXCON_ID"] = st.secrets["monitor_login"]["username"]
-        env["FIXCON_PW"] = st.secrets["monitor_login"]["password"]
-    
-    # 2. 구글 서비스 계정 전달
-    if "gcp_service_account" in st.secrets:
-        # dict -> json string 변환하여 전달
-        import json
-        env["GCP_SERVICE_ACCOUNT"] = json.dumps(dict(st.secrets["gcp_service_account"]))
+def read_latest_snapshot(runs=LATEST_RUNS):
+    """최근 N회차를 저장소에서 바로 읽습니다. (캐시 없음, 수집 완료 직후 캐시 준비에도 사용)"""
+    df = get_seeded_store().read_latest(runs)
+    # 최신순 정렬 미리 수행
+    return df.sort_values(by="수집일시", ascending=False)
+
+@st.cache_resource(max_entries=4)
+def get_history_loader(since=None):
+    """
+    [Optimization] 기간(since) 이후 이력을 프로세스에 한 번만 읽어 두고, 수집 후에는 새로 추가된 회차만 이어 붙임
+    since 이전 회차 파일/행은 처음부터 읽지 않음 (기간별로 로더 1개, 최근 4개까지 유지)
+    """
+    return IncrementalLoader(get_seeded_store(), since)
+
+@st.cache_data(ttl=3600)
+def load_history(since=None, last_success=None):
+    """since 이후(없으면 전체) 회차를 읽습니다. (변동 내역 탭에서 요청했을 때만 호출, last_success는 캐시 키 전용)"""
+    try:
+        return get_history_loader(since).load()
+    except Exception as e:
+        st.error(f"변동 내역 로드 실패: {e}")
+        return pd.DataFrame()
+
+def clear_data_cache():
+    load_latest_snapshot.clear()
+    load_history.clear()
+
+def filter_scope(df):
+    # [Scope Change] iPhone 데이터 및 악세사리 표시
+    if "카테고리" in df.columns:
+        # iPhone 또는 Acc_로 시작하는 카테고리만 포함
+        df = df[ (df["카테고리"] == "iPhone") | (df["카테고리"].str.startswith("Acc_")) ]
+    return df
 
+def warm_part_caches():
+    """
+    [Optimization] 수집 완료 직후 새 데이터 버전의 카드 HTML(백그라운드)과 상품명 검색 색인을 미리 준비
+    (화면과 같은 스냅샷/분류/데이터 버전 사용 -> 다음 화면 갱신 때는 캐시된 HTML/색인만 사용)
+    """
     try:
-        # 서브프로세스로 스크립트 실행 (sys.executable 사용 필수)
-        # env 파라미터로 위에서 설정한 환경변수 전달
-        result = subprocess.run(
-            [sys.executable, script_path], 
-            capture_output=True, 
-            text=True, 
-            encoding='utf-8',
-            check=True,
-            env=env,
-            timeout=180 # [Fix] 3분 타임아웃 추가
-        )
-        return True, result.stdout
-    except subprocess.TimeoutExpired:
-        return False, "시간 초과: 데이터 수집이 3분 이상 걸려 중단되었습니다."
-    except subprocess.CalledProcessError as e:
-        return False, e.stdout + "\n" + e.stderr
+        snapshot = classify_frame(filter_scope(read_latest_snapshot()), dropna=False)
+        df = snapshot.dropna(subset=["부품"])
+        if not df.empty:
+            version = compute_data_version(df)
+            get_card_render_cache().warm(version, build_part_index(df))
+            get_search_index().update(version, build_search_rows(snapshot))
     except Exception as e:
-        return False, str(e)
+        print(f"[-] 카드/검색 캐시 준비 실패: {e}")
+
+@st.cache_resource
+def get_http_session():
+    """수집용 HTTP 세션 (연결 풀/로그인 쿠키를 수집 회차 간 재사용)"""
+    return make_session()
+
+def make_scrape_job():
+    """
+    [Optimization] 서브프로세스(새 파이썬 인터프리터) 대신 앱 프로세스 안에서 수집 실행
+    캐시된 gspread 클라이언트/HTTP 세션을 그대로 넘기므로 재임포트/재인증/환경변수 직렬화가 없음
+    반환값: 백그라운드 스레드에서 실행할 함수 (작업을 받아 진행 상황을 기록하고 성공 여부, 메시지 반환)
+    """
+    # 픽스콘 계정 정보 (클라우드: st.secrets / 로컬: secrets.json 또는 환경변수)
+    if "monitor_login" in st.secrets:
+        user_id = st.secrets["monitor_login"]["username"]
+        user_pw = st.secrets["monitor_login"]["password"]
+    else:
+        secrets = load_secrets() or {}
+        user_id, user_pw = secrets.get("FIXCON_ID"), secrets.get("FIXCON_PW")
+    config = CrawlConfig(user_id, user_pw, session=get_http_session())
+    sinks = [StoreSink(), SheetSink(gc=get_gsheet_client())]
+
+    def scrape_job(job):
+        if not user_id or not user_pw:
+            return False, "픽스콘 계정 정보를 찾을 수 없습니다. (secrets)"
+
+        def on_event(event):
+            job.report(event)
+            if event["type"] == "category":
+                # 카테고리가 저장소에 먼저 기록됨 -> 다음 화면 갱신 때 그 카테고리부터 새 데이터로 표시
+                clear_data_cache()
+
+        result = run_crawl(config, sinks, listener=on_event)
+        if result.success:
+            # 업데이트 성공 시 캐시 초기화 (다음 클릭이나 탭 이동시 새 데이터가 보이도록)
+            clear_data_cache()
+            warm_part_caches()
+        return result.success, result.message
+
+    return scrape_job
+
+@st.cache_resource
+def get_scrape_coordinator():
+    """[Fix] 세션(브라우저)마다가 아니라 앱 프로세스 전체에서 수집을 한 번에 하나만 실행"""
+    return ScrapeCoordinator()
+
+def render_scrape_status():
+    """
+    진행 중인 수집(누가 시작했든)을 표시하고, 지켜보던 수집이 끝나면 결과를 한 번 알려줍니다.
+    수집 중에는 st.fragment(run_every)로 이 패널만 주기적으로 다시 그림 (끝나면 전체 화면 1회 갱신)
+    """
+    job = get_scrape_coordinator().current()
+    if job is None:
+        return
+    if job.running:
+        # 늦게 접속한 세션도 진행 중인 수집에 합류
+        st.session_state["watching_job"] = job.id
+        event = job.progress
+        if event is None:
+            st.progress(0.0, text=f"🔄 로그인 중... ({int(job.elapsed())}초 경과)")
+            return
+        eta = f", 남은 시간 약 {int(event['eta'])}초" if event["eta"] is not None else ""
+        st.progress(
+            event["done"] / event["total"] if event["total"] else 0.0,
+            text=f"🔄 {event['category']} {event['page']}페이지 · 총 {event['items']}개 수집 ({event['done']}/{event['total']} 카테고리{eta})",
+        )
+        if job.finished_categories:
+            st.caption("반영 완료: " + ", ".join(job.finished_categories))
+    elif st.session_state.get("watching_job") == job.id:
+        # 방금 끝남 -> 새 데이터로 전체 화면을 한 번 다시 그린 뒤 결과 메시지 표시
+        del st.session_state["watching_job"]
+        st.session_state["finished_job"] = job.id
+        st.rerun()
+    elif st.session_state.get("finished_job") == job.id:
+        # 업데이트가 방금 끝난 상태라면 결과 메시지 띄운 후 상태 삭제
+        del st.session_state["finished_job"]
+        if job.success:
+            st.success("✨ 수집 완료! 최신 단가표가 반영되었습니다.")
+        else:
+            st.error("수집에 실패했습니다. 잠시 후 다시 시도해주세요.")
+            print("Background update failed:", job.output)
 
 # --- UI ---
 st.title("📱 픽스콘 단가표 모니터")
@@ -121,119 +240,71 @@ with st.sidebar:
     st.divider()
 
     if st.button("🔄 가격 정보 업데이트 (크롤링)", use_container_width=True):
-        st.toast("백그라운드에서 최신 단가표를 수집 중입니다. 화면 멈춤 없이 앱을 계속 이용하실 수 있습니다!", icon="⏳")
-        import threading
-        import subprocess
-        import json
-        from streamlit.runtime.scriptrunner import add_script_run_ctx
-        
-        def bg_scraper_manual(env_dict):
-            try:
-                script_path = os.path.join(BASE_DIR, "scraper_main.py")
-                subprocess.run([sys.executable, script_path], capture_output=True, text=True, encoding='utf-8', check=True, env=env_dict, timeout=180)
-                # 업데이트 성공 시 캐시 초기화
-                load_data.clear()
-            except Exception as e:
-                print("Manual background update failed:", e)
-            finally:
-                st.session_state["is_updating"] = False
-
-        env = os.environ.copy()
-        if "monitor_login" in st.secrets:
-            env["FIXCON_ID"] = st.secrets["monitor_login"]["username"]
-            env["FIXCON_PW"] = st.secrets["monitor_login"]["password"]
-        if "gcp_service_account" in st.secrets:
-            env["GCP_SERVICE_ACCOUNT"] = json.dumps(dict(st.secrets["gcp_service_account"]))
-        
-        st.session_state["is_updating"] = True
-        t = threading.Thread(target=bg_scraper_manual, args=(env,))
-        add_script_run_ctx(t)
-        t.daemon = True
-        t.start()
-    
-    # [Feature] 백그라운드 업데이트 진행 중이면 자동 새로고침 (5초 간격)
-    if st.session_state.get("is_updating", False):
-        st.info("🔄 크롤링이 진행 중입니다... (완료 시 자동 새로고침 됨)")
-        st_autorefresh(interval=5000, key="data_update_refresh")
-    elif "is_updating" in st.session_state and not st.session_state["is_updating"]:
-        # 업데이트가 방금 끝난 상태라면 성공 메시지 띄운 후 상태 삭제
-        st.success("✨ 수집 완료! 최신 단가표가 반영되었습니다.")
-        del st.session_state["is_updating"]
+        job, started = get_scrape_coordinator().submit(make_scrape_job(), trigger="manual")
+        st.session_state["watching_job"] = job.id
+        if started:
+            st.toast("백그라운드에서 최신 단가표를 수집 중입니다. 화면 멈춤 없이 앱을 계속 이용하실 수 있습니다!", icon="⏳")
+        else:
+            st.toast("이미 진행 중인 수집이 있습니다. 완료되면 함께 반영됩니다.", icon="⏳")
 
     # st.info("데이터는 'Fixcon_DB' 구글 시트에 저장됩니다.")
     # st.markdown(f"[구글 시트 바로가기](https://docs.google.com/spreadsheets/d/{SPREADSHEET_KEY})")
 
 # 2. 데이터 로드 및 전처리
-df = load_data()
+# [Fix] 수집 상태 파일을 먼저 읽어 마지막 성공 시각을 캐시 키로 전달
+# (앱 밖의 스케줄러(scraper_main.py --daemon)가 수집해도 1시간 캐시를 기다리지 않고 새 데이터 표시)
+crawl_status = read_status()
+last_success = crawl_status.get("last_success")
+# [Optimization] 첫 화면은 최신 회차만 로드 (전체 이력은 변동 내역 탭에서 필요할 때만)
+df = load_latest_snapshot(last_success=last_success)
 
 # [Fix] 시간에 따른 자동 업데이트 체크
-if not df.empty and "수집일시" in df.columns:
+# [Optimization] 전체 데이터 대신 수집 상태 파일로 판단, 스케줄러(scraper_main.py --daemon)가 돌고 있으면 접속 시 수집하지 않음
+if not scheduler_alive(crawl_status):
 
     try:
-        last_update = df["수집일시"].max()
-        kst = timezone(timedelta(hours=9))
-        now_kst = datetime.now(kst)
-        
-        # [Fix] 오전 10시 기준 업데이트 (10시간 차감하여 하루의 기준을 오전 10시로 변경)
-        business_date = (now_kst - timedelta(hours=10)).date()
-        
-        try:
-            last_update_tz_naive = last_update.tz_localize(None)
-        except:
-            last_update_tz_naive = last_update
+        last_update = parse_status_time(last_success)
+        if last_update is None and not df.empty and "수집일시" in df.columns:
+            # 상태 파일이 없으면 (상태 파일 도입 전 데이터) 기존처럼 데이터에서 확인
+            last_update = df["수집일시"].max().to_pydatetime().replace(tzinfo=KST)
+
+        if last_update is not None:
+            now_kst = datetime.now(KST)
             
-        last_update_business_date = (last_update_tz_naive - timedelta(hours=10)).date()
-        
-        # 마지막으로 수집된 시간이 "어제 오전 10시 ~ 오늘 오전 10시 이전"이고, 현재 "오늘 오전 10시"가 지났다면
-        if last_update_business_date < business_date:
-            # Session State를 이용해 무한 루프 방지 (한 번만 실행)
-            if "auto_updated" not in st.session_state:
-                st.session_state["auto_updated"] = True
-                
-                # [Fix] 백그라운드 업데이트 (UI 블로킹 방지)
-                st.toast("오전 10시가 지나 백그라운드에서 최신 단가표를 수집 중입니다. (기존 데이터 조회는 계속 가능합니다)", icon="⏳")
-                
-                import threading
-                import subprocess
-                import json
-                from streamlit.runtime.scriptrunner import add_script_run_ctx
-                
-                def bg_scraper(env_dict):
-                    try:
-                        script_path = os.path.join(BASE_DIR, "scraper_main.py")
-                        subprocess.run([sys.executable, script_path], capture_output=True, text=True, encoding='utf-8', check=True, env=env_dict, timeout=180)
-                        # 업데이트 성공 시 캐시 초기화 (다음 클릭이나 탭 이동시 새 데이터가 보이도록)
-                        load_data.clear()
-                    except Exception as e:
-                        print("Background update failed:", e)
-                    finally:
-                        st.session_state["is_updating"] = False
-
-                env = os.environ.copy()
-                if "monitor_login" in st.secrets:
-                    env["FIXCON_ID"] = st.secrets["monitor_login"]["username"]
-                    env["FIXCON_PW"] = st.secrets["monitor_login"]["password"]
-                if "gcp_service_account" in st.secrets:
-                    env["GCP_SERVICE_ACCOUNT"] = json.dumps(dict(st.secrets["gcp_service_account"]))
-                
-                st.session_state["is_updating"] = True
-                t = threading.Thread(target=bg_scraper, args=(env,))
-                add_script_run_ctx(t)
-                t.daemon = True
-                t.start()
+            # [Fix] 오전 10시 기준 업데이트 (10시간 차감하여 하루의 기준을 오전 10시로 변경)
+            business_date = (now_kst - timedelta(hours=10)).date()
+            last_update_business_date = (last_update - timedelta(hours=10)).date()
+            
+            # 마지막으로 수집된 시간이 "어제 오전 10시 ~ 오늘 오전 10시 이전"이고, 현재 "오늘 오전 10시"가 지났다면
+            if last_update_business_date < business_date:
+                # Session State를 이용해 무한 루프 방지 (세션당 한 번만 요청)
+                if "auto_updated" not in st.session_state:
+                    st.session_state["auto_updated"] = True
+                    
+                    # [Fix] 백그라운드 업데이트 (UI 블로킹 방지)
+                    # 여러 세션이 동시에 요청해도 실제 수집은 1회 (진행 중이면 그 작업에 합류)
+                    job, started = get_scrape_coordinator().submit(make_scrape_job(), trigger="auto", cooldown=AUTO_UPDATE_COOLDOWN)
+                    if job.running:
+                        st.session_state["watching_job"] = job.id
+                    if started:
+                        st.toast("오전 10시가 지나 백그라운드에서 최신 단가표를 수집 중입니다. (기존 데이터 조회는 계속 가능합니다)", icon="⏳")
                 
     except Exception as e:
         pass # 날짜 파싱 오류 등 무시
 
+# 수집 상태 표시 (자동 업데이트 요청 이후에 그려야 방금 시작한 수집도 바로 표시됨)
+# [Optimization] 5초마다 전체 화면을 재실행하던 자동 새로고침 대신, 수집 중일 때만 상태 패널 fragment를 주기 갱신
+with st.sidebar:
+    current_job = get_scrape_coordinator().current()
+    status_interval = SCRAPE_STATUS_INTERVAL if current_job is not None and current_job.running else None
+    st.fragment(render_scrape_status, run_every=status_interval)()
+
 if not df.empty:
     # 메타데이터 표시
     latest_date = df["수집일시"].dt.strftime("%Y-%m-%d %H:%M").iloc[0]
     st.caption(f"최종 업데이트: {latest_date} (KST)")
 
-    # [Scope Change] iPhone 데이터 및 악세사리 표시
-    if "카테고리" in df.columns:
-        # iPhone 또는 Acc_로 시작하는 카테고리만 포함
-        df = df[ (df["카테고리"] == "iPhone") | (df["카테고리"].str.startswith("Acc_")) ]
+    df = filter_scope(df)
 
     # 탭 구성: 검색 / 변동 내역 / 전체 목록
     tab1, tab3, tab2 = st.tabs(["🔍 부품 검색", "📉 변동 내역", "📋 전체 목록"])
@@ -242,34 +313,7 @@ if not df.empty:
     @st.cache_data(show_spinner=False)
     def get_processed_data(df):
         if df.empty:
-            return df, {}, []
-            
-        # 순서 중요: 긴 이름부터 매칭해야 함 (예: 17 Pro Max -> 17 Pro보다 먼저)
-        MODEL_MAPPING = [
-            ("17Pro-Max", "iPhone 17 Pro Max"), ("17Pro", "iPhone 17 Pro"), ("17AIR", "iPhone 17 Air"), ("17", "iPhone 17"),
-            ("16Pro-Max", "iPhone 16 Pro Max"), ("16Pro", "iPhone 16 Pro"), ("16+", "iPhone 16 Plus"), ("16E", "iPhone 16E"), ("16", "iPhone 16"),
-            ("15Pro-Max", "iPhone 15 Pro Max"), ("15Pro", "iPhone 15 Pro"), ("15+", "iPhone 15 Plus"), ("15", "iPhone 15"),
-            ("14Pro-Max", "iPhone 14 Pro Max"), ("14Pro", "iPhone 14 Pro"), ("14+", "iPhone 14 Plus"), ("14", "iPhone 14"),
-            ("13Pro-Max", "iPhone 13 Pro Max"), ("13Pro", "iPhone 13 Pro"), ("13Mini", "iPhone 13 Mini"), ("13", "iPhone 13"),
-            ("12Pro-Max", "iPhone 12 Pro Max"), ("12Pro", "iPhone 12 Pro"), ("12Mini", "iPhone 12 Mini"), ("12", "iPhone 12"),
-            ("11Pro-Max", "iPhone 11 Pro Max"), ("11Pro", "iPhone 11 Pro"), ("11", "iPhone 11"),
-            ("XSMax", "iPhone XS Max"), ("XS Max", "iPhone XS Max"), ("XS-Max", "iPhone XS Max"), ("XS", "iPhone XS"), ("XR", "iPhone XR"), ("X", "iPhone X"),
-            ("SE", "iPhone SE"), ("8+", "iPhone 8 Plus"), ("8", "iPhone 8"),
-            ("7+", "iPhone 7 Plus"), ("7", "iPhone 7"), ("6S+", "iPhone 6S Plus"), ("6S", "iPhone 6S"), ("6+", "iPhone 6 Plus"), ("6", "iPhone 6")
-        ]
-
-        def extract_model_precise(row):
-            # 1. 악세사리 처리
-            cat = row["카테고리"]
-            if str(cat).startswith("Acc_"):
-                return "악세사리"
-
-            # 2. 아이폰 모델 파싱
-            name = row["상품명"]
-            for pattern, display_name in MODEL_MAPPING:
-                if pattern.lower() in name.lower():
-                    return display_name
-            return "기타"
+            return df, {}, {}, {}, None
             
         # [User Request] 모델 정렬 순서 정의 (기본 -> 에어/플러스/미니 -> 프로 -> 맥스)
         def model_sort_key(m):
@@ -301,51 +345,11 @@ if not df.empty:
             # 4순위: 기본형 (가장 앞)
             return 1
 
-        # [Changed] apply시 axis=1 사용 (카테고리 정보 접근 위해)
-        df["모델"] = df.apply(extract_model_precise, axis=1)
-        
-        # [Optimization] 부품명 파싱도 미리 수행 (캐싱)
-        def extract_part(row):
-            name = row["상품명"]
-            cat = row["카테고리"]
-            model_name = row["모델"]
-
-            # [New] 악세사리 부품 상세 분류
-            if str(cat).startswith("Acc_") or "악세" in str(cat) or model_name == "악세사리":
-                # 1. 필름류 (필름, 카메라링, 카메라필름)
-                # 1. 필름류 (필름, 카메라링, 카메라필름)
-                if any(x in name for x in ["필름", "카메라링", "카메라 링", "강화유리", "카메라 렌즈 보호링"]): return "필름"
-                # 2. 케이스류
-                if "케이스" in name: return "케이스"
-                # 3. 충전기류 (케이블, 어댑터 통합)
-                if any(x in name for x in ["케이블", "어댑터", "어덥터", "충전기", "젠더"]): return "충전기"
-                # 4. 기타
-                return "기타"
-
-            # [User Request] 제외 필터 (하우징, 일반형 등)
-            if "하우징" in name: return None
-            if "(베젤형)" in name: return None
-            if "(일반형)" in name: return None
-            if "(고급형)" in name: return None
-            if "13Pro 골드" in name: return None
-
-            # [User Request] iPhone 7+, 8+ 액정 예외 처리 ((정), (재), (카))
-            if model_name in ["iPhone 7 Plus", "iPhone 8 Plus"]:
-                if any(x in name for x in ["(정)", "(재)", "(카)"]):
-                    return "액정"
-            
-            # 명시적 카테고리 (케이블은 기타로 통합되므로 제거)
-            if "액정" in name: return "액정"
-            if "배터리" in name: return "배터리"
-            if "카메라" in name: return "카메라"
-            if "유리" in name: return "후면유리"
-            if "보드" in name: return "메인보드"
-            
-            return "기타"
-
-        # [Changed] apply시 axis=1 사용
-        df["부품"] = df.apply(extract_part, axis=1)
-        # [Filter] None 제거
+        # [Optimization] 행 단위 apply 대신 사전 컴파일된 규칙으로 벡터 분류 (classifier.py)
+        # 처음 보는 상품명만 분류하고 나머지는 파일 캐시에서 재사용 (규칙 변경 시 자동 무효화)
+        df = classify_frame(df, dropna=False)
+        # 상품명 검색은 부품/가격이 없는 상품까지 전체 대상
+        search_rows = build_search_rows(df)
         df = df.dropna(subset=["부품"])
 
         # 시리즈 매핑
@@ -364,8 +368,27 @@ if not df.empty:
             elif any(x in m for x in ["X", "XS", "XR"]): grp = "iPhone X/XS/XR Series"
             elif any(x in m for x in ["SE", "8", "7", "6"]): grp = "iPhone SE/8/7/6 Series"
             series_map[m] = grp
-            
-        return df, series_map
+
+        # [Sort] 부품 우선순위 정렬
+        def part_sort_key(p):
+            if "액정" in p: return 0
+            if "배터리" in p: return 1
+            if "카메라" in p: return 2
+            if "후면유리" in p: return 3
+            if "메인보드" in p: return 4
+            if "충전기" in p: return 5
+            if "케이스" in p: return 6
+            if "필름" in p: return 7
+            return 10 # 기타
+
+        # 모델별 부품 목록 (버튼 표시용)
+        model_parts = {m: sorted(parts, key=part_sort_key) for m, parts in df.groupby("모델")["부품"].unique().items()}
+
+        # [Optimization] (모델, 부품) 인덱스를 데이터 버전당 한 번만 구성 -> 버튼 클릭 시 dict 조회만 수행 (part_index.py)
+        part_index = build_part_index(df)
+        version = compute_data_version(df)
+
+        return df, series_map, model_parts, part_index, version, search_rows
 
     with tab1:
         # [Mobile UI] 버튼식 네비게이션 (One-hand usage)
@@ -373,7 +396,25 @@ if not df.empty:
         
         if not df.empty:
             # [Optimization] 데이터 전처리 캐싱 사용
-            df, series_map = get_processed_data(df)
+            df, series_map, model_parts, part_index, data_version, search_rows = get_processed_data(df)
+            # 카드 HTML은 수집 완료 시 미리 생성됨 (warm_part_caches)
+            # 앱 밖의 스케줄러가 수집한 새 버전이면 여기서 백그라운드 생성 시작 (이미 준비된 버전이면 아무것도 안 함)
+            get_card_render_cache().warm(data_version, part_index)
+
+            # [New] 상품명 검색 ("15프로 액정 정품", 부품 코드 등) - n-gram 색인 조회만 수행 (search_index.py)
+            # 색인은 수집 완료 시 갱신됨 (warm_part_caches)
+            search_query = st.text_input("상품명 검색", placeholder="🔎 상품명 검색 (예: 15프로 액정 정품)", label_visibility="collapsed", key="search_query")
+            if search_query.strip():
+                search_index = get_search_index()
+                # 앱 재시작 직후나 앱 밖의 스케줄러가 수집한 새 버전이면 검색할 때 한 번만 반영 (새로 생긴/사라진 상품만)
+                search_index.update(data_version, search_rows)
+                results = search_index.search(search_query)
+                if results:
+                    st.caption(f"검색 결과 {len(results)}건")
+                    st.markdown(GRID_STYLE + render_grid(results), unsafe_allow_html=True)
+                else:
+                    st.warning("검색 결과가 없습니다.")
+                st.divider()
             
             # 순서 보장을 위한 리스트 정의 (최신순)
             SERIES_ORDER = ["iPhone 17 Series", "iPhone 16 Series", "iPhone 15 Series", "iPhone 14 Series", "iPhone 13 Series", "iPhone 12 Series", "iPhone 11 Series", "iPhone X/XS/XR Series", "iPhone SE/8/7/6 Series", "악세사리"]
@@ -519,22 +560,8 @@ if not df.empty:
                 with c_title:
                     st.markdown(f"### 📱 {selected_model}")
 
-                # 선택된 모델로 변수 설정
-                model_df = df[df["모델"] == selected_model].copy()
-                
-                # [Sort] 부품 우선순위 정렬
-                def part_sort_key(p):
-                    if "액정" in p: return 0
-                    if "배터리" in p: return 1
-                    if "카메라" in p: return 2
-                    if "후면유리" in p: return 3
-                    if "메인보드" in p: return 4
-                    if "충전기" in p: return 5
-                    if "케이스" in p: return 6
-                    if "필름" in p: return 7
-                    return 10 # 기타
-                
-                parts = sorted(model_df["부품"].unique().tolist(), key=part_sort_key)
+                # 선택된 모델의 부품 목록 (우선순위 정렬 완료)
+                parts = model_parts.get(selected_model, [])
                 
                 # [UI Check] 부품이 없을 경우 처리
                 if not parts:
@@ -591,131 +618,15 @@ if not df.empty:
                 # 결과 표시 (부품이 선택되었을 때)
                 if st.session_state.selected_part:
                     selected_part = st.session_state.selected_part
-                    final_df = model_df[model_df["부품"] == selected_part].copy()
-                    
-                    # [Data Cleaning]
-                    final_df = final_df[final_df["가격"] != "Unknown"]
-                    final_df = final_df[final_df["가격"] != ""]
+                    # 중복 제거/가격순 정렬이 끝난 인덱스에서 바로 조회
+                    final_rows = part_index.get((selected_model, selected_part), [])
                     
-                    def parse_price(p_str):
-                        try:
-                            return int(str(p_str).replace("원", "").replace(",", "").strip())
-                        except:
-                            return 0
-                            
-                    final_df["가격_숫자"] = final_df["가격"].apply(parse_price)
-                    
-                    # [Fix] 중복 제거 로직 개선 (최신 데이터 우선)
-                    # 1. 수집일시 기준 내림차순 정렬 (최신 데이터가 위로)
-                    final_df = final_df.sort_values(by="수집일시", ascending=False)
-                    # 2. 상품명이 같으면 중복 제거 (가장 위의 최신 데이터만 남김, 가격 변동 무시)
-                    final_df = final_df.drop_duplicates(subset=["상품명"])
-                    # 3. 보기 좋게 가격순 정렬
-                    final_df = final_df.sort_values(by="가격_숫자", ascending=False)
-                    
-                    if not final_df.empty:
+                    if final_rows:
                         # [UI Update] HTML/CSS 기반 반응형 그리드 적용
                         # Native Streamlit으로는 "PC 3열 / 모바일 2열" 자동 전환이 불가능하므로 HTML 주입 사용
-                        
-                        st.markdown("""
-                        <style>
-                        /* [Fix] Mobile Overflow & Layout Tuning */
-                        .product-grid {
-                            display: grid;
-                            grid-template-columns: repeat(3, 1fr);
-                            gap: 10px;
-                            width: 100%; /* 부모 컨테이너 꽉 채우기 */
-                            box-sizing: border-box; /* 패딩 포함 너비 계산 */
-                        }
-                        
-                        /* 모바일 최적화 (600px 이하) */
-                        @media (max-width: 600px) {
-                            .product-grid {
-                                grid-template-columns: repeat(2, 1fr);
-                                gap: 8px; /* 간격 축소 */
-                            }
-                            /* Streamlit 기본 패딩 보정 (모바일에서 여백 줄임) */
-                            .block-container {
-                                padding-left: 1rem !important;
-                                padding-right: 1rem !important;
-                            }
-                        }
-
-                        .product-card {
-                            border: 1px solid rgba(49, 51, 63, 0.2);
-                            border-radius: 8px;
-                            padding: 10px;
-                            background-color: var(--secondary-background-color);
-                            color: var(--text-color);
-                            font-family: sans-serif;
-                            display: flex;
-                            flex-direction: column;
-                            justify-content: space-between;
-                            box-sizing: border-box;
-                            min-width: 0; /* [Fix] Grid 아이템 오버플로우 방지 필수 */
-                            overflow: hidden; /* [Fix] 내용이 넘치면 숨김 */
-                        }
-                        .card-title {
-                            font-weight: bold;
-                            font-size: 0.85rem; /* [Fix] 폰트 조금 더 축소 (더 많이 보여주기 위함) */
-                            margin-bottom: 8px;
-                            /* [Fix] 한 줄 말줄임 -> 두 줄까지 허용 */
-                            white-space: normal; 
-                            display: -webkit-box;
-                            -webkit-line-clamp: 2; /* 최대 2줄까지 표시 */
-                            -webkit-box-orient: vertical;
-                            overflow: hidden; 
-                            text-overflow: ellipsis;
-                            line-height: 1.3; /* 줄 간격 조정 */
-                            width: 100%;
-                        }
-                        .card-status-soldout { color: #ff4b4b; font-size: 0.75rem; }
-                        .card-status-ok { color: #0083b8; font-size: 0.75rem; }
-                        .card-price-detail { font-size: 0.75rem; color: #555; margin-top: 4px; }
-                        .card-total-price { font-size: 1.0rem; font-weight: bold; color: #00b050; margin-top: 5px; }
-                        </style>
-                        """, unsafe_allow_html=True)
-
-                        html_content = '<div class="product-grid">'
-                        
-                        for idx, row in enumerate(final_df.to_dict("records")):
-                            # 상태 텍스트
-                            status_html = ""
-                            if "품절" in row["상태"]:
-                                status_html = '<span class="card-status-soldout">품절</span>'
-                            else:
-                                status_html = '<span class="card-status-ok">구매가능</span>'
-                            
-                            # 가격 계산
-                            price_num = row['가격_숫자']
-                            price_block = ""
-                            
-                            if price_num > 0:
-                                vat = int(price_num * 0.1)
-                                total = price_num + vat
-                                p_str = f"{price_num:,}"
-                                v_str = f"{vat:,}"
-                                t_str = f"{total:,}"
-                                
-                                price_block = f"""
-                                <div style="font-size: 0.8rem; opacity: 0.8;">{p_str}원 + {v_str}원 (VAT)</div>
-                                <div class="card-total-price">💳 {t_str}원</div>
-                                """
-                            else:
-                                price_block = f"<div class='card-total-price'>{row['가격']}</div>"
-
-                            # 카드 조립
-                            # [Fix] Indentation removed to prevent Markdown code block rendering
-                            html_content += f"""<div class="product-card">
-<div class="card-title" title="{row['상품명']}">{row['상품명']}</div>
-<div style="display:flex; justify-content:space-between; align-items:center;">
-{status_html}
-</div>
-<div>{price_block}</div>
-</div>"""
-                        
-                        html_content += '</div>'
-                        st.markdown(html_content, unsafe_allow_html=True)
+                        # [Optimization] 카드 HTML은 데이터 버전당 한 번만 생성 (card_render.py) -> 클릭 시 캐시된 문자열만 출력
+                        html_content = get_card_render_cache().get(data_version, (selected_model, selected_part), final_rows)
+                        st.markdown(GRID_STYLE + html_content, unsafe_allow_html=True)
                     else:
                         st.warning("가격 정보가 없는 상품만 있거나 데이터가 없습니다.")
                 else:
@@ -725,76 +636,107 @@ if not df.empty:
             st.warning("데이터가 없습니다.")
 
     with tab2:
-        st.dataframe(df, use_container_width=True)
+        # [Optimization] 전체 프레임 대신 필터/정렬을 거친 한 페이지만 브라우저로 전송
+        # 기본은 최신 회차 (이미 메모리에 있음), 기간 조회는 저장소에서 필요한 컬럼/행만 읽음
+        l_col1, l_col2 = st.columns([2, 1])
+        with l_col1:
+            list_scope = st.radio("조회 범위", ["최신 회차", "기간 조회"], horizontal=True, label_visibility="collapsed", key="list_scope")
+        with l_col2:
+            page_size = st.selectbox("페이지 크기", LIST_PAGE_SIZES, index=1, key="list_page_size")
+
+        f_col1, f_col2, f_col3 = st.columns(3)
+        with f_col1:
+            sel_categories = st.multiselect("카테고리", sorted(df["카테고리"].astype(str).unique()), key="list_categories")
+        with f_col2:
+            sel_models = st.multiselect("모델", sorted(df["모델"].unique()) if "모델" in df.columns else [], key="list_models")
+        with f_col3:
+            sel_statuses = st.multiselect("상태", sorted(df["상태"].astype(str).unique()), key="list_statuses")
+
+        s_col1, s_col2, s_col3 = st.columns([2, 1, 3])
+        with s_col1:
+            sort_by = st.selectbox("정렬", LIST_SORT_COLUMNS, key="list_sort_by")
+        with s_col2:
+            ascending = st.toggle("오름차순", key="list_ascending")
+        with s_col3:
+            list_columns = st.multiselect("표시 컬럼", LIST_COLUMNS, default=LIST_DEFAULT_COLUMNS, key="list_columns")
+
+        where = {"카테고리": sel_categories, "상태": sel_statuses}
+        since = until = None
+        if list_scope == "최신 회차":
+            source = df
+            if sel_models:
+                where["모델"] = sel_models
+        else:
+            latest_day = df["수집일시"].max().date()
+            date_range = st.date_input("기간", (latest_day - timedelta(days=7), latest_day), key="list_dates")
+            if len(date_range) == 2:
+                since = pd.Timestamp(date_range[0])
+                until = pd.Timestamp(date_range[1]) + pd.Timedelta(days=1)
+            source = None
+            # 저장소에는 범위 밖 카테고리도 있으므로 선택이 없으면 화면 범위(iPhone/악세사리) 카테고리로 제한
+            where["카테고리"] = sel_categories or sorted(df["카테고리"].astype(str).unique())
+            if sel_models:
+                # 모델은 저장 컬럼이 아니므로 기간 안의 상품명 중 해당 모델로 분류되는 이름으로 바꿔 조건 전달
+                names_df, _ = get_seeded_store().read_page(since, until, where, sort_by=None, columns=["카테고리", "상품명"])
+                names_df = names_df.drop_duplicates()
+                models, _ = get_classification_cache().classify(names_df["상품명"], names_df["카테고리"])
+                model_names = names_df.loc[models.isin(sel_models).to_numpy(), "상품명"].unique().tolist()
+                if model_names:
+                    where["상품명"] = model_names
+                else:
+                    source = df.iloc[0:0] # 해당 모델 상품이 기간 안에 없음
+
+        def read_list_page(offset):
+            columns = list_columns or LIST_DEFAULT_COLUMNS
+            if source is not None:
+                return page_frame(source, where=where, sort_by=sort_by, ascending=ascending, offset=offset, limit=page_size, columns=columns)
+            return get_seeded_store().read_page(since, until, where, sort_by, ascending, offset, page_size, columns)
+
+        page_no = st.session_state.get("list_page", 1)
+        try:
+            page_df, total = read_list_page((page_no - 1) * page_size)
+            page_count = max(1, -(-total // page_size))
+            if page_no > page_count:
+                # 필터가 바뀌어 페이지 수가 줄었으면 첫 페이지로
+                page_no = st.session_state["list_page"] = 1
+                page_df, total = read_list_page(0)
+            st.dataframe(page_df, use_container_width=True, hide_index=True)
+            p_col1, p_col2 = st.columns([1, 3])
+            with p_col1:
+                st.number_input("페이지", min_value=1, max_value=page_count, step=1, key="list_page")
+            with p_col2:
+                st.caption(f"총 {total:,}건 · {page_no}/{page_count} 페이지")
+        except Exception as e:
+            st.error(f"목록 조회 실패: {e}")
 
     with tab3:
         st.subheader("일일 가격 변동 내역")
         st.caption("최근 두 번의 수집 데이터를 비교하여 가격이나 상태가 변한 상품을 보여줍니다.")
+
+        # [Optimization] 이력은 이 탭에서 요청했을 때만 로드 (첫 화면 로딩 시간 단축)
+        h_col1, h_col2 = st.columns([2, 1])
+        with h_col1:
+            period_label = st.selectbox("조회 기간", list(HISTORY_PERIODS), index=1, label_visibility="collapsed")
+        with h_col2:
+            show_history = st.toggle("변동 내역 불러오기", key="show_history")
         
         # [Cache] 히스토리 계산 로직 캐싱 (탭 전환 시 렉 방지)
+        # [Optimization] 날짜 쌍별 비교 결과는 파일 캐시에 남겨 새 수집분만 계산 (history_diff.py)
         @st.cache_data(show_spinner=False)
         def get_history_data(df):
-            # 1. 날짜만 추출 (YYYY-MM-DD)
-            df["date_only"] = df["수집일시"].dt.date
-            unique_days = sorted(df["date_only"].unique(), reverse=True)
-            
-            if len(unique_days) < 2:
-                return [d.strftime("%Y-%m-%d") for d in unique_days], []
-            
-            history_list = []
-            
-            # 2. 일별 비교 (오늘 vs 어제, 어제 vs 그제...)
-            # 하루에 여러 번 수집했더라도, 그 날의 '가장 마지막(최신)' 데이터만 대표로 사용
-            for i in range(len(unique_days) - 1):
-                curr_day = unique_days[i]
-                prev_day = unique_days[i+1]
-                
-                # 각 날짜의 가장 최신 타임스탬프 찾기
-                curr_ts = df[df["date_only"] == curr_day]["수집일시"].max()
-                prev_ts = df[df["date_only"] == prev_day]["수집일시"].max()
-                
-                # 해당 타임스탬프의 데이터만 추출
-                curr_df = df[df["수집일시"] == curr_ts].set_index("상품명")
-                prev_df = df[df["수집일시"] == prev_ts].set_index("상품명")
-                
-                day_changes = []
-                for name, row in curr_df.iterrows():
-                    if name in prev_df.index:
-                        prev_row = prev_df.loc[name]
-                        if isinstance(prev_row, pd.DataFrame): prev_row = prev_row.iloc[0]
-                        
-                        curr_price = row["가격"]
-                        prev_price = prev_row["가격"]
-                        
-                        # 가격 비교
-                        try:
-                            cp = int(str(curr_price).replace(",", "").replace("원", ""))
-                            pp = int(str(prev_price).replace(",", "").replace("원", ""))
-                            diff = cp - pp
-                            if diff != 0:
-                                icon = "🔻" if diff < 0 else "🔺"
-                                color = "blue" if diff < 0 else "red"
-                                diff_str = f":{color}[{diff:,}원]"
-                                day_changes.append(f"{icon} **{name}**: {prev_price} → {curr_price} ({diff_str})")
-                        except:
-                            if curr_price != prev_price:
-                                day_changes.append(f"🔄 **{name}**: {prev_price} → {curr_price}")
-                        
-                        # 상태 비교 (품절 등)
-                        if row["상태"] != prev_row["상태"]:
-                             day_changes.append(f"📦 **{name}**: {prev_row['상태']} → {row['상태']}")
-                
-                if day_changes:
-                    history_list.append({
-                        "date": curr_day.strftime("%Y-%m-%d"),
-                        "prev_date": prev_day.strftime("%Y-%m-%d"),
-                        "changes": day_changes,
-                        "expanded": (i == 0) # 첫 번째(최신)만 펼침
-                    })
-            
-            return unique_days, history_list
+            return get_history_diff_cache().build_history(df)
+
+        if not show_history:
+            st.info("👆 '변동 내역 불러오기'를 켜면 선택한 기간의 이력을 불러옵니다.")
+            st.stop()
+
+        days = HISTORY_PERIODS[period_label]
+        since = None
+        if days and not df.empty:
+            since = (df["수집일시"].max() - timedelta(days=days)).normalize()
+        history_df = filter_scope(load_history(since, last_success))
 
-        dates, history_list= get_history_data(df)
+        dates, history_list= get_history_data(history_df)
         
         if len(dates) < 2:
             st.info("비교할 과거 데이터가 부족합니다. (최소 2회 이상 수집 필요)")
@@ -0,0 +1,49 @@
+"""
+카드 렌더링 벤치마크: 클릭마다 render_grid vs CardRenderCache (데이터 버전당 1회 미리 렌더링)
+합성 스냅샷으로 상품 수가 가장 많은 (모델, 부품) 조합 5개를 비교
+실행: python benchmarks/bench_card_render.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import random_snapshots
+from card_render import CardRenderCache, render_grid
+from classifier import ClassificationCache
+from part_index import build_part_index, classify_frame, compute_data_version
+
+PRODUCTS = 3_000 # 최신 회차 상품 수
+RUNS = 1 # 앱 첫 화면과 같은 최근 회차 수
+REPEAT = 200
+
+def main():
+    df = random_snapshots(PRODUCTS, RUNS)
+    with tempfile.TemporaryDirectory() as tmp:
+        df = classify_frame(df, ClassificationCache(os.path.join(tmp, "classify_cache.json")))
+    part_index = build_part_index(df)
+    version = compute_data_version(df)
+    print(f"[*] {len(part_index)}개 (모델, 부품) 조합, 상품 {len(df)}개")
+
+    cache = CardRenderCache()
+    start = time.perf_counter()
+    cache._reset(version)
+    cache._warm(version, part_index)
+    print(f"[*] 전체 미리 렌더링: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    for key, rows in sorted(part_index.items(), key=lambda kv: -len(kv[1]))[:5]:
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            html = render_grid(rows)
+        cold = (time.perf_counter() - start) / REPEAT
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            cached = cache.get(version, key, rows)
+        warm = (time.perf_counter() - start) / REPEAT
+        print(f"[+] {key[0]} / {key[1]} ({len(rows)}개): 렌더링 {cold * 1000:.2f}ms -> 캐시 {warm * 1e6:.1f}us (동일: {html == cached})")
+
+if __name__ == "__main__":
+    main()
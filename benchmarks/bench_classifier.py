@@ -0,0 +1,49 @@
+"""
+분류 벤치마크: 기존 행 단위 apply(axis=1) vs classify_models/classify_parts vs ClassificationCache
+상품명 10만 행 (고유 이름 약 2천 개가 반복 -> 실제 누적 스냅샷과 비슷한 분포)
+실행: python benchmarks/bench_classifier.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import as_list, legacy_classify, random_frame
+from classifier import ClassificationCache, classify_models, classify_parts
+
+ROWS = 100_000
+UNIQUE = 2_000
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"[+] {label}: {time.perf_counter() - start:.3f}s")
+    return result
+
+def main():
+    df = random_frame(UNIQUE, seed=0).sample(n=ROWS, replace=True, random_state=0).reset_index(drop=True)
+    print(f"[*] {len(df):,}행 (고유 상품명 {df['상품명'].nunique():,}개)")
+
+    expected = timed("기존 apply(axis=1)", lambda: legacy_classify(df))
+
+    def vectorized():
+        models = classify_models(df["상품명"], df["카테고리"])
+        return models, classify_parts(df["상품명"], df["카테고리"], models)
+    models, parts = timed("classify_models/classify_parts", vectorized)
+    assert models.tolist() == expected["모델"].tolist()
+    assert as_list(parts) == as_list(expected["부품"])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "classify_cache.json")
+        timed("ClassificationCache (빈 캐시)", lambda: ClassificationCache(path).classify(df["상품명"], df["카테고리"]))
+        cache = ClassificationCache(path)
+        models, parts = timed("ClassificationCache (캐시 적중)", lambda: cache.classify(df["상품명"], df["카테고리"]))
+    assert models.tolist() == expected["모델"].tolist()
+    assert as_list(parts) == as_list(expected["부품"])
+    print("[+] 세 방식의 분류 결과 동일")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+응답 디코딩 벤치마크: 기존 방식(res.apparent_encoding, 본문 전체 분석) vs http_utils.decode_response
+tests/fixtures의 저장된 목록 페이지를 실제 크기(상품 수십 개)로 늘려 UTF-8/EUC-KR 두 가지로 측정
+실행: python benchmarks/bench_decode.py
+"""
+import os
+import sys
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import http_utils
+from http_utils import decode_response
+
+FIXTURE = os.path.join(ROOT, "tests", "fixtures", "cafe24_list_first.html")
+REPEAT = 50
+
+def make_response(html, encoding, declare_header):
+    res = requests.Response()
+    body = html.replace('<meta charset="utf-8" />', f'<meta charset="{encoding}" />')
+    res._content = body.encode(encoding)
+    res.status_code = 200
+    res.url = "https://fixcon.co.kr/product/list.html?cate_no=24&page=1"
+    content_type = f"text/html; charset={encoding}" if declare_header else "text/html"
+    res.headers = CaseInsensitiveDict({"Content-Type": content_type})
+    return res
+
+def old_decode(res):
+    res.encoding = res.apparent_encoding
+    return res.text
+
+def bench(label, decode, res):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        text = decode(res)
+    return (time.perf_counter() - start) / REPEAT, text
+
+def main():
+    with open(FIXTURE, "r", encoding="utf-8") as f:
+        html = f.read()
+    # 저장본의 상품 목록을 늘려 실제 목록 페이지 크기(약 150KB)로 맞춤
+    head, rest = html.split('<ul class="prdList grid4">', 1)
+    items, tail = rest.split("</ul>\n</div>\n</div>", 1)
+    html = head + '<ul class="prdList grid4">' + items * 20 + "</ul>\n</div>\n</div>" + tail
+
+    for encoding in ("utf-8", "euc-kr"):
+        for declare_header in (True, False):
+            res = make_response(html, encoding, declare_header)
+            http_utils._host_encodings.clear()
+            old, old_text = bench("apparent_encoding", old_decode, res)
+            new, new_text = bench("decode_response", decode_response, res)
+            where = "헤더" if declare_header else "<meta>"
+            print(f"[+] {encoding} ({where} 선언, {len(res.content) / 1024:.0f}KB): "
+                  f"apparent_encoding {old * 1000:.2f}ms -> decode_response {new * 1000:.3f}ms "
+                  f"(페이지당 {(old - new) * 1000:.2f}ms 절감, 결과 동일: {old_text == new_text})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+부품 선택 벤치마크: 기존 방식(버튼 클릭마다 DataFrame 필터 + 가격 파싱 + 정렬 + 중복 제거) vs part_index dict 조회
+인덱스 구성은 앱과 같은 part_index.build_part_index 사용
+실행: python benchmarks/bench_part_index.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import random_snapshots
+from classifier import ClassificationCache
+from part_index import build_part_index
+
+PRODUCTS = 3_000 # 최신 회차 상품 수
+RUNS = 5 # 함께 읽는 회차 수 (같은 상품명이 회차마다 반복)
+
+def old_select(df, model, part):
+    """기존 app.py: 클릭할 때마다 전체 DataFrame을 다시 필터/정렬"""
+    model_df = df[df["모델"] == model]
+    final_df = model_df[model_df["부품"] == part].copy()
+    final_df = final_df[final_df["가격"] != "Unknown"]
+    final_df = final_df[final_df["가격"] != ""]
+
+    def parse_price(p_str):
+        try:
+            return int(str(p_str).replace("원", "").replace(",", "").strip())
+        except:
+            return 0
+
+    final_df["가격_숫자"] = final_df["가격"].apply(parse_price)
+    final_df = final_df.sort_values(by="수집일시", ascending=False)
+    final_df = final_df.drop_duplicates(subset=["상품명"])
+    final_df = final_df.sort_values(by="가격_숫자", ascending=False)
+    return final_df.to_dict("records")
+
+def main():
+    df = random_snapshots(PRODUCTS, RUNS)
+    with tempfile.TemporaryDirectory() as tmp:
+        df["모델"], df["부품"] = ClassificationCache(os.path.join(tmp, "classify_cache.json")).classify(df["상품명"], df["카테고리"])
+    df = df.dropna(subset=["부품"])
+    keys = list(df.groupby(["모델", "부품"]).groups)
+    print(f"[*] {len(df):,}행, (모델, 부품) 조합 {len(keys)}개")
+
+    start = time.perf_counter()
+    old_rows = {key: old_select(df, *key) for key in keys}
+    old = (time.perf_counter() - start) / len(keys)
+
+    start = time.perf_counter()
+    part_index = build_part_index(df)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100):
+        new_rows = {key: part_index.get(key, []) for key in keys}
+    lookup = (time.perf_counter() - start) / (100 * len(keys))
+
+    # 가격이 같은 상품끼리의 순서는 기존 정렬(비안정 정렬)에서 정해져 있지 않으므로 가격 순서 + (상품명, 가격) 집합으로 비교
+    same = all(
+        [r["가격_숫자"] for r in old_rows[k]] == [r["가격_숫자"] for r in new_rows[k]]
+        and {(r["상품명"], r["가격_숫자"]) for r in old_rows[k]} == {(r["상품명"], r["가격_숫자"]) for r in new_rows[k]}
+        for k in keys
+    )
+    print(f"[+] 기존 필터 방식: 클릭당 {old * 1000:.2f}ms")
+    print(f"[+] part_index: 구성 {build * 1000:.1f}ms (데이터 버전당 1회), 클릭당 {lookup * 1e6:.2f}us")
+    print(f"[+] 결과 상품 목록 동일: {same}")
+
+if __name__ == "__main__":
+    main()
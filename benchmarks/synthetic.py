@@ -0,0 +1,87 @@
+"""
+벤치마크/테스트 공용: 규칙 토큰으로 만든 합성 상품 데이터 + 벡터화 이전의 행 단위 분류 함수(기준 구현)
+"""
+import random
+
+import pandas as pd
+
+from classifier import ACCESSORY_PART_RULES, EXCLUDED_KEYWORDS, MODEL_MAPPING, PART_RULES, PLUS_LCD_KEYWORDS
+
+# 벡터화 이전 app.py의 행 단위 분류 함수 (df.apply(..., axis=1)로 쓰던 기준 구현)
+def legacy_model(row):
+    cat = row["카테고리"]
+    if str(cat).startswith("Acc_"):
+        return "악세사리"
+    name = row["상품명"]
+    for pattern, display_name in MODEL_MAPPING:
+        if pattern.lower() in name.lower():
+            return display_name
+    return "기타"
+
+def legacy_part(row):
+    name = row["상품명"]
+    cat = row["카테고리"]
+    model_name = row["모델"]
+    if str(cat).startswith("Acc_") or "악세" in str(cat) or model_name == "악세사리":
+        if any(x in name for x in ["필름", "카메라링", "카메라 링", "강화유리", "카메라 렌즈 보호링"]): return "필름"
+        if "케이스" in name: return "케이스"
+        if any(x in name for x in ["케이블", "어댑터", "어덥터", "충전기", "젠더"]): return "충전기"
+        return "기타"
+    if "하우징" in name: return None
+    if "(베젤형)" in name: return None
+    if "(일반형)" in name: return None
+    if "(고급형)" in name: return None
+    if "13Pro 골드" in name: return None
+    if model_name in ["iPhone 7 Plus", "iPhone 8 Plus"]:
+        if any(x in name for x in ["(정)", "(재)", "(카)"]):
+            return "액정"
+    if "액정" in name: return "액정"
+    if "배터리" in name: return "배터리"
+    if "카메라" in name: return "카메라"
+    if "유리" in name: return "후면유리"
+    if "보드" in name: return "메인보드"
+    return "기타"
+
+CATEGORIES = ["iPhone_LCD", "iPhone_Battery", "iPhone_Parts", "Acc_Film", "Acc_Case", "악세사리_기타"]
+TOKENS = ([p for p, _ in MODEL_MAPPING] + [p.lower() for p, _ in MODEL_MAPPING]
+          + [k for keywords, _ in ACCESSORY_PART_RULES + PART_RULES for k in keywords]
+          + EXCLUDED_KEYWORDS + PLUS_LCD_KEYWORDS
+          + ["아이폰", "정품", "호환", "블랙", "-", " ", "(", ")", "A급", "SE2", "Max", "mini"])
+
+def random_frame(n, seed=0):
+    """규칙 토큰을 무작위로 이어 붙인 상품명 n개 (겹치는 패턴/우선순위 경계가 골고루 나오도록)"""
+    rng = random.Random(seed)
+    names = ["".join(rng.choice(TOKENS) for _ in range(rng.randint(1, 5))) for _ in range(n)]
+    return pd.DataFrame({"카테고리": [rng.choice(CATEGORIES) for _ in range(n)], "상품명": names})
+
+def as_list(series):
+    """결측(None/NaN 모두 '목록에서 제외')은 None으로 맞춰 비교"""
+    return [None if pd.isna(v) else v for v in series]
+
+def legacy_classify(df):
+    df = df.copy()
+    df["모델"] = df.apply(legacy_model, axis=1)
+    df["부품"] = df.apply(legacy_part, axis=1)
+    return df
+
+def random_snapshots(products, runs, seed=0):
+    """
+    합성 상품 products개를 runs회 수집한 저장소 형식 DataFrame (회차마다 가격이 바뀌고 5%는 'Unknown')
+    한 회차 안에서 상품명은 고유
+    """
+    from price_store import parse_price_series, vat_inclusive
+    base = random_frame(products, seed).drop_duplicates(subset=["상품명"])
+    rng = random.Random(seed)
+    frames = []
+    for run in range(runs):
+        run_df = base.copy()
+        run_df["수집일시"] = pd.Timestamp("2026-10-01 09:00") + pd.Timedelta(hours=run)
+        run_df["가격"] = ["Unknown" if rng.random() < 0.05 else f"{rng.randint(1, 300) * 1000:,}원" for _ in range(len(run_df))]
+        run_df["상태"] = "판매중"
+        run_df["URL"] = "https://fixcon.co.kr/product/detail.html?product_no=" + run_df.index.astype(str)
+        run_df["이미지"] = ""
+        frames.append(run_df)
+    df = pd.concat(frames, ignore_index=True)
+    df["가격_숫자"] = parse_price_series(df["가격"])
+    df["가격_VAT포함"] = vat_inclusive(df["가격_숫자"])
+    return df
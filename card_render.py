@@ -0,0 +1,155 @@
+import threading
+
+import pandas as pd
+
+# [설정] 부품 검색 결과 카드 HTML (앱의 부품 검색 탭에서 사용)
+# 카드 HTML은 (데이터 버전, 모델, 부품)마다 한 번만 만들고, 버튼 클릭 시에는 완성된 문자열만 출력
+GRID_STYLE = """
+<style>
+/* [Fix] Mobile Overflow & Layout Tuning */
+.product-grid {
+    display: grid;
+    grid-template-columns: repeat(3, 1fr);
+    gap: 10px;
+    width: 100%; /* 부모 컨테이너 꽉 채우기 */
+    box-sizing: border-box; /* 패딩 포함 너비 계산 */
+}
+
+/* 모바일 최적화 (600px 이하) */
+@media (max-width: 600px) {
+    .product-grid {
+        grid-template-columns: repeat(2, 1fr);
+        gap: 8px; /* 간격 축소 */
+    }
+    /* Streamlit 기본 패딩 보정 (모바일에서 여백 줄임) */
+    .block-container {
+        padding-left: 1rem !important;
+        padding-right: 1rem !important;
+    }
+}
+
+.product-card {
+    border: 1px solid rgba(49, 51, 63, 0.2);
+    border-radius: 8px;
+    padding: 10px;
+    background-color: var(--secondary-background-color);
+    color: var(--text-color);
+    font-family: sans-serif;
+    display: flex;
+    flex-direction: column;
+    justify-content: space-between;
+    box-sizing: border-box;
+    min-width: 0; /* [Fix] Grid 아이템 오버플로우 방지 필수 */
+    overflow: hidden; /* [Fix] 내용이 넘치면 숨김 */
+}
+.card-title {
+    font-weight: bold;
+    font-size: 0.85rem; /* [Fix] 폰트 조금 더 축소 (더 많이 보여주기 위함) */
+    margin-bottom: 8px;
+    /* [Fix] 한 줄 말줄임 -> 두 줄까지 허용 */
+    white-space: normal; 
+    display: -webkit-box;
+    -webkit-line-clamp: 2; /* 최대 2줄까지 표시 */
+    -webkit-box-orient: vertical;
+    overflow: hidden; 
+    text-overflow: ellipsis;
+    line-height: 1.3; /* 줄 간격 조정 */
+    width: 100%;
+}
+.card-status-soldout { color: #ff4b4b; font-size: 0.75rem; }
+.card-status-ok { color: #0083b8; font-size: 0.75rem; }
+.card-price-detail { font-size: 0.75rem; color: #555; margin-top: 4px; }
+.card-total-price { font-size: 1.0rem; font-weight: bold; color: #00b050; margin-top: 5px; }
+</style>
+"""
+
+def render_card(row):
+    """상품 1개(part_index 행 dict) -> 카드 HTML"""
+    # 상태 텍스트
+    if "품절" in row["상태"]:
+        status_html = '<span class="card-status-soldout">품절</span>'
+    else:
+        status_html = '<span class="card-status-ok">구매가능</span>'
+
+    # 가격 (저장된 정수/부가세 포함 컬럼 사용, 정수가 없으면('가격문의' 등) 가격 문구 그대로)
+    price_num = row["가격_숫자"]
+    if pd.notna(price_num) and price_num > 0:
+        total = row["가격_VAT포함"]
+        vat = total - price_num
+        price_block = f"""
+                                <div style="font-size: 0.8rem; opacity: 0.8;">{price_num:,}원 + {vat:,}원 (VAT)</div>
+                                <div class="card-total-price">💳 {total:,}원</div>
+                                """
+    else:
+        price_block = f"<div class='card-total-price'>{row['가격']}</div>"
+
+    # [Fix] Indentation removed to prevent Markdown code block rendering
+    return f"""<div class="product-card">
+<div class="card-title" title="{row['상품명']}">{row['상품명']}</div>
+<div style="display:flex; justify-content:space-between; align-items:center;">
+{status_html}
+</div>
+<div>{price_block}</div>
+</div>"""
+
+def render_grid(rows):
+    """상품 목록 -> 반응형 그리드 HTML (PC 3열 / 모바일 2열)"""
+    return '<div class="product-grid">' + "".join(render_card(row) for row in rows) + "</div>"
+
+class CardRenderCache:
+    """
+    (모델, 부품)별 카드 그리드 HTML을 데이터 버전 하나에 대해 보관합니다.
+    - warm: 새 데이터 버전이 들어오면 백그라운드 스레드에서 모든 (모델, 부품)을 미리 렌더링
+    - get: 미리 만든 HTML이 있으면 그대로, 아직 없으면 그 자리에서 만들어 보관
+    데이터 버전이 바뀌면 이전 버전의 HTML은 통째로 버림
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = None
+        self.fragments = {}
+
+    def _reset(self, version):
+        if self.version != version:
+            self.version = version
+            self.fragments = {}
+            return True
+        return False
+
+    def warm(self, version, part_index):
+        """버전이 바뀌었을 때만 백그라운드 렌더링을 시작합니다. (이미 진행/완료된 버전이면 아무것도 안 함)"""
+        with self.lock:
+            if not self._reset(version):
+                return False
+        thread = threading.Thread(target=self._warm, args=(version, part_index), daemon=True)
+        thread.start()
+        return True
+
+    def _warm(self, version, part_index):
+        for key, rows in part_index.items():
+            html = render_grid(rows)
+            with self.lock:
+                if self.version != version:
+                    return # 렌더링 중에 더 새로운 데이터가 들어옴
+                self.fragments.setdefault(key, html)
+
+    def get(self, version, key, rows):
+        with self.lock:
+            self._reset(version)
+            html = self.fragments.get(key)
+        if html is None:
+            html = render_grid(rows)
+            with self.lock:
+                if self.version == version:
+                    self.fragments[key] = html
+        return html
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_card_render_cache():
+    """프로세스당 하나의 카드 HTML 캐시를 공유합니다. (Streamlit 세션 간 공유)"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = CardRenderCache()
+        return _default_cache
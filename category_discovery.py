@@ -0,0 +1,240 @@
+import hashlib
+import json
+import os
+import re
+import time
+from collections import deque
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from http_utils import UnexpectedStatus, decode_response, get_with_retry
+
+# [설정] 카테고리 탐색 (find_categories.py / debug_categories.py / scraper_main.TARGET_CATEGORIES 공용)
+BASE_DIR = os.path.dirname(__file__)
+HTTP_CACHE_DIR = os.path.join(BASE_DIR, ".http_cache") # URL별 응답 본문 + 검증자(ETag/Last-Modified)
+HTTP_CACHE_TTL = 24 * 60 * 60 # 이 시간 안에는 요청 없이 캐시 사용, 지나면 조건부 요청으로 재검증
+CATEGORY_TREE_PATH = os.path.join(BASE_DIR, "categories.json")
+SITE_URL = "https://fixcon.co.kr/"
+MAX_DEPTH = 3 # 홈에서 몇 단계 하위 카테고리까지 내려갈지
+MAX_CATEGORY_PAGES = 200 # 탐색할 카테고리 목록 페이지 수 상한 (안전장치)
+
+CATE_NO_RE = re.compile(r"[?&]cate_no=(\d+)")
+COUNT_RE = re.compile(r"(\d[\d,]*)")
+
+def category_url(cate_no):
+    return f"https://fixcon.co.kr/product/list.html?cate_no={cate_no}"
+
+class HttpCache:
+    """
+    URL별 응답을 디스크에 보관합니다. (파일 1개 = URL 1개, 디코딩된 본문 + 검증자)
+    - TTL 안: 요청 없이 캐시 본문 반환
+    - TTL 지남: If-None-Match/If-Modified-Since 조건부 요청 -> 304면 캐시 본문 재사용
+    - 요청은 http_utils 재시도 헬퍼 사용, 오류 응답/로그인 리다이렉트는 예외로 올리고 캐시하지 않음
+    clock: 현재 시각(초) 함수 (테스트에서 TTL 경과를 흉내낼 때 주입)
+    """
+    def __init__(self, path=HTTP_CACHE_DIR, ttl=HTTP_CACHE_TTL, clock=time.time):
+        self.path = path
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = {"fresh": 0, "revalidated": 0, "fetched": 0}
+
+    def _file(self, url):
+        return os.path.join(self.path, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+    def _load(self, url):
+        path = self._file(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            return entry if entry.get("url") == url else None
+        except Exception as e:
+            print(f"[-] HTTP 캐시 읽기 실패 ({url}): {e}")
+            return None
+
+    def _save(self, entry):
+        os.makedirs(self.path, exist_ok=True)
+        path = self._file(entry["url"])
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def get(self, session, url):
+        """url 본문(문자열)을 반환합니다. (requests.Session 사용)"""
+        entry = self._load(url)
+        if entry and self.clock() - entry["fetched_at"] < self.ttl:
+            self.stats["fresh"] += 1
+            return entry["text"]
+
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        # [Fix] 재시도/상태 검사 공용 헬퍼 사용 (5xx/429는 재시도, 그 밖의 오류/로그인 페이지는 예외 -> 캐시에 남지 않음)
+        res = get_with_retry(session, url, check_login=True, headers=headers)
+        if res.status_code == 304:
+            if entry is None:
+                raise UnexpectedStatus(url, res.status_code) # 조건부 요청을 안 했는데 304
+            self.stats["revalidated"] += 1
+            entry["fetched_at"] = self.clock()
+            self._save(entry)
+            return entry["text"]
+
+        self.stats["fetched"] += 1
+        text = decode_response(res)
+        self._save({
+            "url": url,
+            "fetched_at": self.clock(),
+            "etag": res.headers.get("ETag"),
+            "last_modified": res.headers.get("Last-Modified"),
+            "text": text,
+        })
+        return text
+
+def category_links(soup, base_url=SITE_URL):
+    """페이지의 모든 카테고리 링크 (cate_no, 이름) - 같은 번호는 처음 나온 이름만"""
+    links = {}
+    for a in soup.find_all("a", href=True):
+        m = CATE_NO_RE.search(urljoin(base_url, a["href"]))
+        name = a.get_text(" ", strip=True)
+        if m and name and m.group(1) not in links:
+            links[m.group(1)] = name
+    return links
+
+def breadcrumb_path(soup):
+    """
+    카테고리 목록 페이지의 경로 표시(홈 > 상위 > 현재)에서 카테고리 번호 목록을 읽습니다.
+    (cafe24 스킨의 .xans-product-headcategory .path / 없으면 빈 리스트)
+    """
+    path = soup.select_one(".xans-product-headcategory .path") or soup.select_one(".path")
+    if path is None:
+        return []
+    return list(category_links(path))
+
+def product_count(soup):
+    """목록 페이지의 상품 수 표시 (cafe24 스킨의 .prdCount, 없으면 None)"""
+    el = soup.select_one(".prdCount")
+    if el is None:
+        return None
+    m = COUNT_RE.search(el.get_text(" ", strip=True))
+    return int(m.group(1).replace(",", "")) if m else None
+
+def submenu_links(soup):
+    """목록 페이지의 하위 카테고리 메뉴 (cafe24 스킨의 .xans-product-menupackage, 없으면 None)"""
+    menu = soup.select_one(".xans-product-menupackage")
+    if menu is None:
+        return None
+    return category_links(menu)
+
+def discover_categories(session, cache=None, max_depth=MAX_DEPTH, max_pages=MAX_CATEGORY_PAGES):
+    """
+    홈 화면 메뉴에서 시작해 카테고리 목록 페이지를 너비 우선으로 탐색합니다.
+    상위 카테고리: 목록 페이지의 경로 표시 > 하위 메뉴에 나온 페이지 > 처음 발견한 페이지 순으로 판단 (홈에서 발견하면 최상위)
+    반환값: [{"id", "name", "parent", "product_count"}, ...] (발견 순서)
+    """
+    cache = cache or HttpCache()
+    soup = BeautifulSoup(cache.get(session, SITE_URL), "html.parser")
+    nodes = {}
+    queue = deque()
+    for cate_no, name in category_links(soup).items():
+        nodes[cate_no] = {"id": cate_no, "name": name, "parent": None, "product_count": None}
+        queue.append((cate_no, 1))
+
+    visited = 0
+    while queue and visited < max_pages:
+        cate_no, depth = queue.popleft()
+        visited += 1
+        try:
+            soup = BeautifulSoup(cache.get(session, category_url(cate_no)), "html.parser")
+        except Exception as e:
+            print(f"[-] 카테고리 {cate_no} 페이지 요청 실패: {e}")
+            continue
+        node = nodes[cate_no]
+        node["product_count"] = product_count(soup)
+
+        path = breadcrumb_path(soup)
+        if cate_no in path and path.index(cate_no) > 0:
+            node["parent"] = path[path.index(cate_no) - 1]
+
+        submenu = submenu_links(soup)
+        children = submenu if submenu is not None else category_links(soup)
+        for child_no, name in children.items():
+            if child_no == cate_no:
+                continue
+            if child_no not in nodes:
+                nodes[child_no] = {"id": child_no, "name": name, "parent": cate_no, "product_count": None}
+                if depth < max_depth:
+                    queue.append((child_no, depth + 1))
+            elif submenu is not None and nodes[child_no]["parent"] is None and child_no not in path:
+                # 홈 메뉴(드롭다운)에서 먼저 발견된 하위 카테고리 -> 하위 메뉴에 나온 페이지를 상위로
+                nodes[child_no]["parent"] = cate_no
+
+    if queue:
+        print(f"[경고] 카테고리 페이지 {max_pages}개까지만 탐색했습니다. (남은 {len(queue)}개)")
+    print(f"[*] HTTP 캐시: 그대로 사용 {cache.stats['fresh']} / 재검증(304) {cache.stats['revalidated']} / 새로 받음 {cache.stats['fetched']}")
+    return list(nodes.values())
+
+def load_category_tree(path=CATEGORY_TREE_PATH):
+    """저장된 카테고리 트리 파일을 읽습니다. (없거나 깨졌으면 None)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[-] 카테고리 트리 파일 읽기 실패: {e}")
+        return None
+
+def save_category_tree(categories, targets, path=CATEGORY_TREE_PATH):
+    """
+    카테고리 트리와 수집 대상(이름 -> cate_no)을 저장합니다.
+    수집 대상 중 새 트리에 없는 번호는 경고 (픽스콘이 메뉴를 개편한 경우 직접 확인 필요)
+    """
+    ids = {c["id"] for c in categories}
+    for name, cate_no in targets.items():
+        if cate_no not in ids:
+            print(f"[경고] 수집 대상 {name}({cate_no})이(가) 새 카테고리 트리에 없습니다.")
+    data = {
+        "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "targets": targets,
+        "categories": categories,
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+def load_target_categories(default, path=CATEGORY_TREE_PATH):
+    """수집 대상(이름 -> cate_no)을 카테고리 트리 파일에서 읽습니다. (파일이 없으면 default)"""
+    tree = load_category_tree(path)
+    if not tree or not tree.get("targets"):
+        return dict(default)
+    return {name: str(cate_no) for name, cate_no in tree["targets"].items()}
+
+def format_tree(categories):
+    """트리를 들여쓰기 문자열로 (예: [27] 악세사리 (120개) / 하위는 두 칸 들여쓰기)"""
+    children = {}
+    for c in categories:
+        children.setdefault(c["parent"], []).append(c)
+    ids = {c["id"] for c in categories}
+    lines = []
+
+    def walk(parent, depth, seen):
+        for c in children.get(parent, []):
+            if c["id"] in seen:
+                continue
+            count = f" ({c['product_count']}개)" if c["product_count"] is not None else ""
+            lines.append(f"{'  ' * depth}[{c['id']}] {c['name']}{count}")
+            walk(c["id"], depth + 1, seen | {c["id"]})
+
+    walk(None, 0, frozenset())
+    # 상위 카테고리가 트리 밖에 있는 항목 (경로 표시에만 나온 상위 등)
+    for parent in children:
+        if parent is not None and parent not in ids:
+            walk(parent, 0, frozenset())
+    return "\n".join(lines)
@@ -0,0 +1,182 @@
+import hashlib
+import json
+import os
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+# [설정] 모델/부품 분류 규칙 (앱의 부품 검색 탭에서 사용)
+BASE_DIR = os.path.dirname(__file__)
+CLASSIFY_CACHE_PATH = os.path.join(BASE_DIR, ".classify_cache.json") # (카테고리, 상품명) -> (모델, 부품)
+
+# 순서 중요: 긴 이름부터 매칭해야 함 (예: 17 Pro Max -> 17 Pro보다 먼저)
+MODEL_MAPPING = [
+    ("17Pro-Max", "iPhone 17 Pro Max"), ("17Pro", "iPhone 17 Pro"), ("17AIR", "iPhone 17 Air"), ("17", "iPhone 17"),
+    ("16Pro-Max", "iPhone 16 Pro Max"), ("16Pro", "iPhone 16 Pro"), ("16+", "iPhone 16 Plus"), ("16E", "iPhone 16E"), ("16", "iPhone 16"),
+    ("15Pro-Max", "iPhone 15 Pro Max"), ("15Pro", "iPhone 15 Pro"), ("15+", "iPhone 15 Plus"), ("15", "iPhone 15"),
+    ("14Pro-Max", "iPhone 14 Pro Max"), ("14Pro", "iPhone 14 Pro"), ("14+", "iPhone 14 Plus"), ("14", "iPhone 14"),
+    ("13Pro-Max", "iPhone 13 Pro Max"), ("13Pro", "iPhone 13 Pro"), ("13Mini", "iPhone 13 Mini"), ("13", "iPhone 13"),
+    ("12Pro-Max", "iPhone 12 Pro Max"), ("12Pro", "iPhone 12 Pro"), ("12Mini", "iPhone 12 Mini"), ("12", "iPhone 12"),
+    ("11Pro-Max", "iPhone 11 Pro Max"), ("11Pro", "iPhone 11 Pro"), ("11", "iPhone 11"),
+    ("XSMax", "iPhone XS Max"), ("XS Max", "iPhone XS Max"), ("XS-Max", "iPhone XS Max"), ("XS", "iPhone XS"), ("XR", "iPhone XR"), ("X", "iPhone X"),
+    ("SE", "iPhone SE"), ("8+", "iPhone 8 Plus"), ("8", "iPhone 8"),
+    ("7+", "iPhone 7 Plus"), ("7", "iPhone 7"), ("6S+", "iPhone 6S Plus"), ("6S", "iPhone 6S"), ("6+", "iPhone 6 Plus"), ("6", "iPhone 6")
+]
+ACCESSORY_MODEL = "악세사리"
+UNKNOWN_MODEL = "기타"
+
+# [New] 악세사리 부품 상세 분류 (위에서부터 먼저 맞는 규칙 적용)
+ACCESSORY_PART_RULES = [
+    (["필름", "카메라링", "카메라 링", "강화유리", "카메라 렌즈 보호링"], "필름"),
+    (["케이스"], "케이스"),
+    (["케이블", "어댑터", "어덥터", "충전기", "젠더"], "충전기"),
+]
+
+# [User Request] 제외 필터 (하우징, 일반형 등) -> 부품 None (목록에서 제외)
+EXCLUDED_KEYWORDS = ["하우징", "(베젤형)", "(일반형)", "(고급형)", "13Pro 골드"]
+
+# [User Request] iPhone 7+, 8+ 액정 예외 처리 ((정), (재), (카))
+PLUS_LCD_MODELS = ["iPhone 7 Plus", "iPhone 8 Plus"]
+PLUS_LCD_KEYWORDS = ["(정)", "(재)", "(카)"]
+
+# 명시적 카테고리 (케이블은 기타로 통합되므로 제거)
+PART_RULES = [
+    (["액정"], "액정"),
+    (["배터리"], "배터리"),
+    (["카메라"], "카메라"),
+    (["유리"], "후면유리"),
+    (["보드"], "메인보드"),
+]
+UNKNOWN_PART = "기타"
+
+def _keyword_regex(keywords):
+    return "|".join(re.escape(k) for k in keywords)
+
+# 모델 패턴 전체를 하나의 정규식으로 컴파일
+# 모든 위치에서 lookahead로 매칭 -> 각 위치에서는 목록 순서상 가장 앞선 패턴이 잡히므로,
+# 그 중 최소 순번이 곧 "목록 순서대로 처음 포함되는 패턴" (기존 순차 검사와 동일한 우선순위)
+_MODEL_PATTERNS = [p.lower() for p, _ in MODEL_MAPPING]
+_MODEL_RANK = {}
+for _rank, _pattern in enumerate(_MODEL_PATTERNS):
+    _MODEL_RANK.setdefault(_pattern, _rank)
+_MODEL_RE = re.compile(f"(?=({_keyword_regex(_MODEL_PATTERNS)}))")
+_MODEL_NAMES = np.array([display for _, display in MODEL_MAPPING] + [UNKNOWN_MODEL], dtype=object)
+
+def is_accessory_category(categories):
+    return categories.astype(str).str.startswith("Acc_")
+
+def classify_models(names, categories):
+    """
+    상품명/카테고리 Series로 모델명을 분류합니다. (행 단위 apply 없이 정규식 1회 + 벡터 연산)
+    Acc_ 카테고리 -> 악세사리, 매칭 패턴 없음 -> 기타
+    """
+    names = names.astype(str).str.lower()
+    matches = names.str.findall(_MODEL_RE).explode()
+    ranks = matches.map(_MODEL_RANK).groupby(level=0).min()
+    ranks = ranks.reindex(names.index).fillna(len(MODEL_MAPPING)).astype(int)
+
+    models = pd.Series(_MODEL_NAMES[ranks.to_numpy()], index=names.index)
+    return models.mask(is_accessory_category(categories), ACCESSORY_MODEL)
+
+def classify_parts(names, categories, models):
+    """
+    상품명/카테고리/모델 Series로 부품을 분류합니다. 제외 대상은 None.
+    규칙은 기존 순차 if 문과 같은 순서로 np.select에 넘겨 첫 번째로 맞는 규칙을 적용
+    """
+    names = names.astype(str)
+    categories = categories.astype(str)
+
+    def contains(keywords):
+        return names.str.contains(_keyword_regex(keywords), regex=True).to_numpy()
+
+    accessory = (is_accessory_category(categories) | categories.str.contains("악세", regex=False)
+                 | (models == ACCESSORY_MODEL)).to_numpy()
+
+    conditions, choices = [], []
+    for keywords, part in ACCESSORY_PART_RULES:
+        conditions.append(accessory & contains(keywords))
+        choices.append(part)
+    conditions.append(accessory)
+    choices.append(UNKNOWN_PART)
+
+    conditions.append(contains(EXCLUDED_KEYWORDS))
+    choices.append(None)
+
+    conditions.append(models.isin(PLUS_LCD_MODELS).to_numpy() & contains(PLUS_LCD_KEYWORDS))
+    choices.append("액정")
+
+    for keywords, part in PART_RULES:
+        conditions.append(contains(keywords))
+        choices.append(part)
+
+    parts = np.select(conditions, np.array(choices, dtype=object), default=UNKNOWN_PART)
+    return pd.Series(parts, index=names.index, dtype=object)
+
+# 규칙 테이블 버전 (규칙이 바뀌면 해시가 달라져 분류 캐시가 자동으로 무효화됨)
+RULES_VERSION = hashlib.sha1(json.dumps([
+    MODEL_MAPPING, ACCESSORY_PART_RULES, EXCLUDED_KEYWORDS,
+    PLUS_LCD_MODELS, PLUS_LCD_KEYWORDS, PART_RULES,
+], ensure_ascii=False).encode("utf-8")).hexdigest()
+
+class ClassificationCache:
+    """
+    상품명별 분류 결과를 파일에 보관합니다. (매일 같은 상품명 수백 개가 반복되므로 처음 본 이름만 분류)
+    키는 (카테고리, 상품명): 악세사리 여부가 카테고리에 따라 달라지기 때문
+    """
+    def __init__(self, path=CLASSIFY_CACHE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == RULES_VERSION:
+                    self.entries = data.get("entries", {})
+            except Exception as e:
+                print(f"[-] 분류 캐시 파일 읽기 실패 (전체 재분류): {e}")
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": RULES_VERSION, "entries": self.entries}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def classify(self, names, categories):
+        """
+        (모델 Series, 부품 Series)를 반환합니다.
+        고유 (카테고리, 상품명)만 추려 캐시에 없는 것만 분류한 뒤, factorize 코드로 전체 행에 다시 펼칩니다.
+        """
+        keys = categories.astype(str) + "\t" + names.astype(str)
+        codes, uniques = pd.factorize(keys)
+
+        with self.lock:
+            missing = [k for k in uniques if k not in self.entries]
+            if missing:
+                split = pd.Series(missing).str.split("\t", n=1, expand=True)
+                new_models = classify_models(split[1], split[0])
+                new_parts = classify_parts(split[1], split[0], new_models)
+                self.entries.update(zip(missing, zip(new_models, new_parts)))
+                try:
+                    self.save()
+                except Exception as e:
+                    print(f"[-] 분류 캐시 저장 실패: {e}")
+            table = [self.entries[k] for k in uniques]
+
+        models = np.array([m for m, _ in table], dtype=object)
+        parts = np.array([p for _, p in table], dtype=object)
+        return (pd.Series(models[codes], index=names.index),
+                pd.Series(parts[codes], index=names.index))
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_classification_cache():
+    """프로세스당 하나의 분류 캐시를 공유합니다. (Streamlit 세션 간 공유)"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ClassificationCache()
+        return _default_cache
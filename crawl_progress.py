@@ -0,0 +1,67 @@
+import threading
+import time
+
+class CrawlProgress:
+    """
+    수집 진행 상황을 모으고 구조화된 이벤트로 알립니다. (threads/async 엔진 공용, 스레드 안전)
+    - listener(event): 페이지/카테고리가 끝날 때마다 호출 (앱 진행 표시 등)
+    - on_category(cat_name, products): 카테고리 하나가 끝나면 바로 호출 (저장소에 카테고리 단위로 먼저 기록)
+    이벤트 예: {"type": "page", "category": "iPhone", "page": 3, "items": 120, "done": 1, "total": 5, "eta": 42.0}
+    """
+    def __init__(self, categories, listener=None, on_category=None):
+        self.lock = threading.Lock()
+        self.listener = listener
+        self.on_category = on_category
+        self.started_at = time.monotonic()
+        self.total = len(categories)
+        self.items = {cat_name: 0 for cat_name in categories}
+        self.pages = {cat_name: 0 for cat_name in categories}
+        self.finished = []
+
+    def _eta(self):
+        """끝난 카테고리 평균 소요 시간으로 남은 시간(초)을 추정 (아직 끝난 카테고리가 없으면 None)"""
+        if not self.finished:
+            return None
+        elapsed = time.monotonic() - self.started_at
+        return elapsed / len(self.finished) * (self.total - len(self.finished))
+
+    def _event(self, event_type, cat_name, **extra):
+        event = {
+            "type": event_type,
+            "category": cat_name,
+            "items": sum(self.items.values()),
+            "done": len(self.finished),
+            "total": self.total,
+            "eta": self._eta(),
+        }
+        event.update(extra)
+        return event
+
+    def _emit(self, event):
+        if self.listener is None:
+            return
+        try:
+            self.listener(event)
+        except Exception as e:
+            print(f"[-] 진행 이벤트 처리 실패: {e}")
+
+    def page_done(self, cat_name, page, item_count):
+        with self.lock:
+            self.pages[cat_name] = max(self.pages.get(cat_name, 0), page)
+            self.items[cat_name] = self.items.get(cat_name, 0) + item_count
+            event = self._event("page", cat_name, page=page)
+        self._emit(event)
+
+    def category_done(self, cat_name, products):
+        with self.lock:
+            if cat_name in self.finished:
+                return
+            self.finished.append(cat_name)
+            self.items[cat_name] = len(products)
+            event = self._event("category", cat_name, page=self.pages.get(cat_name, 0))
+        if self.on_category is not None:
+            try:
+                self.on_category(cat_name, products)
+            except Exception as e:
+                print(f"[-] {cat_name} 카테고리 저장 실패: {e}")
+        self._emit(event)
@@ -0,0 +1,181 @@
+import datetime
+import json
+import os
+import random
+import time
+
+# [설정] 수집 상태 파일 (스케줄러/앱 수집이 기록, 앱은 전체 데이터 대신 이 파일로 최신 여부 판단)
+BASE_DIR = os.path.dirname(__file__)
+CRAWL_STATUS_PATH = os.path.join(BASE_DIR, ".crawl_status.json")
+KST = datetime.timezone(datetime.timedelta(hours=9))
+STATUS_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 스케줄러 동작 설정
+SCHEDULER_TICK = 60 # 대기 중 상태 파일(하트비트) 갱신 주기(초)
+SCHEDULER_RETRY_DELAY = 10 * 60 # 수집 실패 시 같은 회차를 다시 시도하기까지 대기(초)
+SCHEDULER_BUSY_MAX_AGE = 60 * 60 # 지연 대기/수집 중에는 하트비트가 멈추므로 더 길게 허용
+
+def parse_status_time(value):
+    if not value:
+        return None
+    return datetime.datetime.strptime(value, STATUS_TIME_FORMAT).replace(tzinfo=KST)
+
+def format_status_time(value):
+    return value.astimezone(KST).strftime(STATUS_TIME_FORMAT)
+
+def read_status(path=CRAWL_STATUS_PATH):
+    """상태 파일을 읽습니다. (없거나 깨졌으면 빈 dict)"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[-] 수집 상태 파일 읽기 실패: {e}")
+        return {}
+
+def write_status(status, path=CRAWL_STATUS_PATH):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(status, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+def record_crawl(result, categories, path=CRAWL_STATUS_PATH):
+    """
+    수집 1회 결과를 상태 파일에 반영합니다. (CLI/앱/스케줄러 공통, run_crawl 끝에서 호출)
+    카테고리별 마지막 시도/성공 시각과 전체 마지막 성공 시각을 남김
+    """
+    status = read_status(path)
+    per_category = status.setdefault("categories", {})
+    for cat_name in categories:
+        entry = per_category.setdefault(cat_name, {})
+        entry["last_attempt"] = result.timestamp
+        if result.success and cat_name in result.categories:
+            entry["last_success"] = result.timestamp
+    if result.success:
+        status["last_success"] = result.timestamp
+        status["last_products"] = len(result.products)
+    status["last_attempt"] = result.timestamp
+    write_status(status, path)
+
+class DailySchedule:
+    """
+    하루 중 정해진 시각(KST, "HH:MM")마다 실행하는 스케줄
+    (cron의 '분 시 * * *'에 해당, 카테고리마다 다른 시각 목록을 둘 수 있음)
+    """
+    def __init__(self, times):
+        self.times = sorted(datetime.time(*map(int, t.split(":"))) for t in times)
+
+    def previous_fire(self, now):
+        """now 이전(포함) 가장 최근 실행 예정 시각"""
+        for days_back in range(2):
+            day = (now - datetime.timedelta(days=days_back)).date()
+            fires = [datetime.datetime.combine(day, t, tzinfo=KST) for t in self.times]
+            past = [f for f in fires if f <= now]
+            if past:
+                return past[-1]
+        return None
+
+    def next_fire(self, now):
+        """now 이후 가장 가까운 실행 예정 시각"""
+        for days_ahead in range(2):
+            day = (now + datetime.timedelta(days=days_ahead)).date()
+            for t in self.times:
+                fire = datetime.datetime.combine(day, t, tzinfo=KST)
+                if fire > now:
+                    return fire
+        return None
+
+def build_schedules(categories, spec):
+    """spec: {카테고리명 또는 "*": ["HH:MM", ...]} -> {카테고리명: DailySchedule}"""
+    default = spec.get("*", [])
+    return {cat_name: DailySchedule(spec.get(cat_name, default)) for cat_name in categories if spec.get(cat_name, default)}
+
+def due_categories(schedules, status, now, retry_delay=SCHEDULER_RETRY_DELAY):
+    """
+    지금 수집해야 하는 카테고리 목록
+    - 가장 최근 예정 시각 이후에 성공한 적이 없으면 대상 (꺼져 있던 동안 놓친 회차도 한 번 따라잡음)
+    - 단, 최근에 시도했다가 실패했으면 retry_delay가 지날 때까지 대기
+    """
+    per_category = status.get("categories", {})
+    due = []
+    for cat_name, schedule in schedules.items():
+        fire = schedule.previous_fire(now)
+        if fire is None:
+            continue
+        entry = per_category.get(cat_name, {})
+        last_success = parse_status_time(entry.get("last_success"))
+        if last_success is not None and last_success >= fire:
+            continue
+        last_attempt = parse_status_time(entry.get("last_attempt"))
+        if last_attempt is not None and last_attempt >= fire and (now - last_attempt).total_seconds() < retry_delay:
+            continue
+        due.append(cat_name)
+    return due
+
+class SystemClock:
+    """스케줄러가 쓰는 시계 (테스트에서는 now/sleep을 가진 가짜 시계를 주입)"""
+    def now(self):
+        return datetime.datetime.now(KST)
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+def update_heartbeat(next_run, path=CRAWL_STATUS_PATH, state="idle", now=None):
+    status = read_status(path)
+    status["scheduler"] = {
+        "pid": os.getpid(),
+        "heartbeat": format_status_time(now or datetime.datetime.now(KST)),
+        "next_run": format_status_time(next_run) if next_run else None,
+        "state": state,
+    }
+    write_status(status, path)
+
+def scheduler_alive(status, now=None, max_age=SCHEDULER_TICK * 3):
+    """상태 파일의 하트비트로 스케줄러 데몬이 살아 있는지 판단"""
+    scheduler = status.get("scheduler", {})
+    heartbeat = parse_status_time(scheduler.get("heartbeat"))
+    if heartbeat is None:
+        return False
+    if scheduler.get("state") in ("waiting", "running"):
+        max_age = max(max_age, SCHEDULER_BUSY_MAX_AGE)
+    now = now or datetime.datetime.now(KST)
+    return (now - heartbeat).total_seconds() <= max_age
+
+def run_scheduler(crawl, categories, spec, jitter=0, path=CRAWL_STATUS_PATH, clock=None, rng=random):
+    """
+    상주하면서 스케줄에 맞춰 수집합니다. (Ctrl+C로 종료)
+    crawl(카테고리 dict): 해당 카테고리만 수집/저장하는 함수 (run_crawl 감싼 것)
+    jitter: 예정 시각마다 0~jitter초 무작위 지연 (매일 같은 초에 요청이 몰리지 않도록)
+    clock/rng: 현재 시각/대기와 지연 난수 (기본은 실제 시계와 random 모듈)
+    """
+    clock = clock or SystemClock()
+    schedules = build_schedules(categories, spec)
+    if not schedules:
+        print("[Fatal] 스케줄이 설정된 카테고리가 없습니다.")
+        return
+    print(f"[*] 스케줄러 시작: {len(schedules)}개 카테고리")
+
+    while True:
+        now = clock.now()
+        due = due_categories(schedules, read_status(path), now)
+        if due:
+            delay = rng.uniform(0, jitter) if jitter else 0
+            print(f"[*] 수집 예정: {', '.join(due)} ({int(delay)}초 후)")
+            update_heartbeat(now + datetime.timedelta(seconds=delay), path, state="waiting", now=now)
+            clock.sleep(delay)
+            update_heartbeat(None, path, state="running", now=clock.now())
+            try:
+                crawl({cat_name: categories[cat_name] for cat_name in due})
+            except Exception as e:
+                print(f"[-] 예약 수집 실패: {e}")
+                # 실패한 회차는 retry_delay 뒤에 다시 시도하도록 시도 시각만 기록
+                status = read_status(path)
+                for cat_name in due:
+                    status.setdefault("categories", {}).setdefault(cat_name, {})["last_attempt"] = format_status_time(now)
+                write_status(status, path)
+            continue
+
+        next_run = min(s.next_fire(now) for s in schedules.values())
+        update_heartbeat(next_run, path, now=now)
+        clock.sleep(max(1, min(SCHEDULER_TICK, (next_run - now).total_seconds())))
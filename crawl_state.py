@@ -0,0 +1,84 @@
+import hashlib
+import json
+import os
+import threading
+
+# [설정] 증분 수집 상태 파일 ((cate_no, page)별 ETag/Last-Modified/본문 해시 + 파싱 결과)
+BASE_DIR = os.path.dirname(__file__)
+CRAWL_STATE_PATH = os.path.join(BASE_DIR, ".crawl_state.json")
+
+class CrawlState:
+    """
+    목록 페이지별 조건부 요청 정보와 이전 파싱 결과를 보관합니다.
+    - 304 Not Modified 응답 -> 이전 상품 목록 재사용
+    - 200 응답이지만 본문 해시가 같음 -> 파싱 생략 후 재사용
+    (requests/httpx 응답 모두 status_code/headers/content만 사용)
+    """
+    def __init__(self, path=CRAWL_STATE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.pages = {}
+        self.stats = {"not_modified": 0, "hash_hit": 0, "parsed": 0}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.pages = json.load(f)
+            except Exception as e:
+                print(f"[-] 증분 수집 상태 파일 읽기 실패 (전체 수집): {e}")
+
+    @staticmethod
+    def _key(cat_id, page):
+        return f"{cat_id}:{page}"
+
+    def request_headers(self, cat_id, page):
+        with self.lock:
+            entry = self.pages.get(self._key(cat_id, page))
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def resolve(self, cat_name, cat_id, page, res):
+        """변경되지 않은 페이지면 이전 (li 개수, 상품 리스트, 마지막 페이지)를, 아니면 None을 반환"""
+        with self.lock:
+            entry = self.pages.get(self._key(cat_id, page))
+            if not entry:
+                return None
+            if res.status_code == 304:
+                self.stats["not_modified"] += 1
+            elif hashlib.sha1(res.content).hexdigest() == entry.get("hash"):
+                self.stats["hash_hit"] += 1
+                # 본문은 같지만 새 검증자가 왔을 수 있으므로 갱신
+                entry["etag"] = res.headers.get("ETag") or entry.get("etag")
+                entry["last_modified"] = res.headers.get("Last-Modified") or entry.get("last_modified")
+            else:
+                return None
+            products = [dict(p, category=cat_name) for p in entry["products"]]
+            return entry["item_count"], products, entry.get("last_page")
+
+    def update(self, cat_id, page, res, item_count, products, last_page=None):
+        with self.lock:
+            self.stats["parsed"] += 1
+            self.pages[self._key(cat_id, page)] = {
+                "etag": res.headers.get("ETag"),
+                "last_modified": res.headers.get("Last-Modified"),
+                "hash": hashlib.sha1(res.content).hexdigest(),
+                "item_count": item_count,
+                "products": products,
+                "last_page": last_page,
+            }
+
+    def save(self):
+        with self.lock:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.pages, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+    def summary(self):
+        s = self.stats
+        cached = s["not_modified"] + s["hash_hit"]
+        return f"캐시 재사용 {cached}페이지 (304: {s['not_modified']}, 해시 일치: {s['hash_hit']}) / 새로 파싱 {s['parsed']}페이지"
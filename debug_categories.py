@@ -1,6 +1,5 @@
 
 import requests
-from bs4 import BeautifulSoup
 import sys
 import os
 import re
@@ -8,7 +7,8 @@ import re
 # 현재 디렉토리를 경로에 추가하여 import 가능하게 함
 sys.path.append(os.getcwd())
 
-from scraper_main import login_fixcon
+from scraper_main import ensure_login
+from category_discovery import discover_categories, format_tree
 
 # 인코딩 설정
 sys.stdout.reconfigure(encoding='utf-8')
@@ -44,41 +44,20 @@ def main():
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     })
 
-    if login_fixcon(session, user_id, user_pw):
+    if ensure_login(session, user_id, user_pw):
         print("[+] Login Success. Fetching categories...")
-        
-        # 1. 메인 페이지
-        res = session.get("https://fixcon.co.kr/")
-        soup = BeautifulSoup(res.text, "html.parser")
-        
-        print("\n--- Main Categories ---")
-        seen = set()
-        for a in soup.find_all("a", href=True):
-             if "cate_no=" in a['href']:
-                try:
-                    cate_no = a['href'].split("cate_no=")[1].split("&")[0]
-                    name = a.text.strip()
-                    if name and cate_no not in seen:
-                        seen.add(cate_no)
-                        print(f"[{cate_no}] {name}")
-                except:
-                    pass
+        # [Optimization] 카테고리 탐색 모듈 사용 (HTTP 캐시로 반복 실행 시 요청 거의 없음)
+        categories = discover_categories(session)
+
+        # 1. 전체 트리
+        print("\n--- Category Tree ---")
+        print(format_tree(categories))
 
         # 2. 악세사리 (27) 하위
         print("\n--- Sub Categories (Accesories: 27) ---")
-        res = session.get("https://fixcon.co.kr/product/list.html?cate_no=27")
-        soup = BeautifulSoup(res.text, "html.parser")
-        
-        for a in soup.find_all("a", href=True):
-             if "cate_no=" in a['href']:
-                try:
-                    cate_no = a['href'].split("cate_no=")[1].split("&")[0]
-                    name = a.text.strip()
-                    # 27이 아닌 다른 카테고리만 출력 (하위 카테고리일 가능성)
-                    if name and cate_no != "27": 
-                        print(f"[{cate_no}] {name}")
-                except:
-                    pass
+        for c in categories:
+            if c["parent"] == "27":
+                print(f"[{c['id']}] {c['name']}")
 
 if __name__ == "__main__":
     main()
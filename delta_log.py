@@ -0,0 +1,137 @@
+import json
+import os
+
+# [설정] 변경분 기록 모드
+# - sheet1: 신규/가격·상태 변경/목록 제외된 상품만 추가 (변경 로그)
+# - runs 시트: 수집할 때마다 1행 (하트비트) -> 변경이 없어도 "그 시점에 여전히 판매 중"임을 표시
+BASE_DIR = os.path.dirname(__file__)
+SHEET_STATE_PATH = os.path.join(BASE_DIR, ".sheet_state.json")
+RUNS_SHEET_NAME = "runs"
+RUNS_HEADER = ["수집일시", "상품수", "변경수", "모드"]
+REMOVED_STATUS = "미노출" # 이전 수집에는 있었지만 이번 수집 목록에서 사라진 상품
+
+def record_key(record):
+    """시트 행(한글 헤더 dict)의 상품 키: URL 우선, 없으면 상품명"""
+    return record.get("URL") or record.get("상품명")
+
+def product_key(product):
+    """크롤링 결과(dict)의 상품 키: URL 우선, 없으면 상품명"""
+    return product.get("url") or product.get("name")
+
+def product_to_record(product, timestamp):
+    return {
+        "수집일시": timestamp,
+        "카테고리": product["category"],
+        "상품명": product["name"],
+        "가격": product["price"],
+        "상태": product["status"],
+        "URL": product["url"],
+        "이미지": product.get("img_url", ""),
+    }
+
+def diff_products(prev_state, products, timestamp, crawled_categories):
+    """
+    이전 상태(상품 키 -> 시트 행)와 이번 수집 결과를 비교합니다.
+    반환값: (추가할 시트 행 리스트, 새 상태)
+    crawled_categories: 이번에 수집한 카테고리 (여기 속한 상품만 '목록 제외' 판단)
+    [Fix] 수집은 했지만 상품이 0개인 카테고리는 차단/빈 페이지일 수 있으므로 제외 판단하지 않음
+    """
+    changes = []
+    new_state = {}
+    # 이번 회차에 상품이 1개 이상 나온 카테고리만 '목록 제외' 판단 대상
+    removable_categories = set(crawled_categories) & {p["category"] for p in products}
+
+    for p in products:
+        key = product_key(p)
+        if key in new_state:
+            continue # 같은 상품이 여러 페이지에 노출된 경우 첫 번째만 사용
+        record = product_to_record(p, timestamp)
+        prev = prev_state.get(key)
+        if (prev is None or prev.get("상태") == REMOVED_STATUS
+                or str(prev.get("가격")) != str(record["가격"])
+                or prev.get("상태") != record["상태"]
+                or prev.get("상품명") != record["상품명"]):
+            changes.append(record)
+        new_state[key] = record
+
+    for key, prev in prev_state.items():
+        if key in new_state:
+            continue
+        if prev.get("카테고리") in removable_categories and prev.get("상태") != REMOVED_STATUS:
+            removed = dict(prev, **{"수집일시": timestamp, "상태": REMOVED_STATUS})
+            changes.append(removed)
+        else:
+            # 이번에 수집하지 않았거나 상품이 0개인 카테고리(또는 이미 제외된 상품)는 상태 유지
+            new_state[key] = prev
+
+    return changes, new_state
+
+def _run_schedule(records, runs):
+    """
+    (수집일시, 모드) 목록을 시간순으로 반환합니다.
+    runs 시트 이전에 쌓인 행(전체 스냅샷 방식)의 수집일시는 snapshot 모드로 취급합니다.
+    """
+    run_modes = {str(r["수집일시"]): r.get("모드") or "delta" for r in runs}
+    first_run = min(run_modes) if run_modes else None
+    for r in records:
+        ts = str(r["수집일시"])
+        if ts not in run_modes and (first_run is None or ts < first_run):
+            run_modes[ts] = "snapshot"
+    return sorted(run_modes.items())
+
+def _replay(records, runs):
+    """회차 순서대로 변경 로그를 적용하며 (수집일시, 그 시점의 상품 상태)를 내보냅니다."""
+    by_ts = {}
+    for r in records:
+        by_ts.setdefault(str(r["수집일시"]), []).append(r)
+
+    current = {}
+    for ts, mode in _run_schedule(records, runs):
+        if mode == "snapshot":
+            current = {}
+        for r in by_ts.get(ts, []):
+            current[record_key(r)] = r
+        yield ts, current
+
+def expand_change_log(records, runs):
+    """
+    변경 로그(sheet1 행)와 runs 하트비트로 수집 회차별 전체 스냅샷을 복원합니다.
+    반환값: 기존 전체 스냅샷 방식과 같은 형태의 행 리스트 (회차마다 판매 중인 모든 상품)
+    """
+    expanded = []
+    for ts, current in _replay(records, runs):
+        for r in current.values():
+            if r.get("상태") == REMOVED_STATUS:
+                continue
+            expanded.append(dict(r, **{"수집일시": ts}))
+    return expanded
+
+def latest_state(records, runs):
+    """변경 로그에서 마지막 회차 기준 상품 상태(상품 키 -> 시트 행)를 복원합니다."""
+    current = {}
+    for _, current in _replay(records, runs):
+        pass
+    return dict(current)
+
+def load_state(last_run, path=SHEET_STATE_PATH):
+    """
+    로컬에 저장된 마지막 상품 상태를 읽습니다.
+    시트의 마지막 회차(last_run)와 다르면 (다른 환경에서 수집한 경우 등) None -> 시트에서 복원
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"[-] 시트 상태 파일 읽기 실패: {e}")
+        return None
+    if data.get("last_run") != last_run:
+        return None
+    return data.get("products", {})
+
+def save_state(state, last_run, path=SHEET_STATE_PATH):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"last_run": last_run, "products": state}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
@@ -1,10 +1,10 @@
-
 import requests
-from bs4 import BeautifulSoup
-import json
 import os
 import sys
 
+from scraper_main import DEFAULT_TARGET_CATEGORIES, USER_AGENT, ensure_login
+from category_discovery import discover_categories, format_tree, load_category_tree, save_category_tree
+
 # 인코딩 설정
 sys.stdout.reconfigure(encoding='utf-8')
 
@@ -24,81 +24,25 @@ def get_credentials():
         print(f"Error loading secrets: {e}")
         return None, None
 
-def login_fixcon(session, user_id, user_pw):
-    login_url = "https://fixcon.co.kr/member/login.html"
-    print(f"[*] 로그인 시도: {user_id}")
-    res = session.get(login_url)
-    soup = BeautifulSoup(res.text, "html.parser")
-    
-    login_form = soup.find("form", {"id": "member_form_0"})
-    if not login_form:
-        # cafe24 기본 폼 찾기 시도
-        input_el = soup.find("input", {"name": "member_id"})
-        if input_el: login_form = input_el.find_parent("form")
-
-    if not login_form:
-        print("[-] 로그인 폼을 찾을 수 없습니다.")
-        return False
-        
-    action_url = login_form.get("action")
-    if not action_url.startswith("http"):
-        action_url = f"https://fixcon.co.kr{action_url}"
-        
-    login_data = {}
-    for inp in login_form.find_all("input"):
-        if inp.get("name"):
-            login_data[inp.get("name")] = inp.get("value", "")
-            
-    login_data["member_id"] = user_id
-    login_data["member_passwd"] = user_pw
-    login_data["use_login_keeping"] = "F"
-    
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Referer": login_url,
-        "Origin": "https://fixcon.co.kr",
-        "Content-Type": "application/x-www-form-urlencoded"
-    }
-    
-    res = session.post(action_url, data=login_data, headers=headers)
-    
-    # 마이페이지로 확인
-    res = session.get("https://fixcon.co.kr/myshop/index.html")
-    if "modify.html" in res.text or "로그아웃" in res.text:
-        print("[+] 로그인 성공")
-        return True
-    else:
-        print("[-] 로그인 실패")
-        return False
-
 def main():
     user_id, user_pw = get_credentials()
     if not user_id: return
     
     session = requests.Session()
-    if not login_fixcon(session, user_id, user_pw):
+    session.headers.update({"User-Agent": USER_AGENT})
+    # [Optimization] scraper_main과 같은 세션 캐시 사용 (유효하면 재로그인 생략)
+    if not ensure_login(session, user_id, user_pw):
         return
         
-    # 메인 페이지에서 카테고리 추출
+    # [Optimization] 홈/카테고리 페이지는 HTTP 캐시(.http_cache)로 재사용 -> 재탐색 시 요청 거의 없음
     print("[*] 카테고리 찾는 중...")
-    res = session.get("https://fixcon.co.kr")
-    soup = BeautifulSoup(res.text, "html.parser")
-    
-    # 모든 링크 중 cate_no가 있는 것 찾기
-    links = soup.find_all("a", href=True)
-    categories = {}
-    
-    for a in links:
-        href = a['href']
-        if "cate_no=" in href:
-            try:
-                cate_id = href.split("cate_no=")[1].split("&")[0]
-                name = a.text.strip()
-                if name:
-                    categories[cate_id] = name
-                    print(f"I found category: [{cate_id}] {name}")
-            except:
-                pass
+    categories = discover_categories(session)
+    print(format_tree(categories))
+
+    # 기존 수집 대상은 유지하고 트리만 갱신 (scraper_main.TARGET_CATEGORIES가 읽음)
+    tree = load_category_tree() or {}
+    save_category_tree(categories, tree.get("targets") or DEFAULT_TARGET_CATEGORIES)
+    print(f"[+] 카테고리 {len(categories)}개 저장 완료 (categories.json)")
 
 if __name__ == "__main__":
     main()
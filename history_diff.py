@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+
+# [설정] 변동 내역 계산 결과 캐시 ((전날 스냅샷, 당일 스냅샷) 쌍별 변경 문구)
+# 회차 데이터는 저장 후 바뀌지 않으므로, 이미 계산한 날짜 쌍은 다시 비교하지 않음
+BASE_DIR = os.path.dirname(__file__)
+HISTORY_DIFF_CACHE_PATH = os.path.join(BASE_DIR, ".history_diff_cache.json")
+DIFF_FORMAT_VERSION = 4 # 변경 문구/키 형식이 바뀌면 올려서 캐시 무효화
+
+def daily_snapshots(df):
+    """
+    날짜별 스냅샷 구성을 groupby 한 번으로 구합니다.
+    [Fix] (날짜, 카테고리)마다 그 날 가장 마지막 회차 사용 -> 마지막 회차가 일부 카테고리만 수집했어도
+    나머지 카테고리는 그 날의 이전 회차로 채움
+    반환값: 날짜/카테고리/수집일시/행수 DataFrame (최신 날짜가 앞)
+    """
+    sizes = df.groupby([df["수집일시"].dt.date.rename("날짜"), "카테고리", "수집일시"], observed=True).size()
+    runs = sizes.rename("행수").reset_index()
+    runs = runs.sort_values("수집일시", kind="stable").groupby(["날짜", "카테고리"], observed=True).tail(1)
+    return runs.sort_values(["날짜", "카테고리"], ascending=[False, True], kind="stable").reset_index(drop=True)
+
+def diff_snapshots(prev, curr):
+    """
+    두 회차를 상품명 기준 merge 한 번으로 맞춰 가격 증감/상태 변경 문구를 일괄 계산합니다.
+    문구 순서는 당일 회차의 상품 순서 (상품마다 가격 -> 상태)
+    가격 증감은 저장 시 변환된 정수 컬럼(가격_숫자) 사용, 정수가 없으면 가격 문자열 비교
+    """
+    columns = ["상품명", "가격", "가격_숫자", "상태"]
+    prev = prev.drop_duplicates(subset=["상품명"])[columns]
+    merged = curr[columns].merge(prev, on="상품명", how="inner", suffixes=("", "_prev"))
+    if merged.empty:
+        return []
+
+    curr_num = merged["가격_숫자"]
+    prev_num = merged["가격_숫자_prev"]
+    numeric = (curr_num.notna() & prev_num.notna()).to_numpy()
+    delta = (curr_num - prev_num).to_numpy(dtype="float64", na_value=0).astype("int64")
+
+    curr_price = merged["가격"].astype(str).to_numpy()
+    prev_price = merged["가격_prev"].astype(str).to_numpy()
+    price_changed = (numeric & (delta != 0)) | (~numeric & (curr_price != prev_price))
+    status_changed = (merged["상태"].astype(str) != merged["상태_prev"].astype(str)).to_numpy()
+
+    changes = []
+    names = merged["상품명"].to_numpy()
+    curr_status = merged["상태"].astype(str).to_numpy()
+    prev_status = merged["상태_prev"].astype(str).to_numpy()
+    for i in (price_changed | status_changed).nonzero()[0]:
+        name = names[i]
+        if price_changed[i]:
+            if numeric[i]:
+                diff = int(delta[i])
+                icon = "🔻" if diff < 0 else "🔺"
+                color = "blue" if diff < 0 else "red"
+                changes.append(f"{icon} **{name}**: {prev_price[i]} → {curr_price[i]} (:{color}[{diff:,}원])")
+            else:
+                changes.append(f"🔄 **{name}**: {prev_price[i]} → {curr_price[i]}")
+        if status_changed[i]:
+            changes.append(f"📦 **{name}**: {prev_status[i]} → {curr_status[i]}")
+    return changes
+
+class HistoryDiffCache:
+    """(이전 수집일시, 현재 수집일시) 쌍별 변경 문구를 파일에 보관합니다."""
+    def __init__(self, path=HISTORY_DIFF_CACHE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.pairs = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == DIFF_FORMAT_VERSION:
+                    self.pairs = data.get("pairs", {})
+            except Exception as e:
+                print(f"[-] 변동 내역 캐시 파일 읽기 실패 (전체 재계산): {e}")
+
+    @staticmethod
+    def _signature(composition):
+        """스냅샷 구성(카테고리별 수집일시/행 수) 해시 -> 수집 중에 일부 카테고리만 저장된 상태의 결과를 구분"""
+        text = json.dumps(sorted(composition.items()), ensure_ascii=False)
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+    @classmethod
+    def _key(cls, prev_date, prev_composition, curr_date, curr_composition):
+        return f"{prev_date}#{cls._signature(prev_composition)}|{curr_date}#{cls._signature(curr_composition)}"
+
+    @staticmethod
+    def _dates(key):
+        """키에서 구성 해시를 뺀 (이전 날짜, 현재 날짜) 부분"""
+        prev, curr = key.split("|")
+        return prev.split("#")[0], curr.split("#")[0]
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": DIFF_FORMAT_VERSION, "pairs": self.pairs}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def build_history(self, df):
+        """
+        일별 변동 내역을 계산합니다. (오늘 vs 어제, 어제 vs 그제...)
+        하루에 여러 번 수집했더라도, 카테고리마다 그 날의 '가장 마지막(최신)' 회차만 대표로 사용
+        반환값: (날짜 문자열 리스트, 변동 내역 리스트) - 캐시에 없는 날짜 쌍만 새로 비교
+        """
+        if df.empty:
+            return [], []
+        runs = daily_snapshots(df)
+        days = list(dict.fromkeys(runs["날짜"]))
+        dates = [d.strftime("%Y-%m-%d") for d in days]
+        if len(days) < 2:
+            return dates, []
+
+        # 날짜별 구성 (카테고리 -> [수집일시, 행 수]) -> 키에 포함해 구성이 바뀐 스냅샷은 다시 계산
+        compositions = {}
+        for row in runs.itertuples(index=False):
+            compositions.setdefault(row.날짜, {})[str(row.카테고리)] = [f"{row.수집일시:%Y-%m-%d %H:%M:%S}", int(row.행수)]
+
+        history_list = []
+        snapshots = None
+        updated = False
+        with self.lock:
+            for i in range(len(days) - 1):
+                key = self._key(dates[i + 1], compositions[days[i + 1]], dates[i], compositions[days[i]])
+                if key not in self.pairs:
+                    if snapshots is None:
+                        # 필요한 (카테고리, 회차) 행만 한 번에 날짜별로 나눠 두기 (날짜 쌍마다 전체 프레임을 다시 필터링하지 않음)
+                        picked = pd.MultiIndex.from_frame(df[["카테고리", "수집일시"]]).isin(
+                            pd.MultiIndex.from_frame(runs[["카테고리", "수집일시"]]))
+                        rows = df[picked]
+                        snapshots = dict(tuple(rows.groupby(rows["수집일시"].dt.date, sort=False)))
+                    # 같은 날짜 쌍의 이전(구성이 달랐던) 결과는 제거
+                    pair_dates = self._dates(key)
+                    for stale in [k for k in self.pairs if self._dates(k) == pair_dates]:
+                        del self.pairs[stale]
+                    self.pairs[key] = diff_snapshots(snapshots[days[i + 1]], snapshots[days[i]])
+                    updated = True
+                day_changes = self.pairs[key]
+                if day_changes:
+                    history_list.append({
+                        "date": dates[i],
+                        "prev_date": dates[i + 1],
+                        "changes": day_changes,
+                        "expanded": (i == 0) # 첫 번째(최신)만 펼침
+                    })
+            if updated:
+                try:
+                    self.save()
+                except Exception as e:
+                    print(f"[-] 변동 내역 캐시 저장 실패: {e}")
+        return dates, history_list
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_history_diff_cache():
+    """프로세스당 하나의 변동 내역 캐시를 공유합니다. (Streamlit 세션 간 공유)"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = HistoryDiffCache()
+        return _default_cache
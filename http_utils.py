@@ -0,0 +1,205 @@
+import re
+import threading
+from urllib.parse import urlparse
+
+import charset_normalizer
+import requests
+from tenacity import AsyncRetrying, Retrying, retry_if_exception, stop_after_attempt, stop_any, wait_random_exponential
+
+# [설정] httpx는 async 엔진에서만 사용 (없으면 requests 예외만 재시도 대상으로 판단)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# 헤더/메타에 선언된 인코딩의 상위 호환 코덱 (EUC-KR 선언 페이지에 CP949 문자가 섞이는 경우 대비)
+ENCODING_ALIASES = {
+    "euc-kr": "cp949",
+    "euc_kr": "cp949",
+    "ks_c_5601-1987": "cp949",
+}
+
+# <meta charset="..."> / <meta http-equiv="Content-Type" content="...; charset=..."> 모두 매칭
+META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9_\-:.]+)""", re.IGNORECASE)
+META_SCAN_BYTES = 4096
+
+# 호스트별로 한 번만 판별한 인코딩 캐시 (크롤링 동안 유지)
+_host_encodings = {}
+_host_lock = threading.Lock()
+
+def _normalize(encoding):
+    if not encoding:
+        return None
+    encoding = encoding.strip().strip("\"'").lower()
+    return ENCODING_ALIASES.get(encoding, encoding)
+
+def header_charset(headers):
+    content_type = headers.get("Content-Type") or ""
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            return _normalize(value)
+    return None
+
+def meta_charset(content):
+    match = META_CHARSET_RE.search(content[:META_SCAN_BYTES])
+    if match:
+        return _normalize(match.group(1).decode("ascii", errors="ignore"))
+    return None
+
+def _try_decode(content, encoding):
+    try:
+        return content.decode(encoding)
+    except (LookupError, UnicodeDecodeError):
+        return None
+
+def decode_response(res):
+    """
+    응답 본문을 문자열로 디코딩합니다. (requests/httpx 응답 공용)
+    1. Content-Type 헤더 charset -> 2. <meta charset> -> 3. 호스트별 캐시
+    순서로 시도하고, 모두 실패할 때만 본문 전체를 분석(charset-normalizer)합니다.
+    """
+    content = res.content
+    host = urlparse(str(res.url)).netloc
+
+    with _host_lock:
+        cached = _host_encodings.get(host)
+
+    tried = set()
+    for encoding in (header_charset(res.headers), meta_charset(content), cached):
+        if not encoding or encoding in tried:
+            continue
+        tried.add(encoding)
+        text = _try_decode(content, encoding)
+        if text is not None:
+            return text
+
+    # [Fallback] 선언된 인코딩으로 디코딩 실패 -> 본문 분석 후 호스트 캐시에 저장
+    detected = charset_normalizer.detect(content)["encoding"] or "utf-8"
+    with _host_lock:
+        _host_encodings[host] = _normalize(detected)
+    return content.decode(detected, errors="replace")
+
+# [설정] 요청 타임아웃/재시도 (목록 페이지 요청 공용)
+REQUEST_TIMEOUT = (5, 20) # (연결, 읽기) 초 - 응답이 멈춘 요청 하나가 전체 수집을 붙잡지 않도록
+RETRY_ATTEMPTS = 4 # 요청당 최대 시도 횟수 (첫 요청 포함)
+RETRY_BACKOFF = 1.0 # 재시도 대기 기준(초), 시도마다 2배씩 늘어난 범위 안에서 무작위 (여러 워커가 동시에 재시도하지 않도록)
+RETRY_BACKOFF_MAX = 20
+RETRY_STATUS = {429, 500, 502, 503, 504}
+LOGIN_PATH = "member/login" # 로그인이 풀리면 목록 페이지가 이 주소로 리다이렉트됨
+ERROR_BUDGET = 20 # 수집 1회에서 허용하는 실패 요청 수 (초과하면 재시도 없이 남은 요청을 바로 실패 처리)
+
+class RetryableStatus(Exception):
+    """재시도할 HTTP 상태 코드 (5xx, 429)"""
+    def __init__(self, url, status_code):
+        super().__init__(f"HTTP {status_code}: {url}")
+        self.status_code = status_code
+
+class UnexpectedStatus(Exception):
+    """재시도해도 소용없는 HTTP 응답 (404/403 등 2xx/304가 아닌 상태)"""
+    def __init__(self, url, status_code):
+        super().__init__(f"HTTP {status_code}: {url}")
+        self.status_code = status_code
+
+class LoginRedirect(Exception):
+    """목록 페이지 요청이 로그인 페이지로 리다이렉트됨 (세션 만료 -> 빈 목록으로 저장되지 않도록 실패 처리)"""
+    def __init__(self, url, final_url):
+        super().__init__(f"로그인 페이지로 이동됨: {url} -> {final_url}")
+
+class ErrorBudgetExceeded(Exception):
+    """수집 1회의 실패 허용 횟수를 모두 써서 더 이상 요청하지 않음"""
+
+class ErrorBudget:
+    """수집 1회에서 공유하는 실패 요청 허용 횟수 (스레드 안전, 사이트 장애 시 재시도가 계속 쌓이지 않도록)"""
+    def __init__(self, limit=ERROR_BUDGET):
+        self.limit = limit
+        self.failures = 0
+        self.lock = threading.Lock()
+
+    def spend(self):
+        with self.lock:
+            self.failures += 1
+
+    @property
+    def exhausted(self):
+        return self.limit is not None and self.failures >= self.limit
+
+def is_retryable(exc):
+    if isinstance(exc, RetryableStatus):
+        return True
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)):
+        return True
+    return httpx is not None and isinstance(exc, httpx.TransportError)
+
+def _retry_options(budget):
+    def budget_exhausted(retry_state):
+        return budget is not None and budget.exhausted
+
+    def before_sleep(retry_state):
+        print(f"[-] 요청 실패, {retry_state.next_action.sleep:.1f}초 후 재시도 ({retry_state.attempt_number}/{RETRY_ATTEMPTS}): {retry_state.outcome.exception()}")
+
+    return dict(
+        stop=stop_any(stop_after_attempt(RETRY_ATTEMPTS), budget_exhausted),
+        wait=wait_random_exponential(multiplier=RETRY_BACKOFF, max=RETRY_BACKOFF_MAX),
+        retry=retry_if_exception(is_retryable),
+        before_sleep=before_sleep,
+        reraise=True,
+    )
+
+def _check(res, url, check_login=False):
+    """
+    [Fix] 5xx/429는 재시도, 그 밖의 2xx/304가 아닌 응답도 예외 (빈 목록으로 저장되지 않고 실패 카테고리로 남도록)
+    check_login: 목록 페이지 요청이면 로그인 페이지로 리다이렉트된 응답도 실패 처리 (리다이렉트 후 최종 주소로 판단)
+    """
+    if res.status_code in RETRY_STATUS:
+        raise RetryableStatus(url, res.status_code)
+    if not (200 <= res.status_code < 300 or res.status_code == 304):
+        raise UnexpectedStatus(url, res.status_code)
+    if check_login and LOGIN_PATH in str(res.url):
+        raise LoginRedirect(url, res.url)
+    return res
+
+def _attempt(send, url, budget, check_login):
+    if budget is not None and budget.exhausted:
+        raise ErrorBudgetExceeded(f"실패 허용 횟수({budget.limit}회) 초과: {url}")
+    try:
+        return _check(send(), url, check_login)
+    except Exception as e:
+        if budget is not None and is_retryable(e):
+            budget.spend()
+        raise
+
+def request_with_retry(session, method, url, budget=None, check_login=False, **kwargs):
+    """
+    requests 세션으로 요청을 보냅니다. (연결/읽기 타임아웃 + 연결 오류/5xx는 지수 백오프로 재시도)
+    budget(ErrorBudget)을 넘기면 실패할 때마다 차감하고, 다 쓰면 재시도 없이 바로 예외
+    """
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    for attempt in Retrying(**_retry_options(budget)):
+        with attempt:
+            return _attempt(lambda: session.request(method, url, **kwargs), url, budget, check_login)
+
+def get_with_retry(session, url, budget=None, check_login=False, **kwargs):
+    return request_with_retry(session, "GET", url, budget, check_login, **kwargs)
+
+def post_with_retry(session, url, budget=None, **kwargs):
+    return request_with_retry(session, "POST", url, budget, **kwargs)
+
+async def request_with_retry_async(client, method, url, budget=None, check_login=False, **kwargs):
+    """request_with_retry의 비동기 버전 (httpx.AsyncClient, 타임아웃은 클라이언트 설정 사용)"""
+    async for attempt in AsyncRetrying(**_retry_options(budget)):
+        with attempt:
+            if budget is not None and budget.exhausted:
+                raise ErrorBudgetExceeded(f"실패 허용 횟수({budget.limit}회) 초과: {url}")
+            try:
+                return _check(await client.request(method, url, **kwargs), url, check_login)
+            except Exception as e:
+                if budget is not None and is_retryable(e):
+                    budget.spend()
+                raise
+
+async def get_with_retry_async(client, url, budget=None, check_login=False, **kwargs):
+    return await request_with_retry_async(client, "GET", url, budget, check_login, **kwargs)
+
+async def post_with_retry_async(client, url, budget=None, **kwargs):
+    return await request_with_retry_async(client, "POST", url, budget, **kwargs)
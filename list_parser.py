@@ -0,0 +1,232 @@
+import re
+
+from bs4 import BeautifulSoup
+
+# [설정] lxml은 선택 사항 (없으면 BeautifulSoup 기준 구현으로 대체)
+try:
+    from lxml import etree
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+def _absolute_img_url(img_url):
+    if img_url:
+        if img_url.startswith("//"):
+            img_url = f"https:{img_url}"
+        elif img_url.startswith("/"):
+            img_url = f"https://fixcon.co.kr{img_url}"
+    return img_url
+
+# 페이지네이션 링크의 page 파라미터 (예: ?cate_no=24&page=5)
+PAGE_PARAM_RE = re.compile(r"[?&]page=(\d+)")
+
+def _max_page(links):
+    """(href, 텍스트) 목록에서 가장 큰 페이지 번호를 찾습니다. 링크가 '#none'인 현재/마지막 페이지는 텍스트로 판단"""
+    pages = []
+    for href, text in links:
+        m = PAGE_PARAM_RE.search(href or "")
+        if m:
+            pages.append(int(m.group(1)))
+        elif text and text.strip().isdigit():
+            pages.append(int(text.strip()))
+    return max(pages) if pages else None
+
+def _find_price(lines):
+    for line in lines:
+        val = line.strip()
+        # '원'으로 끝나고 숫자가 포함된 경우 (예: 42,000원)
+        if val.endswith("원") and any(c.isdigit() for c in val):
+            return val
+    return "Unknown"
+
+# --- BeautifulSoup (기준 구현) ---
+def parse_list_page_bs4(html, cat_name):
+    """
+    목록 페이지 HTML에서 상품 정보를 추출합니다. (BeautifulSoup 기준 구현)
+    반환값: (발견된 li 개수, 상품 리스트) - li가 0개면 마지막 페이지를 지난 것
+    """
+    return _products_bs4(BeautifulSoup(html, "html.parser"), cat_name)
+
+def _products_bs4(soup, cat_name):
+    # Cafe24 상품 리스트 선택자
+    items = soup.select("ul.prdList > li") or soup.select(".xans-product-listnormal > li")
+
+    if not items:
+        # xans-record- 클래스로 재시도
+        items = soup.select("li.xans-record-")
+
+    products = []
+    for item in items:
+        # 1. 이름
+        name_el = item.select_one(".name a") or item.select_one(".pname")
+        if name_el:
+            name = name_el.text.replace("상품명 :", "").strip()
+        else:
+            continue # 이름 없으면 스킵
+
+        # 2. 가격
+        # [Fix] scraper_requests.py에서 검증된 텍스트 분석 로직만 사용
+        # (.price 클래스 등은 비어있거나 부정확할 수 있음)
+        price = "Unknown"
+        desc_el = item.select_one(".description")
+        if desc_el:
+            price = _find_price(desc_el.get_text(separator="\n").split("\n"))
+
+        # 품절 여부 (아이콘 등 확인)
+        status = "판매중"
+        if item.select("img[alt='품절']"):
+            status = "품절"
+
+        # [New] 이미지 스크래핑
+        img_url = ""
+        img_el = item.select_one(".thumbnail img")
+        if img_el:
+            img_url = _absolute_img_url(img_el.get("src"))
+
+        products.append({
+            "category": cat_name,
+            "name": name,
+            "price": price,
+            "status": status,
+            "url": f"https://fixcon.co.kr{name_el['href']}" if name_el else "",
+            "img_url": img_url # [New] 이미지 URL 추가
+        })
+
+    return len(items), products
+
+def parse_last_page_bs4(html):
+    """
+    Cafe24 페이지네이션 영역에서 마지막 페이지 번호를 읽습니다.
+    반환값: 마지막 페이지 번호 (페이지네이션이 없으면 None)
+    """
+    return _last_page_bs4(BeautifulSoup(html, "html.parser"))
+
+def _last_page_bs4(soup):
+    paging = soup.select_one(".xans-product-normalpaging") or soup.select_one(".ec-base-paginate")
+    if not paging:
+        return None
+    return _max_page((a.get("href"), a.get_text()) for a in paging.select("a"))
+
+def parse_page_bs4(html, cat_name, with_last_page=True):
+    """
+    [Optimization] HTML을 한 번만 파싱해 상품 목록과 마지막 페이지 번호를 함께 읽습니다.
+    반환값: (발견된 li 개수, 상품 리스트, 마지막 페이지 번호 - with_last_page이고 상품이 있을 때만, 아니면 None)
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    item_count, products = _products_bs4(soup, cat_name)
+    last_page = _last_page_bs4(soup) if with_last_page and item_count else None
+    return item_count, products, last_page
+
+# --- lxml (고속 경로) ---
+if LXML_AVAILABLE:
+    def _has_class(name):
+        return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+    # CSS 선택자와 동일한 의미의 XPath를 모듈 로드 시 한 번만 컴파일
+    _XP_ITEMS = [
+        etree.XPath(f"//ul[{_has_class('prdList')}]/li"),
+        etree.XPath(f"//*[{_has_class('xans-product-listnormal')}]/li"),
+        etree.XPath(f"//li[{_has_class('xans-record-')}]"),
+    ]
+    _XP_NAME_LINK = etree.XPath(f"(.//*[{_has_class('name')}]//a)[1]")
+    _XP_PNAME = etree.XPath(f"(.//*[{_has_class('pname')}])[1]")
+    _XP_DESC = etree.XPath(f"(.//*[{_has_class('description')}])[1]")
+    _XP_SOLDOUT = etree.XPath(".//img[@alt='품절']")
+    _XP_THUMB_IMG = etree.XPath(f"(.//*[{_has_class('thumbnail')}]//img)[1]")
+    _XP_PAGING = [
+        etree.XPath(f"(//*[{_has_class('xans-product-normalpaging')}])[1]"),
+        etree.XPath(f"(//*[{_has_class('ec-base-paginate')}])[1]"),
+    ]
+
+    # BeautifulSoup.get_text()와 동일하게 주석/스크립트/스타일 내용은 제외
+    _SKIP_TEXT_TAGS = {"script", "style"}
+
+    def _iter_strings(el):
+        if isinstance(el.tag, str) and el.tag not in _SKIP_TEXT_TAGS and el.text:
+            yield el.text
+        for child in el:
+            yield from _iter_strings(child)
+            if child.tail:
+                yield child.tail
+
+    def parse_list_page_lxml(html, cat_name):
+        """parse_list_page_bs4와 동일한 결과를 내는 lxml + 사전 컴파일 XPath 구현"""
+        if not html or not html.strip():
+            return 0, []
+        return _products_lxml(lxml.html.fromstring(html), cat_name)
+
+    def _products_lxml(root, cat_name):
+        items = []
+        for xp in _XP_ITEMS:
+            items = xp(root)
+            if items:
+                break
+
+        products = []
+        for item in items:
+            # 1. 이름
+            found = _XP_NAME_LINK(item) or _XP_PNAME(item)
+            if not found:
+                continue # 이름 없으면 스킵
+            name_el = found[0]
+            name = "".join(_iter_strings(name_el)).replace("상품명 :", "").strip()
+
+            # 2. 가격
+            price = "Unknown"
+            desc = _XP_DESC(item)
+            if desc:
+                price = _find_price("\n".join(_iter_strings(desc[0])).split("\n"))
+
+            # 품절 여부
+            status = "품절" if _XP_SOLDOUT(item) else "판매중"
+
+            # 이미지
+            img_url = ""
+            img = _XP_THUMB_IMG(item)
+            if img:
+                img_url = _absolute_img_url(img[0].get("src"))
+
+            products.append({
+                "category": cat_name,
+                "name": name,
+                "price": price,
+                "status": status,
+                "url": f"https://fixcon.co.kr{name_el.attrib['href']}",
+                "img_url": img_url
+            })
+
+        return len(items), products
+
+    def parse_last_page_lxml(html):
+        """parse_last_page_bs4와 동일한 결과를 내는 lxml 구현"""
+        if not html or not html.strip():
+            return None
+        return _last_page_lxml(lxml.html.fromstring(html))
+
+    def _last_page_lxml(root):
+        for xp in _XP_PAGING:
+            found = xp(root)
+            if found:
+                return _max_page((a.get("href"), "".join(_iter_strings(a))) for a in found[0].iter("a"))
+        return None
+
+    def parse_page_lxml(html, cat_name, with_last_page=True):
+        """parse_page_bs4와 동일한 결과를 내는 lxml 구현 (트리 한 번만 생성)"""
+        if not html or not html.strip():
+            return 0, [], None
+        root = lxml.html.fromstring(html)
+        item_count, products = _products_lxml(root, cat_name)
+        last_page = _last_page_lxml(root) if with_last_page and item_count else None
+        return item_count, products, last_page
+
+PARSERS = {"bs4": (parse_list_page_bs4, parse_last_page_bs4, parse_page_bs4)}
+if LXML_AVAILABLE:
+    PARSERS["lxml"] = (parse_list_page_lxml, parse_last_page_lxml, parse_page_lxml)
+
+def get_parser(backend):
+    """요청한 백엔드의 (상품 목록 파서, 마지막 페이지 파서, 한 번에 읽는 페이지 파서)를 반환 (lxml 미설치 시 bs4로 대체)"""
+    if backend not in PARSERS:
+        print(f"[-] 파서 백엔드 '{backend}' 사용 불가, bs4로 대체합니다.")
+        return PARSERS["bs4"]
+    return PARSERS[backend]
@@ -0,0 +1,43 @@
+# [설정] 부품 검색 탭의 (모델, 부품) 인덱스 (앱과 benchmarks/bench_part_index.py 공용)
+# 데이터 버전당 한 번만 구성 -> 버튼 클릭 시 dict 조회만 수행
+from classifier import get_classification_cache
+
+def classify_frame(df, cache=None, dropna=True):
+    """
+    상품명/카테고리로 모델/부품 컬럼을 붙이고 (dropna면) 부품이 없는 행은 제외합니다.
+    (앱 화면과 수집 완료 직후 캐시 준비가 같은 결과/데이터 버전을 쓰도록 공용)
+    """
+    cache = cache or get_classification_cache()
+    df = df.copy()
+    df["모델"], df["부품"] = cache.classify(df["상품명"], df["카테고리"])
+    # [Filter] None 제거
+    return df.dropna(subset=["부품"]) if dropna else df
+
+def build_search_rows(df):
+    """
+    검색 색인용 행 목록: 분류된 최신 스냅샷의 모든 상품 (가격/부품이 없는 상품 포함)
+    같은 (카테고리, 상품명)은 최신 행만 남김
+    """
+    rows = df.sort_values(by="수집일시", ascending=False, kind="stable").drop_duplicates(subset=["카테고리", "상품명"])
+    return rows.to_dict("records")
+
+def build_part_index(df):
+    """
+    분류된(모델/부품 컬럼이 있는) DataFrame으로 (모델, 부품) -> 상품 행 dict 리스트 인덱스를 만듭니다.
+    [Data Cleaning] 가격은 수집 시 정수로 변환되어 저장됨
+    [Fix] 정수 가격이 없는 상품('가격문의' 등, <NA>)도 목록에 남기고 가격 있는 상품 뒤에 배치 (카드에는 가격 문구 표시)
+    """
+    # 가격을 못 읽은 행('Unknown')과 빈 가격은 기존처럼 제외
+    listed = df[~df["가격"].astype(str).isin(["Unknown", ""])]
+    # [Fix] 중복 제거 로직 개선 (최신 데이터 우선)
+    # 1. 수집일시 기준 내림차순 정렬 (최신 데이터가 위로)
+    listed = listed.sort_values(by="수집일시", ascending=False, kind="stable")
+    # 2. 상품명이 같으면 중복 제거 (가장 위의 최신 데이터만 남김, 가격 변동 무시)
+    listed = listed.drop_duplicates(subset=["모델", "부품", "상품명"])
+    # 3. 보기 좋게 가격순 정렬 (정수 가격이 없으면 맨 뒤)
+    listed = listed.sort_values(by="가격_숫자", ascending=False, kind="stable", na_position="last")
+    return {key: group.to_dict("records") for key, group in listed.groupby(["모델", "부품"], sort=False)}
+
+def compute_data_version(df):
+    """데이터 버전: 카테고리별 최신 수집일시 (수집 중 카테고리 하나만 갱신돼도 버전이 바뀜)"""
+    return "|".join(f"{cat}={ts}" for cat, ts in sorted(df.groupby("카테고리", observed=True)["수집일시"].max().astype(str).items()))
@@ -0,0 +1,416 @@
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import quote, unquote
+
+import pandas as pd
+
+# [설정] 로컬 가격 저장소 (앱/수집기 공용 1차 저장소, 구글 시트는 미러)
+BASE_DIR = os.path.dirname(__file__)
+DATA_DIR = os.path.join(BASE_DIR, "data")
+STORE_BACKEND = os.environ.get("PRICE_STORE_BACKEND", "parquet") # parquet | sqlite
+PARQUET_ROOT = os.path.join(DATA_DIR, "prices") # 수집일(date=YYYY-MM-DD)별 파티션
+SQLITE_PATH = os.path.join(DATA_DIR, "prices.sqlite")
+
+# 저장 컬럼 (시트 헤더 + 수집 시 한 번만 변환한 정수 가격/부가세 포함 가격)
+STORE_COLUMNS = ["수집일시", "카테고리", "상품명", "가격", "가격_숫자", "가격_VAT포함", "상태", "URL", "이미지"]
+PRICE_COLUMNS = ["가격_숫자", "가격_VAT포함"]
+VAT_RATE_PERCENT = 10
+CATEGORICAL_COLUMNS = ["카테고리", "상태"]
+TEXT_COLUMNS = ["상품명", "가격", "URL", "이미지"]
+PRICE_RE = re.compile(r"\s*[\d,]+\s*원\s*") # 정상 가격 표기 ('42,000원'), 전체 일치만 인정
+
+def parse_price_series(prices):
+    """
+    '42,000원' 형태의 가격 문자열을 정수로 변환합니다.
+    [Fix] 형식이 다르면('가격문의', '품절 (1,000원 할인)' 등) 숫자만 골라내지 않고 <NA>
+    """
+    prices = prices.astype(str)
+    valid = prices.str.fullmatch(PRICE_RE)
+    digits = prices.str.replace(r"[^0-9]", "", regex=True).where(valid)
+    return pd.to_numeric(digits, errors="coerce").astype("Int64")
+
+def vat_inclusive(prices):
+    """정수 가격 Series -> 부가세(10%, 원 단위 절사) 포함 가격"""
+    return prices + prices * VAT_RATE_PERCENT // 100
+
+def normalize_frame(df):
+    """
+    시트/저장소 어디서 읽었든 같은 타입의 DataFrame으로 맞춥니다.
+    수집일시: datetime, 가격_숫자/가격_VAT포함: Int64, 카테고리/상태: category
+    가격 문자열은 정수 컬럼이 없을 때(수집 직후, 시트에서 읽은 데이터)만 파싱
+    """
+    df = df.copy()
+    parsed = "가격_숫자" in df.columns
+    for col in STORE_COLUMNS:
+        if col not in df.columns:
+            df[col] = pd.NA if col in PRICE_COLUMNS else ""
+    df["수집일시"] = pd.to_datetime(df["수집일시"], errors="coerce")
+    df = df.dropna(subset=["수집일시"])
+    for col in TEXT_COLUMNS:
+        df[col] = df[col].fillna("").astype(str)
+    if parsed:
+        prices = pd.to_numeric(df["가격_숫자"], errors="coerce").astype("Int64")
+    else:
+        prices = parse_price_series(df["가격"])
+    df["가격_숫자"] = prices
+    df["가격_VAT포함"] = pd.to_numeric(df["가격_VAT포함"], errors="coerce").astype("Int64").fillna(vat_inclusive(prices))
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype(str).astype("category")
+    return df[STORE_COLUMNS].reset_index(drop=True)
+
+def products_to_frame(products, timestamp):
+    """크롤링 결과(dict 리스트)를 저장용 DataFrame으로 변환"""
+    df = pd.DataFrame([{
+        "수집일시": timestamp,
+        "카테고리": p["category"],
+        "상품명": p["name"],
+        "가격": p["price"],
+        "상태": p["status"],
+        "URL": p["url"],
+        "이미지": p.get("img_url", ""),
+    } for p in products], columns=[c for c in STORE_COLUMNS if c not in PRICE_COLUMNS])
+    # [Optimization] 가격 문자열 -> 정수 변환은 수집 파이프라인에서 한 번만 (앱은 정수 컬럼만 사용)
+    return normalize_frame(df)
+
+def concat_frames(frames):
+    """
+    정규화된 DataFrame들을 이어 붙입니다.
+    category 컬럼은 범주를 합쳐서 유지 (그냥 concat하면 범주가 다른 프레임끼리 object로 풀려버림)
+    """
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return normalize_frame(pd.DataFrame(columns=STORE_COLUMNS))
+    if len(frames) == 1:
+        return frames[0]
+    from pandas.api.types import union_categoricals
+    combined = pd.concat(frames, ignore_index=True)
+    for col in CATEGORICAL_COLUMNS:
+        combined[col] = union_categoricals([f[col] for f in frames])
+    return combined
+
+def latest_per_category(df, runs=1):
+    """
+    카테고리마다 가장 최근 N회차 행만 남깁니다.
+    수집 중에는 카테고리 단위로 먼저 저장되므로, 최신 회차에 아직 없는 카테고리는 직전 회차를 그대로 보여줌
+    """
+    if df.empty:
+        return df
+    ranks = df.groupby("카테고리", observed=True)["수집일시"].rank(method="dense", ascending=False)
+    return df[ranks <= runs].reset_index(drop=True)
+
+def page_frame(df, since=None, until=None, where=None, sort_by="수집일시", ascending=False, offset=0, limit=None, columns=None):
+    """
+    필터 -> 정렬 -> 페이지 자르기 -> 컬럼 선택 순서로 한 페이지만 만듭니다.
+    where: {컬럼: 허용 값 목록} (값 목록이 비어 있으면 그 조건은 무시), until은 미포함
+    반환값: (페이지 DataFrame, 필터 후 전체 행 수)
+    """
+    mask = pd.Series(True, index=df.index)
+    if since is not None:
+        mask &= df["수집일시"] >= pd.Timestamp(since)
+    if until is not None:
+        mask &= df["수집일시"] < pd.Timestamp(until)
+    for col, values in (where or {}).items():
+        if values:
+            mask &= df[col].isin(values)
+    df = df[mask]
+    total = len(df)
+    if sort_by:
+        df = df.sort_values(by=sort_by, ascending=ascending, kind="stable", na_position="last")
+    end = None if limit is None else offset + limit
+    page = df.iloc[offset:end]
+    if columns:
+        page = page[list(columns)]
+    return page.reset_index(drop=True), total
+
+class ParquetStore:
+    """수집일 기준 hive 파티션 Parquet 데이터셋 (회차마다 파일 1개)"""
+    def __init__(self, root=PARQUET_ROOT):
+        self.root = root
+        self.lock = threading.Lock()
+        self._categories = {} # 경로 -> (수정 시각, 카테고리 집합)
+
+    def is_empty(self):
+        if not os.path.isdir(self.root):
+            return True
+        for _, _, files in os.walk(self.root):
+            if any(f.endswith(".parquet") for f in files):
+                return False
+        return True
+
+    def append(self, df, part=None):
+        """
+        part: 한 회차를 나눠 기록할 때의 구분자 (카테고리명 등) -> run-<수집일시>-<part>.parquet
+        [Fix] 파일명에 쓸 수 없는 문자('/' 등)가 있어도 되도록 part는 퍼센트 인코딩 (읽을 때 _run_parts가 되돌림)
+        """
+        if df.empty:
+            return
+        suffix = f"-{quote(str(part), safe='')}" if part else ""
+        with self.lock:
+            for ts, group in df.groupby("수집일시", observed=True):
+                part_dir = os.path.join(self.root, f"date={ts:%Y-%m-%d}")
+                os.makedirs(part_dir, exist_ok=True)
+                path = os.path.join(part_dir, f"run-{ts:%Y%m%dT%H%M%S}{suffix}.parquet")
+                tmp_path = path + ".tmp"
+                group.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, path)
+
+    def _run_parts(self):
+        """회차 경계 인덱스: 파일명(run-YYYYmmddTHHMMSS[-part].parquet)에서 (수집일시, part, 경로)를 시간순으로 반환 (part 없으면 None)"""
+        runs = []
+        if not os.path.isdir(self.root):
+            return runs
+        for dirpath, _, files in os.walk(self.root):
+            for f in files:
+                if f.startswith("run-") and f.endswith(".parquet"):
+                    ts = datetime.strptime(f[4:19], "%Y%m%dT%H%M%S")
+                    part = unquote(f[20:-len(".parquet")]) if f[19:20] == "-" else None
+                    runs.append((ts, part, os.path.join(dirpath, f)))
+        return sorted(runs, key=lambda r: (r[0], r[2]))
+
+    def _run_files(self):
+        return [(ts, path) for ts, _, path in self._run_parts()]
+
+    def _file_categories(self, path):
+        """카테고리별로 나누지 않은 회차 파일의 카테고리 집합 (카테고리 컬럼만 읽고, 파일 수정 시각 기준으로 캐시)"""
+        import pyarrow.parquet as pq
+        mtime = os.path.getmtime(path)
+        cached = self._categories.get(path)
+        if cached is None or cached[0] != mtime:
+            column = pq.read_table(path, columns=["카테고리"]).column("카테고리")
+            cached = (mtime, frozenset(str(c) for c in column.unique().to_pylist()))
+            self._categories[path] = cached
+        return cached[1]
+
+    def _read_files(self, paths):
+        if not paths:
+            return normalize_frame(pd.DataFrame(columns=STORE_COLUMNS))
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        # 파일별 스키마를 합쳐서 읽기 -> 이전 형식 파일에 없는 컬럼(가격_VAT포함 등)은 null로 채워짐
+        table = pa.concat_tables([pq.read_table(p) for p in paths], promote_options="permissive")
+        df = table.to_pandas()
+        return normalize_frame(df)
+
+    def read_latest(self, runs=1):
+        """
+        카테고리별 최근 N회차만 읽습니다. (수집 중이면 아직 안 끝난 카테고리는 이전 회차 사용)
+        [Fix] 카테고리마다 최신 회차를 먼저 찾아 그 파일만 열기 -> 최근 회차에서 빠진 카테고리도 마지막 회차를 유지
+        카테고리별 파일은 파일명의 part로, 나누지 않은 회차 파일은 카테고리 컬럼으로 판단
+        """
+        files = []
+        category_runs = {}
+        for ts, part, path in self._run_parts():
+            categories = {part} if part else self._file_categories(path)
+            files.append((ts, path, categories))
+            for cat in categories:
+                category_runs.setdefault(cat, set()).add(ts)
+        keep = {cat: set(sorted(times)[-runs:]) for cat, times in category_runs.items()}
+        paths = [path for ts, path, categories in files if any(ts in keep[cat] for cat in categories)]
+        return latest_per_category(self._read_files(paths), runs)
+
+    def read_page(self, since=None, until=None, where=None, sort_by="수집일시", ascending=False, offset=0, limit=None, columns=None):
+        """
+        기간/조건에 맞는 한 페이지만 반환합니다. (전체 목록 탭용, page_frame 인자 참고)
+        기간은 파일 단위로 먼저 거르고, 필터/정렬/출력에 필요한 컬럼만 읽음
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        files = self._run_files()
+        if since is not None:
+            files = [(ts, p) for ts, p in files if ts >= pd.Timestamp(since)]
+        if until is not None:
+            files = [(ts, p) for ts, p in files if ts < pd.Timestamp(until)]
+        needed = {"수집일시", *(where or {}), *([sort_by] if sort_by else []), *(columns or STORE_COLUMNS)}
+        tables = []
+        for _, path in files:
+            names = pq.read_schema(path).names
+            tables.append(pq.read_table(path, columns=[c for c in names if c in needed]))
+        if tables:
+            df = normalize_frame(pa.concat_tables(tables, promote_options="permissive").to_pandas())
+        else:
+            df = normalize_frame(pd.DataFrame(columns=STORE_COLUMNS))
+        return page_frame(df, since, until, where, sort_by, ascending, offset, limit, columns)
+
+    def read_tail(self, cursor=None, since=None):
+        """
+        cursor 이후에 추가된 회차 파일만 읽습니다. (cursor: (컬럼 집합, 읽은 파일 경로 집합))
+        since: 이 시각 이전 회차 파일은 열지 않음 (같은 cursor에는 항상 같은 since를 넘길 것)
+        반환값: (새 행 DataFrame, 새 cursor) - 읽었던 파일이 사라졌거나 컬럼 구성이 바뀌었으면 (None, None)
+        """
+        import pyarrow.parquet as pq
+        files = self._run_files()
+        if since is not None:
+            files = [(ts, p) for ts, p in files if ts >= pd.Timestamp(since)]
+        paths = [p for _, p in files]
+        if cursor is None:
+            columns, seen = None, frozenset()
+        else:
+            columns, seen = cursor
+            if not seen.issubset(paths):
+                return None, None
+        new_paths = [p for p in paths if p not in seen]
+        new_columns = frozenset(name for p in new_paths for name in pq.read_schema(p).names)
+        if columns is not None and new_paths and new_columns != columns:
+            return None, None
+        return self._read_files(new_paths), (columns or new_columns, frozenset(paths))
+
+class SQLiteStore:
+    """단일 SQLite 파일 (수집일시 인덱스)"""
+    def __init__(self, path=SQLITE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS prices ("
+                "수집일시 TEXT NOT NULL, 카테고리 TEXT, 상품명 TEXT, 가격 TEXT, 가격_숫자 INTEGER, "
+                "가격_VAT포함 INTEGER, 상태 TEXT, URL TEXT, 이미지 TEXT)"
+            )
+            # 이전 스키마 파일에는 부가세 포함 가격 컬럼 추가 (기존 행은 읽을 때 가격_숫자로 계산)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(prices)")}
+            if "가격_VAT포함" not in columns:
+                conn.execute("ALTER TABLE prices ADD COLUMN 가격_VAT포함 INTEGER")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_prices_ts ON prices (수집일시)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_prices_cat_ts ON prices (카테고리, 수집일시)")
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def is_empty(self):
+        if not os.path.exists(self.path):
+            return True
+        with self._connect() as conn:
+            return conn.execute("SELECT 1 FROM prices LIMIT 1").fetchone() is None
+
+    def append(self, df, part=None):
+        """part는 Parquet 저장소와 인터페이스를 맞추기 위한 인자 (한 테이블에 그대로 추가)"""
+        if df.empty:
+            return
+        out = df.copy()
+        out["수집일시"] = out["수집일시"].dt.strftime("%Y-%m-%d %H:%M:%S")
+        for col in PRICE_COLUMNS:
+            out[col] = out[col].astype(object).where(out[col].notna(), None)
+        with self.lock, self._connect() as conn:
+            out.to_sql("prices", conn, if_exists="append", index=False)
+
+    def _query(self, sql, params=()):
+        if not os.path.exists(self.path):
+            return normalize_frame(pd.DataFrame(columns=STORE_COLUMNS))
+        with self._connect() as conn:
+            df = pd.read_sql_query(sql, conn, params=params)
+        return normalize_frame(df)
+
+    def read_latest(self, runs=1):
+        """[Fix] 카테고리별 최근 N회차를 SQL에서 직접 고릅니다. (최근 회차에서 빠진 카테고리도 마지막 회차를 유지)"""
+        return self._query(
+            "WITH ranked AS ("
+            " SELECT 카테고리, 수집일시, DENSE_RANK() OVER (PARTITION BY 카테고리 ORDER BY 수집일시 DESC) AS rn"
+            " FROM (SELECT DISTINCT 카테고리, 수집일시 FROM prices))"
+            " SELECT p.* FROM prices p JOIN ranked r ON p.카테고리 IS r.카테고리 AND p.수집일시 = r.수집일시"
+            " WHERE r.rn <= ?",
+            (runs,),
+        )
+
+    def read_page(self, since=None, until=None, where=None, sort_by="수집일시", ascending=False, offset=0, limit=None, columns=None):
+        """기간/조건/정렬/페이지를 SQL로 처리해 한 페이지만 읽습니다. (전체 목록 탭용, page_frame 인자 참고)"""
+        clauses, params = [], []
+        if since is not None:
+            clauses.append("수집일시 >= ?")
+            params.append(pd.Timestamp(since).strftime("%Y-%m-%d %H:%M:%S"))
+        if until is not None:
+            clauses.append("수집일시 < ?")
+            params.append(pd.Timestamp(until).strftime("%Y-%m-%d %H:%M:%S"))
+        for col, values in (where or {}).items():
+            if values:
+                if col not in STORE_COLUMNS:
+                    raise ValueError(f"알 수 없는 컬럼: {col}")
+                clauses.append(f"{col} IN ({', '.join('?' * len(values))})")
+                params.extend(str(v) for v in values)
+        where_sql = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        if not os.path.exists(self.path):
+            return page_frame(normalize_frame(pd.DataFrame(columns=STORE_COLUMNS)), columns=columns)
+        with self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM prices{where_sql}", params).fetchone()[0]
+        sql = f"SELECT * FROM prices{where_sql}"
+        if sort_by:
+            if sort_by not in STORE_COLUMNS:
+                raise ValueError(f"알 수 없는 컬럼: {sort_by}")
+            sql += f" ORDER BY {sort_by} IS NULL, {sort_by} {'ASC' if ascending else 'DESC'}, rowid"
+        if limit is not None or offset:
+            # [Fix] limit 없이 offset만 준 경우도 page_frame처럼 앞부분을 건너뜀 (SQLite는 LIMIT -1 = 제한 없음)
+            sql += " LIMIT ? OFFSET ?"
+            params = params + [-1 if limit is None else limit, offset]
+        page = self._query(sql, params)
+        if columns:
+            page = page[list(columns)]
+        return page, total
+
+    def read_tail(self, cursor=None, since=None):
+        """
+        cursor 이후에 추가된 행만 읽습니다. (cursor: (컬럼 목록, 마지막으로 읽은 rowid))
+        추가 전용 테이블이라 rowid가 계속 증가 -> rowid 비교만으로 새 행을 찾음
+        since: 이 시각 이전 회차 행은 읽지 않음 (같은 cursor에는 항상 같은 since를 넘길 것)
+        반환값: (새 행 DataFrame, 새 cursor) - 행이 지워졌거나 컬럼이 바뀌었으면 (None, None)
+        """
+        if not os.path.exists(self.path):
+            return normalize_frame(pd.DataFrame(columns=STORE_COLUMNS)), cursor
+        with self._connect() as conn:
+            columns = tuple(row[1] for row in conn.execute("PRAGMA table_info(prices)"))
+            last_rowid = conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM prices").fetchone()[0]
+            if cursor is not None and (cursor[0] != columns or cursor[1] > last_rowid):
+                return None, None
+            start = cursor[1] if cursor is not None else 0
+            sql, params = "SELECT * FROM prices WHERE rowid > ? AND rowid <= ?", [start, last_rowid]
+            if since is not None:
+                sql += " AND 수집일시 >= ?"
+                params.append(pd.Timestamp(since).strftime("%Y-%m-%d %H:%M:%S"))
+            df = pd.read_sql_query(sql, conn, params=params)
+        return normalize_frame(df), (columns, last_rowid)
+
+class IncrementalLoader:
+    """
+    저장소 전체 이력을 메모리에 두고, 새로 추가된 부분만 읽어 이어 붙입니다.
+    (저장소는 추가 전용 -> 수집 후에도 전체를 다시 읽지 않고 새 회차 파일/행만 읽음)
+    파일이 지워지거나 컬럼 구성이 바뀌는 등 추가 전용이 깨진 경우에만 전체를 다시 읽음
+    since: 이 시각 이후 회차만 유지 (기간을 정해 두면 그 이전 회차는 처음부터 읽지 않음)
+    """
+    def __init__(self, store, since=None):
+        self.store = store
+        self.since = since
+        self.lock = threading.Lock()
+        self.frame = None
+        self.cursor = None
+
+    def load(self):
+        """최신 상태의 이력 (since 이후 전체, 수집일시 최신순)을 반환합니다."""
+        with self.lock:
+            tail, cursor = self.store.read_tail(self.cursor, self.since)
+            if tail is None or self.frame is None:
+                if tail is None:
+                    print("[*] 저장소 구성이 바뀌어 전체 이력을 다시 읽습니다.")
+                    tail, cursor = self.store.read_tail(None, self.since)
+                frame = tail.sort_values(by="수집일시", ascending=False).reset_index(drop=True)
+            elif tail.empty:
+                frame = self.frame
+            else:
+                # 새 회차가 앞에 오도록 붙이고, 순서가 어긋난 경우(과거 데이터 추가 등)에만 다시 정렬
+                frame = concat_frames([tail.sort_values(by="수집일시", ascending=False), self.frame])
+                if not frame["수집일시"].is_monotonic_decreasing:
+                    frame = frame.sort_values(by="수집일시", ascending=False, kind="stable").reset_index(drop=True)
+            # 완성된 프레임으로 한 번에 교체 (읽는 쪽은 항상 이전 또는 새 프레임 전체를 봄)
+            self.frame, self.cursor = frame, cursor
+            return frame
+
+def get_store(backend=STORE_BACKEND):
+    if backend == "sqlite":
+        return SQLiteStore()
+    return ParquetStore()
@@ -0,0 +1,70 @@
+import itertools
+import threading
+import time
+
+class ScrapeJob:
+    """백그라운드 수집 1회분의 상태 (모든 세션이 같은 객체를 조회)"""
+    def __init__(self, job_id, trigger):
+        self.id = job_id
+        self.trigger = trigger # "manual" | "auto"
+        self.started_at = time.time()
+        self.finished_at = None
+        self.success = None # 실행 중이면 None
+        self.output = ""
+        self.progress = None # 마지막 진행 이벤트 (crawl_progress.CrawlProgress 형식)
+        self.finished_categories = [] # 저장까지 끝난 카테고리 (완료 순서)
+
+    def report(self, event):
+        """수집 스레드에서 진행 이벤트를 받아 보관 (UI는 이 값만 읽음)"""
+        self.progress = event
+        if event.get("type") == "category":
+            self.finished_categories = self.finished_categories + [event["category"]]
+
+    @property
+    def running(self):
+        return self.finished_at is None
+
+    def elapsed(self):
+        return (self.finished_at or time.time()) - self.started_at
+
+class ScrapeCoordinator:
+    """
+    프로세스 전체에서 수집을 한 번에 하나만 실행합니다. (single-flight)
+    - 실행 중에 요청하면 새로 시작하지 않고 진행 중인 작업을 돌려줌 -> 모든 세션이 같은 진행 상황/결과를 봄
+    - cooldown: 직전 작업이 끝난 지 이 시간(초)이 안 됐으면 재시작하지 않음 (자동 업데이트 실패 시 반복 실행 방지)
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.job = None
+        self._ids = itertools.count(1)
+
+    def current(self):
+        with self.lock:
+            return self.job
+
+    def submit(self, target, trigger="manual", cooldown=0):
+        """
+        target: 작업(ScrapeJob)을 인자로 받아 (성공 여부, 출력 문자열)을 반환하는 함수 (job.report로 진행 상황 전달)
+        반환값: (작업, 새로 시작했는지 여부)
+        """
+        with self.lock:
+            job = self.job
+            if job is not None:
+                if job.running:
+                    return job, False
+                if cooldown and time.time() - job.finished_at < cooldown:
+                    return job, False
+            job = ScrapeJob(next(self._ids), trigger)
+            self.job = job
+            thread = threading.Thread(target=self._run, args=(job, target), daemon=True)
+            thread.start()
+            return job, True
+
+    def _run(self, job, target):
+        try:
+            success, output = target(job)
+        except Exception as e:
+            success, output = False, str(e)
+        job.success = success
+        job.output = output or ""
+        job.finished_at = time.time()
@@ -0,0 +1,173 @@
+import asyncio
+import time
+
+import httpx
+
+from http_utils import REQUEST_TIMEOUT, decode_response, get_with_retry_async, post_with_retry_async
+from session_cache import load_cookies, save_cookies, clear_session_cache
+from scraper_main import (
+    LOGIN_URL, MYPAGE_URL, LOGIN_HEADERS, USER_AGENT, MAX_PAGES, CRAWL_WORKERS, CRAWL_RPS,
+    build_login_form, is_logged_in, list_page_url, parse_page, plan_pages
+)
+
+# [설정] HTTP/2는 h2 패키지가 설치된 경우에만 사용 (없으면 HTTP/1.1 keep-alive)
+try:
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+class AsyncRateLimiter:
+    """코루틴 전체가 공유하는 초당 요청 수 제한"""
+    def __init__(self, rps):
+        self.interval = 1.0 / rps if rps and rps > 0 else 0.0
+        self.lock = asyncio.Lock()
+        self.next_at = 0.0
+
+    async def wait(self):
+        if not self.interval:
+            return
+        async with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_at, now)
+            self.next_at = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+async def login_fixcon_async(client, user_id, user_pw):
+    print(f"[*] 로그인 페이지 접속... (async)")
+    res = await get_with_retry_async(client, LOGIN_URL)
+
+    action_url, login_data = build_login_form(decode_response(res), user_id, user_pw)
+    if not action_url:
+        print("[-] 로그인 폼을 찾을 수 없음")
+        return False
+
+    await post_with_retry_async(client, action_url, data=login_data, headers=LOGIN_HEADERS)
+
+    # [Fix] POST 후 바로 리다이렉트가 안 될 수 있으므로, 마이페이지 강제 접속
+    print(f"[*] 마이페이지 접속 시도: {MYPAGE_URL}")
+    res = await get_with_retry_async(client, MYPAGE_URL)
+    text = decode_response(res)
+
+    if is_logged_in(str(res.url), text):
+        print("[+] 로그인 성공!")
+        return True
+    else:
+        print(f"[-] 로그인 실패. URL: {res.url}")
+        print(f"[-] 응답 텍스트(일부): {text[:500]}")
+        return False
+
+async def ensure_login_async(client, user_id, user_pw):
+    """scraper_main.ensure_login의 비동기 버전 (같은 세션 캐시 파일 공유)"""
+    # [Fix] 재시도 후에도 로그인/세션 확인 요청이 실패하면 예외 대신 로그인 실패로 처리
+    try:
+        if load_cookies(client.cookies.jar, user_id):
+            print("[*] 저장된 로그인 세션 확인 중...")
+            res = await get_with_retry_async(client, MYPAGE_URL)
+            if is_logged_in(str(res.url), decode_response(res)):
+                print("[+] 저장된 세션으로 로그인 유지")
+                return True
+            print("[-] 저장된 세션이 만료됨. 다시 로그인합니다.")
+            client.cookies.clear()
+            clear_session_cache()
+
+        if not await login_fixcon_async(client, user_id, user_pw):
+            return False
+    except Exception as e:
+        print(f"[-] 로그인 요청 실패: {e}")
+        return False
+    save_cookies(client.cookies.jar, user_id)
+    return True
+
+async def load_list_page_async(client, cat_name, cat_id, page, state=None, budget=None):
+    """scraper_main.load_list_page의 비동기 버전"""
+    headers = state.request_headers(cat_id, page) if state is not None else None
+    res = await get_with_retry_async(client, list_page_url(cat_id, page), budget, check_login=True, headers=headers)
+    if state is None:
+        return parse_page(decode_response(res), cat_name, page)
+
+    cached = state.resolve(cat_name, cat_id, page, res)
+    if cached is not None:
+        return cached
+
+    item_count, products, last_page = parse_page(decode_response(res), cat_name, page)
+    state.update(cat_id, page, res, item_count, products, last_page)
+    return item_count, products, last_page
+
+async def scrape_category_async(client, cat_name, cat_id, limiter, semaphore, state=None, max_pages=MAX_PAGES, progress=None, budget=None):
+    async def fetch(page):
+        await limiter.wait()
+        async with semaphore:
+            result = await load_list_page_async(client, cat_name, cat_id, page, state, budget)
+        if result[0] and progress is not None:
+            progress.page_done(cat_name, page, len(result[1]))
+        return result
+
+    item_count, products, last_page = await fetch(1)
+    if not item_count:
+        print(f"    - {cat_name}: 상품이 없습니다.")
+        if progress is not None:
+            progress.category_done(cat_name, [])
+        return []
+    print(f"    - {cat_name} 1페이지: {item_count}개 상품 발견")
+
+    if last_page:
+        # [Optimization] 페이지네이션으로 전체 페이지 수를 알면 나머지를 병렬 요청
+        end_page = plan_pages(cat_name, last_page, max_pages)
+        results = await asyncio.gather(*[fetch(p) for p in range(2, end_page + 1)])
+        for page, (count, page_products, _) in enumerate(results, start=2):
+            print(f"    - {cat_name} {page}페이지: {count}개 상품 발견")
+            products.extend(page_products)
+    else:
+        # 페이지네이션이 없으면 빈 페이지가 나올 때까지 순서대로 진행
+        page = 1
+        while page < max_pages:
+            page += 1
+            count, page_products, _ = await fetch(page)
+            if not count:
+                break
+            print(f"    - {cat_name} {page}페이지: {count}개 상품 발견")
+            products.extend(page_products)
+        else:
+            print(f"[경고] {cat_name}: 최대 {max_pages}페이지 도달, 이후 페이지는 수집되지 않았을 수 있습니다.")
+
+    print(f"    - {cat_name}: 총 {len(products)}개 수집 완료")
+    if progress is not None:
+        progress.category_done(cat_name, products)
+    return products
+
+async def crawl_async(user_id, user_pw, categories, concurrency=CRAWL_WORKERS, rps=CRAWL_RPS, state=None, max_pages=MAX_PAGES, progress=None, budget=None):
+    """
+    로그인 후 모든 카테고리를 동시에 수집합니다.
+    반환값: {카테고리명: 상품 리스트} (categories 순서 유지, 실패한 카테고리는 제외), 로그인 실패 시 None
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        limits=limits,
+        http2=HTTP2_ENABLED,
+        follow_redirects=True,
+        timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+    ) as client:
+        if not await ensure_login_async(client, user_id, user_pw):
+            return None
+
+        limiter = AsyncRateLimiter(rps)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        names = list(categories)
+        tasks = [scrape_category_async(client, name, categories[name], limiter, semaphore, state, max_pages, progress, budget) for name in names]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # [Fix] 한 카테고리가 실패해도 나머지 결과는 그대로 반환
+        crawled = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                print(f"[-] {name} 수집 실패 (카테고리 제외): {result}")
+                continue
+            crawled[name] = result
+        return crawled
+
+def run_async_crawl(user_id, user_pw, categories, concurrency=CRAWL_WORKERS, rps=CRAWL_RPS, state=None, max_pages=MAX_PAGES, progress=None, budget=None):
+    return asyncio.run(crawl_async(user_id, user_pw, categories, concurrency=concurrency, rps=rps, state=state, max_pages=max_pages, progress=progress, budget=budget))
@@ -8,9 +8,21 @@ import datetime
 import gspread
 from google.oauth2.service_account import Credentials
 import time
-
-# [설정] Windows 콘솔 한글 출력
-sys.stdout.reconfigure(encoding='utf-8')
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
+from list_parser import get_parser
+from http_utils import ERROR_BUDGET, ErrorBudget, decode_response, get_with_retry, post_with_retry
+from crawl_state import CrawlState
+from crawl_progress import CrawlProgress
+from crawl_schedule import record_crawl, run_scheduler
+from category_discovery import load_target_categories
+from delta_log import (
+    RUNS_SHEET_NAME, RUNS_HEADER, diff_products, latest_state, load_state, save_state, product_to_record
+)
+from price_store import STORE_BACKEND, get_store, products_to_frame
+from session_cache import load_cookies, save_cookies, clear_session_cache
 
 # [설정] 파일 경로
 BASE_DIR = os.path.dirname(__file__)
@@ -20,9 +32,14 @@ SERVICE_ACCOUNT_PATH = os.path.join(BASE_DIR, "service_account.json")
 # [설정] 구글 시트 키
 SPREADSHEET_KEY = "1VfAiPUL--QsX7GatPESVzz80xG0BQ7Obj_mywUhJVcM"
 
+# [설정] 시트 기록 방식 (delta: 변경분만 추가 + runs 하트비트, snapshot: 매번 전체 추가)
+SHEET_WRITE_MODE = "delta"
+SHEET_HEADER = ["수집일시", "카테고리", "상품명", "가격", "상태", "URL", "이미지"]
+
 # [설정] 타겟 카테고리
+# [Optimization] find_categories.py가 만든 categories.json의 targets를 우선 사용 (없으면 아래 기본값)
 # 24: iPhone, 25: iPad, 26: Watch, 386: AirPods/Pencil, 27: Acc, 28: Tools
-TARGET_CATEGORIES = {
+DEFAULT_TARGET_CATEGORIES = {
     "iPhone": "24",
     "Acc_Apple_Comp": "357", # 구성품
     "Acc_Apple_Film": "359", # 필름/케이스
@@ -32,6 +49,19 @@ TARGET_CATEGORIES = {
     # "Watch": "26",
     # "AirPods_Pencil": "386",
 }
+TARGET_CATEGORIES = load_target_categories(DEFAULT_TARGET_CATEGORIES)
+
+# [설정] 크롤링 속도 제어
+MAX_PAGES = 50 # 카테고리당 최대 페이지 (안전장치, 초과 시 경고 후 잘라냄)
+CRAWL_WORKERS = 4 # 동시 수집 워커 수 (1이면 기존 순차 수집)
+CRAWL_RPS = 4.0 # 전체 초당 요청 수 제한
+CRAWL_PER_HOST = 4 # 호스트당 동시 요청 수 제한
+PARSER_BACKEND = "lxml" # 목록 페이지 파서 (lxml: 고속 경로, bs4: 기준 구현)
+
+# [설정] 스케줄러 모드(--daemon) 수집 시각 (KST, 카테고리별 지정 가능 / "*"는 기본값)
+# 예: {"*": ["10:00"], "iPhone": ["10:00", "15:00"]}
+DAILY_SCHEDULE = {"*": ["10:00"]}
+SCHEDULE_JITTER = 300 # 예정 시각마다 0~5분 무작위 지연
 
 def load_secrets():
     # 1. 파일이 있으면 파일 사용 (로컬)
@@ -65,21 +95,29 @@ def get_gsheet_client():
         
     return None
 
-def login_fixcon(session, user_id, user_pw):
-    login_url = "https://fixcon.co.kr/member/login.html"
-    print(f"[*] 로그인 페이지 접속...")
-    res = session.get(login_url)
-    res.encoding = res.apparent_encoding
-    
-    soup = BeautifulSoup(res.text, "html.parser")
+LOGIN_URL = "https://fixcon.co.kr/member/login.html"
+MYPAGE_URL = "https://fixcon.co.kr/myshop/index.html"
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+LOGIN_HEADERS = {
+    "Referer": LOGIN_URL,
+    "Origin": "https://fixcon.co.kr",
+    "Content-Type": "application/x-www-form-urlencoded",
+    "User-Agent": USER_AGENT
+}
+
+def build_login_form(html, user_id, user_pw):
+    """
+    로그인 페이지 HTML에서 폼 action과 전송 데이터를 만듭니다. (requests/async 엔진 공용)
+    반환값: (action_url, login_data) - 폼이 없으면 (None, None)
+    """
+    soup = BeautifulSoup(html, "html.parser")
     login_form = soup.find("form", {"id": "member_form_0"})
     if not login_form:
         input_el = soup.find("input", {"name": "member_id"})
         if input_el: login_form = input_el.find_parent("form")
             
     if not login_form:
-        print("[-] 로그인 폼을 찾을 수 없음")
-        return False
+        return None, None
 
     action_url = login_form.get("action")
     if not action_url.startswith("http"):
@@ -93,183 +131,574 @@ def login_fixcon(session, user_id, user_pw):
     login_data["member_id"] = user_id
     login_data["member_passwd"] = user_pw
     login_data["use_login_keeping"] = "F"
+    return action_url, login_data
+
+def is_logged_in(url, text):
+    return "myshop/index.html" in url or ("로그인" not in text and "modify.html" in text)
+
+def login_fixcon(session, user_id, user_pw):
+    print(f"[*] 로그인 페이지 접속...")
+    # [Fix] 로그인/세션 확인 요청도 타임아웃 + 재시도 (응답 없는 로그인 요청이 수집 작업 전체를 붙잡지 않도록)
+    res = get_with_retry(session, LOGIN_URL)
     
-    headers = {
-        "Referer": login_url,
-        "Origin": "https://fixcon.co.kr",
-        "Content-Type": "application/x-www-form-urlencoded",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
+    action_url, login_data = build_login_form(decode_response(res), user_id, user_pw)
+    if not action_url:
+        print("[-] 로그인 폼을 찾을 수 없음")
+        return False
     
-    res = session.post(action_url, data=login_data, headers=headers, timeout=10)
+    res = post_with_retry(session, action_url, data=login_data, headers=LOGIN_HEADERS)
     
     # [Fix] POST 후 바로 리다이렉트가 안 될 수 있으므로, 마이페이지 강제 접속
-    mypage_url = "https://fixcon.co.kr/myshop/index.html"
-    print(f"[*] 마이페이지 접속 시도: {mypage_url}")
-    res = session.get(mypage_url, timeout=10)
-    res.encoding = res.apparent_encoding
+    print(f"[*] 마이페이지 접속 시도: {MYPAGE_URL}")
+    res = get_with_retry(session, MYPAGE_URL)
+    text = decode_response(res)
     
     # 성공 확인
-    if "myshop/index.html" in res.url or ("로그인" not in res.text and "modify.html" in res.text):
+    if is_logged_in(res.url, text):
         print("[+] 로그인 성공!")
         return True
     else:
         print(f"[-] 로그인 실패. URL: {res.url}")
-        print(f"[-] 응답 텍스트(일부): {res.text[:500]}")
+        print(f"[-] 응답 텍스트(일부): {text[:500]}")
+        return False
+
+def ensure_login(session, user_id, user_pw):
+    """
+    저장된 로그인 세션이 유효하면 재사용하고 (요청 1회), 아니면 새로 로그인 후 저장합니다.
+    """
+    # [Fix] 재시도 후에도 로그인/세션 확인 요청이 실패하면 예외 대신 로그인 실패로 처리
+    try:
+        if load_cookies(session.cookies, user_id):
+            print("[*] 저장된 로그인 세션 확인 중...")
+            res = get_with_retry(session, MYPAGE_URL)
+            if is_logged_in(res.url, decode_response(res)):
+                print("[+] 저장된 세션으로 로그인 유지")
+                return True
+            print("[-] 저장된 세션이 만료됨. 다시 로그인합니다.")
+            session.cookies.clear()
+            clear_session_cache()
+
+        if not login_fixcon(session, user_id, user_pw):
+            return False
+    except Exception as e:
+        print(f"[-] 로그인 요청 실패: {e}")
         return False
+    save_cookies(session.cookies, user_id)
+    return True
 
 def clean_text(text):
     if not text: return ""
     return text.strip().replace("\n", "").replace("\r", "")
 
-def scrape_category(session, cat_name, cat_id):
+def list_page_url(cat_id, page):
+    return f"https://fixcon.co.kr/product/list.html?cate_no={cat_id}&page={page}"
+
+def fetch_list_page(session, cat_id, page, budget=None):
+    # [Fix] 타임아웃 + 연결 오류/5xx 재시도 (응답 없는 요청 하나에 전체 수집이 멈추지 않도록)
+    res = get_with_retry(session, list_page_url(cat_id, page), budget, check_login=True)
+    # [Optimization] 매 응답마다 apparent_encoding(본문 전체 분석) 대신 헤더/메타 선언 우선 사용
+    return decode_response(res)
+
+_list_parser, _last_page_parser, _page_parser = get_parser(PARSER_BACKEND)
+
+def set_parser_backend(backend):
+    global _list_parser, _last_page_parser, _page_parser
+    _list_parser, _last_page_parser, _page_parser = get_parser(backend)
+
+def parse_list_page(html, cat_name):
+    """
+    목록 페이지 HTML에서 상품 정보를 추출합니다. (PARSER_BACKEND에 따라 lxml/bs4 사용)
+    반환값: (발견된 li 개수, 상품 리스트) - li가 0개면 마지막 페이지를 지난 것
+    """
+    return _list_parser(html, cat_name)
+
+def parse_last_page(html):
+    """페이지네이션에서 마지막 페이지 번호를 읽습니다. (없으면 None)"""
+    return _last_page_parser(html)
+
+def parse_page(html, cat_name, page):
+    # [Optimization] 트리는 한 번만 만들고, 마지막 페이지 번호는 첫 페이지에서만 같은 트리로 확인
+    return _page_parser(html, cat_name, with_last_page=(page == 1))
+
+def load_list_page(session, cat_name, cat_id, page, state=None, budget=None):
+    """
+    목록 페이지 하나를 요청하고 파싱합니다.
+    state(CrawlState)가 있으면 조건부 요청을 보내고, 변경 없는 페이지는 이전 결과를 재사용합니다.
+    budget(ErrorBudget): 수집 1회에서 공유하는 실패 허용 횟수 (재시도를 모두 실패하면 예외)
+    반환값: (발견된 li 개수, 상품 리스트, 마지막 페이지 번호 - 1페이지에서만, 모르면 None)
+    """
+    if state is None:
+        return parse_page(fetch_list_page(session, cat_id, page, budget), cat_name, page)
+
+    res = get_with_retry(session, list_page_url(cat_id, page), budget, check_login=True, headers=state.request_headers(cat_id, page))
+    cached = state.resolve(cat_name, cat_id, page, res)
+    if cached is not None:
+        return cached
+
+    item_count, products, last_page = parse_page(decode_response(res), cat_name, page)
+    state.update(cat_id, page, res, item_count, products, last_page)
+    return item_count, products, last_page
+
+def plan_pages(cat_name, last_page, max_pages):
+    """
+    첫 페이지의 페이지네이션으로 수집할 마지막 페이지를 정합니다.
+    max_pages보다 많으면 경고 후 잘라냅니다.
+    """
+    if last_page > max_pages:
+        print(f"[경고] {cat_name}: 전체 {last_page}페이지 중 {max_pages}페이지까지만 수집합니다. (--max-pages로 조정)")
+        return max_pages
+    return last_page
+
+def scrape_category(session, cat_name, cat_id, state=None, max_pages=MAX_PAGES, progress=None, budget=None):
     products = []
     page = 1
+    end_page = None # 페이지네이션으로 확인한 마지막 페이지 (모르면 빈 페이지가 나올 때까지 진행)
     
     while True:
-        url = f"https://fixcon.co.kr/product/list.html?cate_no={cat_id}&page={page}"
         print(f"[*] 수집 중: {cat_name} (ID: {cat_id}) - {page}페이지")
         
-        res = session.get(url)
-        res.encoding = res.apparent_encoding
-        soup = BeautifulSoup(res.text, "html.parser")
-        
-        # Cafe24 상품 리스트 선택자
-        items = soup.select("ul.prdList > li") or soup.select(".xans-product-listnormal > li")
-        
-        if not items:
-            # xans-record- 클래스로 재시도
-            items = soup.select("li.xans-record-")
+        item_count, page_products, last_page = load_list_page(session, cat_name, cat_id, page, state, budget)
             
-        if not items:
+        if not item_count:
             print(f"    - 더 이상 상품이 없습니다. (총 {len(products)}개 수집 완료)")
             break
             
-        print(f"    - {len(items)}개 상품 발견 (현재 페이지)")
-        
-        for item in items:
-            # 1. 이름
-            name_el = item.select_one(".name a") or item.select_one(".pname")
-            if name_el:
-                name = name_el.text.replace("상품명 :", "").strip()
-            else:
-                continue # 이름 없으면 스킵
-
-            # 2. 가격
-            price = "Unknown"
-            
-            # [Fix] scraper_requests.py에서 검증된 텍스트 분석 로직만 사용
-            # (.price 클래스 등은 비어있거나 부정확할 수 있음)
-            desc_el = item.select_one(".description")
-            if desc_el:
-                lines = desc_el.get_text(separator="\n").split("\n")
-                for line in lines:
-                    val = line.strip()
-                    # '원'으로 끝나고 숫자가 포함된 경우 (예: 42,000원)
-                    if val.endswith("원") and any(c.isdigit() for c in val):
-                        price = val
-                        break
-            
-            # print(f"    - 상품: {name} / 가격: {price}") # 디버그 출력 (너무 많아서 주석)
-            
-            # 품절 여부 (아이콘 등 확인)
-            status = "판매중"
-            if item.select("img[alt='품절']"):
-                status = "품절"
-                
-            # [New] 이미지 스크래핑
-            img_url = ""
-            img_el = item.select_one(".thumbnail img")
-            if img_el:
-                img_url = img_el.get("src")
-                if img_url:
-                    if img_url.startswith("//"):
-                        img_url = f"https:{img_url}"
-                    elif img_url.startswith("/"):
-                        img_url = f"https://fixcon.co.kr{img_url}"
-
-            products.append({
-                "category": cat_name,
-                "name": name,
-                "price": price,
-                "status": status,
-                "url": f"https://fixcon.co.kr{name_el['href']}" if name_el else "",
-                "img_url": img_url # [New] 이미지 URL 추가
-            })
+        print(f"    - {item_count}개 상품 발견 (현재 페이지)")
+        products.extend(page_products)
+        if progress is not None:
+            progress.page_done(cat_name, page, len(page_products))
+
+        if last_page:
+            end_page = plan_pages(cat_name, last_page, max_pages)
+            print(f"    - 페이지네이션 확인: 전체 {last_page}페이지")
+
+        # [Optimization] 마지막 페이지를 알면 빈 페이지 확인 요청 없이 종료
+        if end_page and page >= end_page:
+            print(f"    - 마지막 페이지 도달 (총 {len(products)}개 수집 완료)")
+            break
             
+        # 안전장치: 페이지네이션을 못 찾은 경우 최대 페이지까지만
+        if page >= max_pages:
+            print(f"[경고] {cat_name}: 최대 {max_pages}페이지 도달, 이후 페이지는 수집되지 않았을 수 있습니다.")
+            break
+
         page += 1
         time.sleep(0.5) # 페이지 간 딜레이
-        
-        # 안전장치: 최대 30페이지까지만
-        if page > 30:
-            print("[-] 최대 페이지 도달")
-            break
             
+    if progress is not None:
+        progress.category_done(cat_name, products)
     return products
 
-def main():
-    # 1. 설정 로드
-    secrets = load_secrets()
-    if not secrets.get("FIXCON_ID") or not secrets.get("FIXCON_PW"):
-        print("[Fatal] secrets.json에 아이디/비번이 없습니다.")
-        sys.exit(1)
+def _mount_pool(session, pool_size):
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
 
-    # 2. 세션 시작 및 로그인
+def make_session(pool_size=max(CRAWL_WORKERS, CRAWL_PER_HOST)):
+    """수집용 세션 (User-Agent + 워커 수만큼 커넥션을 담는 연결 풀을 생성 시 한 번만 장착)"""
     session = requests.Session()
-    session.headers.update({
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    })
+    session.headers.update({"User-Agent": USER_AGENT})
+    _mount_pool(session, pool_size)
+    return session
+
+def ensure_pool_size(session, pool_size):
+    """
+    [Fix] 세션의 연결 풀이 pool_size보다 작을 때만 새 어댑터로 교체하고 이전 어댑터는 닫음
+    (수집할 때마다 어댑터를 새로 장착하면 캐시된 앱 세션에 연결 풀이 계속 쌓임)
+    """
+    old = [session.get_adapter(prefix) for prefix in ("https://", "http://")]
+    if all(getattr(adapter, "_pool_maxsize", 0) >= pool_size for adapter in old):
+        return
+    _mount_pool(session, pool_size)
+    for adapter in {id(a): a for a in old}.values():
+        adapter.close()
+
+class RateLimiter:
+    """전체 워커가 공유하는 초당 요청 수 제한 (요청 간 최소 간격 보장)"""
+    def __init__(self, rps):
+        self.interval = 1.0 / rps if rps and rps > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_at = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_at, now)
+            self.next_at = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+class HostLimiter:
+    """호스트별 동시 요청 수 제한"""
+    def __init__(self, per_host):
+        self.per_host = max(1, per_host)
+        self.lock = threading.Lock()
+        self.semaphores = {}
+
+    def slot(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            if host not in self.semaphores:
+                self.semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self.semaphores[host]
+
+def scrape_categories_concurrent(session, categories, workers=CRAWL_WORKERS, rps=CRAWL_RPS, per_host=CRAWL_PER_HOST, state=None, max_pages=MAX_PAGES, progress=None, budget=None):
+    """
+    여러 카테고리를 워커 풀로 동시에 수집합니다. (로그인 세션/쿠키 공유)
+    첫 페이지의 페이지네이션으로 전체 페이지 수를 알면 나머지 페이지를 한꺼번에 예약하고,
+    모르면 이전 페이지에 상품이 있을 때만 다음 페이지를 예약합니다.
+    결과 순서는 순차 크롤러와 동일합니다. 카테고리의 모든 페이지가 끝나면 progress에 바로 알립니다.
+    재시도 후에도 실패한 페이지가 있는 카테고리는 실패로 보고 결과에서 제외합니다. (일부 페이지만 저장하지 않음)
+    반환값: {카테고리명: 상품 리스트} (categories 순서 유지, 성공한 카테고리만)
+    """
+    limiter = RateLimiter(rps)
+    host_limiter = HostLimiter(per_host)
     
-    if not login_fixcon(session, secrets["FIXCON_ID"], secrets["FIXCON_PW"]):
-        sys.exit(1)
+    # 워커 수만큼 커넥션을 재사용할 수 있도록 풀 크기 확장 (make_session으로 만든 세션은 이미 충분)
+    ensure_pool_size(session, max(workers, per_host))
+
+    pages = {cat_name: {} for cat_name in categories}
+    planned = set() # 페이지네이션으로 전체 페이지를 예약한 카테고리
+    inflight = {cat_name: 0 for cat_name in categories} # 카테고리별 진행 중인 페이지 요청 수
+    failed = set()
+
+    def ordered_products(cat_name):
+        return [p for page in sorted(pages[cat_name]) for p in pages[cat_name][page]]
+
+    def fetch_and_parse(cat_name, cat_id, page):
+        limiter.wait()
+        with host_limiter.slot(list_page_url(cat_id, page)):
+            return load_list_page(session, cat_name, cat_id, page, state, budget)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+
+        def submit(cat_name, cat_id, page):
+            inflight[cat_name] += 1
+            pending[pool.submit(fetch_and_parse, cat_name, cat_id, page)] = (cat_name, cat_id, page)
+
+        def handle(cat_name, cat_id, page, item_count, page_products, last_page):
+            if not item_count:
+                total = sum(len(p) for p in pages[cat_name].values())
+                print(f"    - {cat_name}: {page}페이지에 상품 없음 (현재 {total}개)")
+                return
+
+            print(f"    - {cat_name} {page}페이지: {item_count}개 상품 발견")
+            pages[cat_name][page] = page_products
+            if progress is not None:
+                progress.page_done(cat_name, page, len(page_products))
+
+            if last_page:
+                # [Optimization] 전체 페이지 수를 알면 남은 페이지를 병렬로 한 번에 예약
+                planned.add(cat_name)
+                end_page = plan_pages(cat_name, last_page, max_pages)
+                for next_page in range(2, end_page + 1):
+                    submit(cat_name, cat_id, next_page)
+                return
+
+            if cat_name in planned:
+                return
+            if page >= max_pages:
+                print(f"[경고] {cat_name}: 최대 {max_pages}페이지 도달, 이후 페이지는 수집되지 않았을 수 있습니다.")
+                return
+            submit(cat_name, cat_id, page + 1)
+
+        for cat_name, cat_id in categories.items():
+            print(f"[*] 수집 시작: {cat_name} (ID: {cat_id})")
+            submit(cat_name, cat_id, 1)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                cat_name, cat_id, page = pending.pop(fut)
+                inflight[cat_name] -= 1
+                if cat_name in failed:
+                    continue
+                try:
+                    page_result = fut.result()
+                except Exception as e:
+                    print(f"[-] {cat_name} {page}페이지 수집 실패 (카테고리 제외): {e}")
+                    failed.add(cat_name)
+                    continue
+                handle(cat_name, cat_id, page, *page_result)
+
+                # 이 카테고리에 남은 요청이 없으면 완료 -> 저장소에 먼저 기록할 수 있도록 알림
+                if not inflight[cat_name] and progress is not None:
+                    progress.category_done(cat_name, ordered_products(cat_name))
+
+    # 순차 크롤러와 동일한 순서로 정렬 (카테고리 순서 -> 페이지 순서)
+    results = {}
+    for cat_name in categories:
+        if cat_name in failed:
+            continue
+        results[cat_name] = ordered_products(cat_name)
+        print(f"    - {cat_name}: 총 {len(results[cat_name])}개 수집 완료")
+    return results
+
+def get_runs_worksheet(sh):
+    """수집 회차(하트비트) 시트를 가져오고, 없으면 생성합니다."""
+    try:
+        return sh.worksheet(RUNS_SHEET_NAME)
+    except gspread.WorksheetNotFound:
+        ws = sh.add_worksheet(title=RUNS_SHEET_NAME, rows=1000, cols=len(RUNS_HEADER))
+        ws.update([RUNS_HEADER], "A1:D1")
+        return ws
+
+def save_to_sheet(sh, all_data, timestamp, crawled_categories, mode=SHEET_WRITE_MODE):
+    """
+    수집 결과를 시트에 기록합니다.
+    - snapshot: 전체 상품을 매번 추가 (기존 방식)
+    - delta: 이전 상태와 비교해 신규/가격·상태 변경/목록 제외 상품만 추가
+    두 모드 모두 runs 시트에 회차 1행을 남기며, 앱은 이를 이용해 회차별 스냅샷을 복원합니다.
+    """
+    ws = sh.sheet1
+    
+    # [Fix] 헤더 강제 업데이트 (컬럼 추가 반영)
+    ws.update([SHEET_HEADER], "A1:G1")
+    runs_ws = get_runs_worksheet(sh)
+
+    if mode == "delta":
+        runs = runs_ws.get_all_records()
+        last_run = str(runs[-1]["수집일시"]) if runs else None
+        prev_state = load_state(last_run)
+        if prev_state is None:
+            # 로컬 상태가 없거나 오래됨 -> 시트 전체에서 한 번 복원
+            print("[*] 시트에서 마지막 상품 상태 복원 중...")
+            prev_state = latest_state(ws.get_all_records(), runs)
+        records, new_state = diff_products(prev_state, all_data, timestamp, set(crawled_categories))
+        print(f"[*] 변경 감지: {len(records)}개 (전체 {len(all_data)}개 중)")
+    else:
+        records = [product_to_record(d, timestamp) for d in all_data]
+
+    rows_to_add = [[r[h] for h in SHEET_HEADER] for r in records]
+    if rows_to_add:
+        ws.append_rows(rows_to_add)
+        print(f"[+] {len(rows_to_add)}개 행 추가 완료!")
+    else:
+        print("[-] 추가할 데이터가 없습니다.")
+
+    # 하트비트: 변경이 없어도 이 시점에 수집했음을 기록
+    runs_ws.append_row([timestamp, len(all_data), len(rows_to_add), mode])
+    if mode == "delta":
+        save_state(new_state, timestamp)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="픽스콘 단가표 수집기")
+    parser.add_argument("--engine", choices=["threads", "async"], default="threads", help="수집 엔진 (threads: requests.Session, async: asyncio/httpx)")
+    parser.add_argument("--parser", choices=["lxml", "bs4"], default=PARSER_BACKEND, help="목록 페이지 파서 백엔드")
+    parser.add_argument("--incremental", action="store_true", help="증분 수집 (ETag/Last-Modified/본문 해시로 변경 없는 페이지 재사용)")
+    parser.add_argument("--max-pages", type=int, default=MAX_PAGES, help="카테고리당 최대 수집 페이지 수")
+    parser.add_argument("--store", choices=["parquet", "sqlite"], default=STORE_BACKEND, help="로컬 가격 저장소 백엔드")
+    parser.add_argument("--no-sheet-sync", dest="sheet_sync", action="store_false", help="구글 시트 미러 동기화 생략")
+    parser.add_argument("--write-mode", choices=["delta", "snapshot"], default=SHEET_WRITE_MODE, help="시트 기록 방식")
+    parser.add_argument("--workers", type=int, default=CRAWL_WORKERS, help="동시 수집 워커 수 (1: 순차 수집)")
+    parser.add_argument("--rps", type=float, default=CRAWL_RPS, help="전체 초당 요청 수 제한")
+    parser.add_argument("--per-host", type=int, default=CRAWL_PER_HOST, help="호스트당 동시 요청 수 제한")
+    parser.add_argument("--error-budget", type=int, default=ERROR_BUDGET, help="수집 1회에서 허용하는 실패 요청 수 (초과 시 남은 카테고리는 실패 처리)")
+    parser.add_argument("--daemon", action="store_true", help="스케줄러 모드 (DAILY_SCHEDULE 시각마다 수집, 놓친 회차는 시작 시 따라잡음)")
+    parser.add_argument("--jitter", type=int, default=SCHEDULE_JITTER, help="스케줄러 모드 예정 시각별 최대 무작위 지연(초)")
+    return parser.parse_args(argv)
+
+class CrawlConfig:
+    """
+    수집 1회 설정. CLI 인자(parse_args)와 같은 항목이며, 앱에서는 직접 만들어 run_crawl에 넘깁니다.
+    session: 재사용할 requests.Session (앱의 캐시된 세션 등, 없으면 새로 생성 / threads 엔진 전용)
+    """
+    def __init__(self, user_id, user_pw, categories=None, engine="threads", parser=PARSER_BACKEND,
+                 incremental=False, max_pages=MAX_PAGES, workers=CRAWL_WORKERS, rps=CRAWL_RPS,
+                 per_host=CRAWL_PER_HOST, session=None, error_budget=ERROR_BUDGET):
+        self.user_id = user_id
+        self.user_pw = user_pw
+        self.categories = categories if categories is not None else TARGET_CATEGORIES
+        self.engine = engine
+        self.parser = parser
+        self.incremental = incremental
+        self.max_pages = max_pages
+        self.workers = workers
+        self.rps = rps
+        self.per_host = per_host
+        self.session = session
+        self.error_budget = error_budget
+
+    @classmethod
+    def from_args(cls, args, secrets):
+        return cls(secrets["FIXCON_ID"], secrets["FIXCON_PW"], engine=args.engine, parser=args.parser,
+                   incremental=args.incremental, max_pages=args.max_pages, workers=args.workers,
+                   rps=args.rps, per_host=args.per_host, error_budget=args.error_budget)
+
+class CrawlResult:
+    """수집 1회 결과 (run_crawl 반환값)"""
+    def __init__(self, timestamp, products=None, categories=None, success=True, message="", failed=None):
+        self.timestamp = timestamp
+        self.products = products or []
+        self.categories = categories or [] # 이번에 수집한 카테고리 (delta 기록 시 '목록 제외' 판단용)
+        self.failed = failed or [] # 재시도 후에도 실패해 저장하지 않은 카테고리
+        self.success = success
+        self.message = message
+
+class StoreSink:
+    """
+    로컬 가격 저장소에 기록 (1차 저장소, 앱은 여기서 읽음)
+    카테고리가 끝날 때마다 write_category로 먼저 기록하고, write에서는 남은 카테고리만 기록
+    """
+    def __init__(self, backend=STORE_BACKEND):
+        self.backend = backend
+        self.written = set() # (수집일시, 카테고리)
+
+    def write_category(self, timestamp, cat_name, products):
+        store = get_store(self.backend)
+        store.append(products_to_frame(products, timestamp), part=cat_name)
+        self.written.add((timestamp, cat_name))
+        print(f"[+] 로컬 저장소({self.backend})에 {cat_name} {len(products)}개 저장 완료")
+
+    def write(self, result):
+        try:
+            rest = [p for p in result.products if (result.timestamp, p["category"]) not in self.written]
+            if rest:
+                store = get_store(self.backend)
+                store.append(products_to_frame(rest, result.timestamp))
+            print(f"[+] 로컬 저장소({self.backend})에 {len(result.products)}개 저장 완료")
+        except Exception as e:
+            print(f"[-] 로컬 저장소 저장 실패: {e}")
+
+class SheetSink:
+    """구글 시트 미러 동기화 (gc: 이미 인증된 gspread 클라이언트, 없으면 새로 인증)"""
+    def __init__(self, gc=None, mode=SHEET_WRITE_MODE):
+        self.gc = gc
+        self.mode = mode
+
+    def write(self, result):
+        try:
+            print("[*] 구글 시트에 저장 중...")
+            gc = self.gc or get_gsheet_client()
+            sh = gc.open_by_key(SPREADSHEET_KEY)
+            save_to_sheet(sh, result.products, result.timestamp, result.categories, mode=self.mode)
+        except Exception as e:
+            print(f"[-] 구글 시트 저장 실패: {e}")
+
+def run_crawl(config, sinks=(), listener=None):
+    """
+    로그인부터 수집, 저장까지 한 번 실행합니다. (CLI와 앱이 같은 경로 사용)
+    sinks: write(result)를 가진 저장 대상 목록 (StoreSink, SheetSink 등)
+           write_category(timestamp, cat_name, products)가 있으면 카테고리가 끝날 때마다 먼저 기록
+    listener: 진행 이벤트(dict)를 받을 함수 (crawl_progress.CrawlProgress 참고)
+    반환값: CrawlResult (로그인 실패 시 success=False)
+    """
+    set_parser_backend(config.parser)
 
-    # 3. 데이터 수집
-    all_data = []
     # [Fix] KST Timezone check
     kst = datetime.timezone(datetime.timedelta(hours=9))
     timestamp = datetime.datetime.now(kst).strftime("%Y-%m-%d %H:%M:%S")
-    
-    for cat_name, cat_id in TARGET_CATEGORIES.items():
-        items = scrape_category(session, cat_name, cat_id)
+
+    # [New] 카테고리 단위 저장: 전체 수집이 끝나기 전에도 완료된 카테고리는 바로 저장소에 반영
+    def push_category(cat_name, products):
+        for sink in sinks:
+            if hasattr(sink, "write_category"):
+                sink.write_category(timestamp, cat_name, products)
+
+    progress = CrawlProgress(config.categories, listener, on_category=push_category)
+
+    def finish(result):
+        # 상태 파일 갱신 (앱은 전체 데이터 대신 이 파일로 최신 여부를 판단)
+        try:
+            record_crawl(result, config.categories)
+        except Exception as e:
+            print(f"[-] 수집 상태 파일 저장 실패: {e}")
+        return result
+
+    # [New] 증분 수집: 변경 없는 페이지는 조건부 요청/본문 해시로 이전 결과 재사용
+    state = CrawlState() if config.incremental else None
+    # [Fix] 실패 요청 허용 횟수 (사이트 장애 시 재시도를 끝없이 반복하지 않고 남은 카테고리를 실패 처리)
+    budget = ErrorBudget(config.error_budget)
+
+    # 세션 시작 및 로그인 + 데이터 수집
+    if config.engine == "async":
+        # [New] asyncio/httpx 엔진 (로그인부터 수집까지 비동기로 처리)
+        from scraper_async import run_async_crawl
+        results = run_async_crawl(config.user_id, config.user_pw, config.categories, concurrency=config.workers, rps=config.rps, state=state, max_pages=config.max_pages, progress=progress, budget=budget)
+        if results is None:
+            return finish(CrawlResult(timestamp, success=False, message="로그인 실패"))
+    else:
+        session = config.session
+        if session is None:
+            session = make_session(max(config.workers, config.per_host))
+        
+        if not ensure_login(session, config.user_id, config.user_pw):
+            return finish(CrawlResult(timestamp, success=False, message="로그인 실패"))
+
+        if config.workers > 1:
+            # [Optimization] 워커 풀로 전체 카테고리 동시 수집 (결과 순서는 순차 수집과 동일)
+            results = scrape_categories_concurrent(session, config.categories, workers=config.workers, rps=config.rps, per_host=config.per_host, state=state, max_pages=config.max_pages, progress=progress, budget=budget)
+        else:
+            results = {}
+            for cat_name, cat_id in config.categories.items():
+                try:
+                    results[cat_name] = scrape_category(session, cat_name, cat_id, state, max_pages=config.max_pages, progress=progress, budget=budget)
+                except Exception as e:
+                    # [Fix] 한 카테고리가 실패해도 나머지는 계속 수집/저장
+                    print(f"[-] {cat_name} 수집 실패 (카테고리 제외): {e}")
+                time.sleep(1) # 부하 방지
+
+    if state is not None:
+        state.save()
+        print(f"[*] 증분 수집 결과: {state.summary()}")
+
+    # 수집 결과 정리
+    all_data = []
+    for cat_name, items in results.items():
         for item in items:
             item["timestamp"] = timestamp
             all_data.append(item)
-        time.sleep(1) # 부하 방지
         
-    print(f"[*] 총 {len(all_data)}개 데이터 수집 완료")
+    failed = [cat_name for cat_name in config.categories if cat_name not in results]
+    message = f"총 {len(all_data)}개 데이터 수집 완료"
+    if failed:
+        message += f" (실패: {', '.join(failed)})"
+    print(f"[*] {message}")
+    if not results:
+        return finish(CrawlResult(timestamp, success=False, message=f"모든 카테고리 수집 실패: {', '.join(failed)}", failed=failed))
+    result = CrawlResult(timestamp, all_data, list(results), message=message, failed=failed)
 
-    # 4. 구글 시트 저장
-    try:
-        print("[*] 구글 시트에 저장 중...")
-        gc = get_gsheet_client()
-        sh = gc.open_by_key(SPREADSHEET_KEY)
-        ws = sh.sheet1
-        
-        # [Fix] 헤더 강제 업데이트 (컬럼 추가 반영)
-        header = ["수집일시", "카테고리", "상품명", "가격", "상태", "URL", "이미지"]
-        ws.update([header], "A1:G1")
-            
-        # 데이터 변환 (Dict -> List)
-        rows_to_add = []
-        for d in all_data:
-            rows_to_add.append([
-                d["timestamp"],
-                d["category"],
-                d["name"],
-                d["price"],
-                d["status"],
-                d["url"],
-                d.get("img_url", "") # [New] 이미지 URL 저장
-            ])
-            
-        if rows_to_add:
-            ws.append_rows(rows_to_add)
-            print(f"[+] {len(rows_to_add)}개 행 추가 완료!")
-        else:
-            print("[-] 추가할 데이터가 없습니다.")
-            
-    except Exception as e:
-        print(f"[-] 구글 시트 저장 실패: {e}")
+    for sink in sinks:
+        sink.write(result)
+    return finish(result)
+
+def main(argv=None):
+    # [설정] Windows 콘솔 한글 출력
+    sys.stdout.reconfigure(encoding='utf-8')
+    args = parse_args(argv)
+
+    # 1. 설정 로드
+    secrets = load_secrets()
+    if not secrets.get("FIXCON_ID") or not secrets.get("FIXCON_PW"):
+        print("[Fatal] secrets.json에 아이디/비번이 없습니다.")
+        sys.exit(1)
+
+    # 2. 저장 대상: 로컬 저장소(1차) + 구글 시트 미러
+    sinks = [StoreSink(args.store)]
+    if args.sheet_sync:
+        sinks.append(SheetSink(mode=args.write_mode))
+    else:
+        print("[*] 구글 시트 동기화 생략 (--no-sheet-sync)")
+
+    # 3. 수집 및 저장
+    config = CrawlConfig.from_args(args, secrets)
+    if args.daemon:
+        # [New] 상주 스케줄러: 페이지 접속 여부와 관계없이 정해진 시각에 수집
+        def crawl(categories):
+            config.categories = categories
+            run_crawl(config, sinks)
+        try:
+            run_scheduler(crawl, TARGET_CATEGORIES, DAILY_SCHEDULE, jitter=args.jitter)
+        except KeyboardInterrupt:
+            print("[*] 스케줄러 종료")
+        return
+
+    result = run_crawl(config, sinks)
+    if not result.success:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
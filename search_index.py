@@ -0,0 +1,158 @@
+import re
+import threading
+from collections import Counter, defaultdict
+
+import pandas as pd
+
+from classifier import MODEL_MAPPING
+
+# [설정] 상품명 검색 (앱의 부품 검색 탭 상단 검색창에서 사용)
+# 한글은 띄어쓰기/조사가 제각각이라 단어 대신 글자 2-gram으로 색인 -> 부분 입력/오타 일부도 매칭
+NGRAM = 2
+MIN_SCORE = 0.6 # 검색어 n-gram 중 이 비율 이상 포함해야 결과에 포함
+EXACT_BONUS = 0.2 # 검색어가 그대로(연속으로) 포함되면 가산
+MODEL_BONUS = 1.0 # 검색어가 모델 별칭과 정확히 일치하면 그 모델 상품 가산
+SEARCH_LIMIT = 60
+
+# 한글 입력 -> 상품명/모델명 표기 (픽스콘 상품명은 영문 표기: 15Pro-Max, 16+ 등)
+KOREAN_ALIASES = [
+    ("아이폰", "iphone"), ("프로맥스", "promax"), ("프맥", "promax"), ("맥스", "max"), ("프로", "pro"),
+    ("플러스", "plus"), ("미니", "mini"), ("에어", "air"),
+]
+_STRIP_RE = re.compile(r"[^0-9a-z가-힣]+")
+
+def normalize(text):
+    """소문자 + 한글 별칭 치환 + 공백/기호 제거 ("15 프로-맥스" -> "15promax", "16+" -> "16plus")"""
+    text = str(text).lower().replace("+", "plus")
+    for ko, en in KOREAN_ALIASES:
+        text = text.replace(ko, en)
+    return _STRIP_RE.sub("", text)
+
+def ngrams(text):
+    if len(text) <= NGRAM:
+        return {text} if text else set()
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+def index_grams(text):
+    """색인용: n-gram + 글자 1개짜리 (한 글자 검색어 "x", "8"도 posting으로 조회)"""
+    return ngrams(text) | set(text)
+
+def _model_aliases():
+    """MODEL_MAPPING의 패턴/표시명을 정규화한 별칭 -> 모델명 ("15promax", "iphone15promax" -> iPhone 15 Pro Max)"""
+    aliases = {}
+    for pattern, display in MODEL_MAPPING:
+        for alias in (normalize(pattern), normalize(display), normalize(display.replace("iPhone ", ""))):
+            aliases.setdefault(alias, display)
+    return aliases
+
+MODEL_ALIASES = _model_aliases()
+
+def _label(value):
+    """모델/부품명 (분류되지 않은 상품은 None -> 빈 문자열)"""
+    return value if isinstance(value, str) else ""
+
+def _price(row):
+    """정렬용 정수 가격 (가격 문구만 있는 상품은 0 -> 가격 있는 상품 뒤)"""
+    price = row["가격_숫자"]
+    return int(price) if pd.notna(price) else 0
+
+class SearchIndex:
+    """
+    최신 회차 전체 상품의 n-gram 역색인 (검색 시 DataFrame을 훑지 않고 posting 목록만 조회)
+    문서 키는 (카테고리, 상품명) -> 수집할 때마다 새로 생긴 상품만 색인하고 사라진 상품만 제거
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = None
+        self.keys = {} # (카테고리, 상품명) -> 문서 번호
+        self.docs = {} # 문서 번호 -> 상품 행 dict (part_index 행 형식)
+        self.texts = {} # 문서 번호 -> 정규화된 색인 문자열
+        self.postings = defaultdict(set) # n-gram/글자 -> 문서 번호 집합
+        self.model_docs = defaultdict(set) # 모델명 -> 문서 번호 집합 (한 글자 모델 별칭 검색용)
+        self._next_id = 0
+
+    def update(self, version, rows):
+        """
+        상품 행 목록(part_index.build_search_rows, 가격/부품 없는 상품 포함)으로 색인을 갱신합니다.
+        같은 버전이면 아무것도 안 함, 같은 (카테고리, 상품명)이 여러 번 있으면 처음 행 사용
+        """
+        with self.lock:
+            if version == self.version:
+                return False
+            latest = {}
+            for row in rows:
+                latest.setdefault((row["카테고리"], row["상품명"]), row)
+            rows = latest
+            for key in [k for k in self.keys if k not in rows]:
+                doc_id = self.keys.pop(key)
+                for gram in index_grams(self.texts.pop(doc_id)):
+                    self.postings[gram].discard(doc_id)
+                self.model_docs[_label(self.docs.pop(doc_id)["모델"])].discard(doc_id)
+            for key, row in rows.items():
+                doc_id = self.keys.get(key)
+                if doc_id is None:
+                    doc_id = self._next_id
+                    self._next_id += 1
+                    self.keys[key] = doc_id
+                    # 상품명 + 분류된 모델/부품명까지 색인 ("15프로 액정"처럼 상품명에 없는 표기도 매칭)
+                    text = normalize(f"{row['상품명']} {_label(row['모델'])} {_label(row['부품'])}")
+                    self.texts[doc_id] = text
+                    for gram in index_grams(text):
+                        self.postings[gram].add(doc_id)
+                    self.model_docs[_label(row["모델"])].add(doc_id)
+                self.docs[doc_id] = row # 가격/상태는 매 회차 최신 값으로 교체
+            self.version = version
+            return True
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """
+        검색어를 공백으로 나눈 단어마다 n-gram 일치 비율을 구해 합산한 점수순으로 반환합니다.
+        (단어 일부만 입력/긴 단어의 한 글자 오타도 MIN_SCORE 이상이면 포함, 모델 별칭과 정확히 같으면 가산)
+        """
+        terms = [t for t in (normalize(w) for w in str(query).split()) if t]
+        if not terms:
+            return []
+        with self.lock:
+            scores = Counter()
+            matched = Counter() # 문서별 매칭된 단어 수
+            for term in terms:
+                grams = ngrams(term)
+                model = MODEL_ALIASES.get(term)
+                hits = Counter()
+                if len(term) < NGRAM:
+                    # [Fix] 한 글자 검색어: 모델 별칭("x", "8")이면 그 모델 상품, 아니면 그 글자가 들어간 상품
+                    # (글자 posting만 쓰면 "x"가 "promax"까지 잡으므로 모델 별칭을 우선)
+                    candidates = self.model_docs.get(model, ()) if model is not None else self.postings.get(term, ())
+                    hits.update(candidates)
+                else:
+                    for gram in grams:
+                        for doc_id in self.postings.get(gram, ()):
+                            hits[doc_id] += 1
+                for doc_id, count in hits.items():
+                    ratio = count / len(grams)
+                    if ratio < MIN_SCORE:
+                        continue
+                    score = ratio
+                    if term in self.texts[doc_id]:
+                        score += EXACT_BONUS
+                    if model is not None and self.docs[doc_id]["모델"] == model:
+                        score += MODEL_BONUS
+                    scores[doc_id] += score
+                    matched[doc_id] += 1
+            # 모든 단어가 (최소 비율 이상) 매칭된 상품만, 점수 -> 가격 높은 순
+            ranked = sorted(
+                (doc_id for doc_id, count in matched.items() if count == len(terms)),
+                key=lambda doc_id: (-scores[doc_id], -_price(self.docs[doc_id])),
+            )
+            return [self.docs[doc_id] for doc_id in ranked[:limit]]
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+def get_search_index():
+    """프로세스당 하나의 검색 색인을 공유합니다. (Streamlit 세션 간 공유)"""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = SearchIndex()
+        return _default_index
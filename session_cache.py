@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from http.cookiejar import Cookie
+
+# [설정] 로그인 세션 캐시 (scraper_main / find_categories / debug_categories 공용)
+BASE_DIR = os.path.dirname(__file__)
+SESSION_CACHE_PATH = os.path.join(BASE_DIR, ".fixcon_session.json")
+SESSION_TTL = 6 * 60 * 60 # 6시간 후 만료 (만료 시 전체 로그인)
+
+def _account_key(user_id):
+    # 파일에 아이디를 평문으로 남기지 않도록 해시만 저장
+    return hashlib.sha256(user_id.encode("utf-8")).hexdigest()
+
+def _cookie_to_dict(c):
+    return {
+        "name": c.name,
+        "value": c.value,
+        "domain": c.domain,
+        "path": c.path,
+        "secure": c.secure,
+        "expires": c.expires,
+    }
+
+def _dict_to_cookie(d):
+    domain = d.get("domain", "")
+    return Cookie(
+        version=0, name=d["name"], value=d["value"],
+        port=None, port_specified=False,
+        domain=domain, domain_specified=bool(domain), domain_initial_dot=domain.startswith("."),
+        path=d.get("path", "/"), path_specified=True,
+        secure=d.get("secure", False), expires=d.get("expires"),
+        discard=False, comment=None, comment_url=None, rest={}
+    )
+
+def save_cookies(jar, user_id, path=SESSION_CACHE_PATH):
+    """
+    로그인된 쿠키를 소유자만 읽을 수 있는 파일(0600)에 저장합니다.
+    jar: requests.Session.cookies 또는 httpx.AsyncClient.cookies.jar (http.cookiejar.CookieJar)
+    """
+    data = {
+        "account": _account_key(user_id),
+        "saved_at": time.time(),
+        "expires_at": time.time() + SESSION_TTL,
+        "cookies": [_cookie_to_dict(c) for c in jar],
+    }
+    # [Fix] mkstemp는 항상 새 파일을 0600으로 생성 (이전에 남은 .tmp 파일의 권한을 그대로 쓰지 않도록)
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+def load_cookies(jar, user_id, path=SESSION_CACHE_PATH):
+    """
+    만료되지 않은 캐시가 있으면 jar에 쿠키를 채웁니다.
+    반환값: 쿠키 복원 여부 (복원 후 실제 유효성은 호출 측에서 한 번 확인)
+    """
+    if not os.path.exists(path):
+        return False
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"[-] 세션 캐시 읽기 실패: {e}")
+        return False
+
+    if data.get("account") != _account_key(user_id):
+        return False
+    if data.get("expires_at", 0) < time.time():
+        print("[*] 저장된 로그인 세션이 만료되었습니다.")
+        return False
+
+    now = time.time()
+    for d in data.get("cookies", []):
+        if d.get("expires") and d["expires"] < now:
+            continue
+        jar.set_cookie(_dict_to_cookie(d))
+    return True
+
+def clear_session_cache(path=SESSION_CACHE_PATH):
+    if os.path.exists(path):
+        os.remove(path)
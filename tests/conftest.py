@@ -0,0 +1,13 @@
+import os
+import sys
+
+# 저장소 루트의 모듈(scraper_main, list_parser 등)을 그대로 import
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+FIXTURE_DIR = os.path.join(ROOT, "tests", "fixtures")
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
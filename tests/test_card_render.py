@@ -0,0 +1,39 @@
+import time
+
+from card_render import CardRenderCache, render_grid
+
+def row(name, price):
+    return {"상품명": name, "가격": f"{price:,}원", "가격_숫자": price, "가격_VAT포함": price * 11 // 10, "상태": "판매중", "URL": "", "이미지": ""}
+
+PART_INDEX = {
+    ("iPhone 15", "액정"): [row("15 액정", 100000), row("15 액정 (정품)", 150000)],
+    ("iPhone 15", "배터리"): [row("15 배터리", 30000)],
+}
+
+def wait_warm(cache, count, timeout=5):
+    deadline = time.monotonic() + timeout
+    while len(cache.fragments) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(cache.fragments) == count
+
+def test_warmed_version_returns_cached_html():
+    cache = CardRenderCache()
+    assert cache.warm("v1", PART_INDEX)
+    wait_warm(cache, len(PART_INDEX))
+    assert not cache.warm("v1", PART_INDEX) # 같은 버전은 다시 렌더링하지 않음
+
+    key = ("iPhone 15", "액정")
+    # 미리 만든 HTML을 그대로 반환 (넘긴 행은 쓰지 않음)
+    assert cache.get("v1", key, []) == render_grid(PART_INDEX[key])
+
+def test_version_bump_invalidates_fragments():
+    cache = CardRenderCache()
+    cache.warm("v1", PART_INDEX)
+    wait_warm(cache, len(PART_INDEX))
+
+    key = ("iPhone 15", "배터리")
+    new_rows = [row("15 배터리", 35000)]
+    html = cache.get("v2", key, new_rows)
+    assert html == render_grid(new_rows) != render_grid(PART_INDEX[key])
+    assert cache.fragments == {key: html} # 이전 버전 HTML은 통째로 버림
+    assert cache.get("v2", key, []) == html
@@ -0,0 +1,72 @@
+import pytest
+import requests
+
+from category_discovery import HttpCache
+from http_utils import LoginRedirect, UnexpectedStatus
+
+URL = "https://fixcon.co.kr/product/list.html?cate_no=1"
+
+def response(url, status=200, text="", headers=None, final_url=None):
+    res = requests.Response()
+    res.status_code = status
+    res._content = text.encode("utf-8")
+    res.headers.update({"Content-Type": "text/html; charset=utf-8", **(headers or {})})
+    res.url = final_url or url
+    return res
+
+class FakeSession:
+    """응답을 순서대로 돌려주고 받은 요청 헤더를 기록하는 세션"""
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append(kwargs.get("headers") or {})
+        return self.responses.pop(0)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def test_ttl_then_conditional_revalidation(tmp_path, clock):
+    cache = HttpCache(str(tmp_path), ttl=60, clock=clock)
+    session = FakeSession(
+        response(URL, text="<p>v1</p>", headers={"ETag": '"abc"', "Last-Modified": "Thu, 01 Oct 2026 00:00:00 GMT"}),
+        response(URL, status=304),
+        response(URL, text="<p>v2</p>", headers={"ETag": '"def"'}),
+    )
+    assert cache.get(session, URL) == "<p>v1</p>"
+    clock.now += 30
+    assert cache.get(session, URL) == "<p>v1</p>" # TTL 안: 요청 없음
+    assert len(session.requests) == 1
+
+    clock.now += 60
+    assert cache.get(session, URL) == "<p>v1</p>" # 304 -> 캐시 본문 재사용
+    assert session.requests[1] == {"If-None-Match": '"abc"', "If-Modified-Since": "Thu, 01 Oct 2026 00:00:00 GMT"}
+    clock.now += 30
+    assert cache.get(session, URL) == "<p>v1</p>" # 재검증 시각부터 TTL 다시 시작
+    assert len(session.requests) == 2
+
+    clock.now += 60
+    assert cache.get(session, URL) == "<p>v2</p>" # 바뀐 본문은 새로 저장
+    assert cache.stats == {"fresh": 2, "revalidated": 1, "fetched": 2}
+    assert HttpCache(str(tmp_path), ttl=60, clock=clock).get(FakeSession(), URL) == "<p>v2</p>"
+
+@pytest.mark.parametrize("res, error", [
+    (response(URL, status=404), UnexpectedStatus),
+    (response(URL, text="login", final_url="https://fixcon.co.kr/member/login.html"), LoginRedirect),
+    (response(URL, status=304), UnexpectedStatus), # 조건부 요청 없이 받은 304
+])
+def test_error_responses_are_not_cached(tmp_path, clock, res, error):
+    cache = HttpCache(str(tmp_path), ttl=60, clock=clock)
+    with pytest.raises(error):
+        cache.get(FakeSession(res), URL)
+    assert cache.get(FakeSession(response(URL, text="ok")), URL) == "ok"
+    assert cache.stats["fetched"] == 1
@@ -0,0 +1,24 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import as_list, legacy_classify, random_frame
+from classifier import ClassificationCache, classify_models, classify_parts
+
+@pytest.mark.parametrize("seed", range(3))
+def test_vectorized_matches_row_functions(seed):
+    df = random_frame(3000, seed)
+    expected = legacy_classify(df)
+    models = classify_models(df["상품명"], df["카테고리"])
+    parts = classify_parts(df["상품명"], df["카테고리"], models)
+    assert models.tolist() == expected["모델"].tolist()
+    assert as_list(parts) == as_list(expected["부품"])
+
+def test_cache_matches_row_functions(tmp_path):
+    df = random_frame(2000, seed=42)
+    df = pd.concat([df, df.sample(frac=0.5, random_state=1)], ignore_index=True) # 반복되는 상품명
+    expected = legacy_classify(df)
+    path = str(tmp_path / "classify_cache.json")
+    for cache in (ClassificationCache(path), ClassificationCache(path)): # 빈 캐시 -> 파일에서 읽은 캐시
+        models, parts = cache.classify(df["상품명"], df["카테고리"])
+        assert models.tolist() == expected["모델"].tolist()
+        assert as_list(parts) == as_list(expected["부품"])
@@ -0,0 +1,102 @@
+import datetime
+import random
+
+import pytest
+
+from crawl_schedule import (
+    KST, SCHEDULER_RETRY_DELAY, DailySchedule, build_schedules, due_categories,
+    format_status_time, read_status, run_scheduler, write_status,
+)
+
+def at(day, hhmm, second=0):
+    hour, minute = map(int, hhmm.split(":"))
+    return datetime.datetime(2026, 3, day, hour, minute, second, tzinfo=KST)
+
+def status_of(**entries):
+    return {"categories": {name: {key: format_status_time(value) for key, value in entry.items()} for name, entry in entries.items()}}
+
+class StopScheduler(Exception):
+    pass
+
+class FakeClock:
+    """sleep 하면 시간만 앞으로 가는 시계 (until을 넘기면 스케줄러 루프를 끝냄)"""
+    def __init__(self, start, until):
+        self.current = start
+        self.until = until
+
+    def now(self):
+        return self.current
+
+    def sleep(self, seconds):
+        self.current += datetime.timedelta(seconds=seconds)
+        if self.current > self.until:
+            raise StopScheduler()
+
+def test_daily_schedule_fires_across_midnight():
+    schedule = DailySchedule(["23:30", "09:00", "15:00"])
+    assert schedule.previous_fire(at(2, "08:00")) == at(1, "23:30")
+    assert schedule.previous_fire(at(2, "15:00")) == at(2, "15:00")
+    assert schedule.next_fire(at(2, "15:00")) == at(2, "23:30")
+    assert schedule.next_fire(at(2, "23:45")) == at(3, "09:00")
+
+def test_due_categories_per_category_times():
+    schedules = build_schedules(["iPhone", "Galaxy"], {"*": ["10:00"], "iPhone": ["10:00", "15:00"]})
+    status = status_of(iPhone={"last_success": at(2, "10:01")}, Galaxy={"last_success": at(2, "10:01")})
+    assert due_categories(schedules, status, at(2, "14:59")) == []
+    assert due_categories(schedules, status, at(2, "15:05")) == ["iPhone"]
+
+def test_due_categories_catches_up_missed_slot_once():
+    schedules = build_schedules(["iPhone"], {"*": ["10:00"]})
+    # 어제 이후 꺼져 있어서 오늘 10:00 회차를 놓친 경우 -> 한 번만 따라잡음
+    status = status_of(iPhone={"last_success": at(1, "10:01")})
+    assert due_categories(schedules, status, at(2, "18:00")) == ["iPhone"]
+    status = status_of(iPhone={"last_success": at(2, "18:00")})
+    assert due_categories(schedules, status, at(2, "18:01")) == []
+    # 처음 실행(기록 없음)이면 바로 대상
+    assert due_categories(schedules, {}, at(2, "18:00")) == ["iPhone"]
+
+def test_due_categories_waits_retry_delay_after_failure():
+    schedules = build_schedules(["iPhone"], {"*": ["10:00"]})
+    status = status_of(iPhone={"last_success": at(1, "10:01"), "last_attempt": at(2, "10:00")})
+    retry_at = at(2, "10:00") + datetime.timedelta(seconds=SCHEDULER_RETRY_DELAY)
+    assert due_categories(schedules, status, retry_at - datetime.timedelta(seconds=1)) == []
+    assert due_categories(schedules, status, retry_at) == ["iPhone"]
+
+def make_crawl(clock, path, calls, fail_times=0):
+    def crawl(categories):
+        calls.append((clock.now(), sorted(categories)))
+        if len(calls) <= fail_times:
+            raise RuntimeError("boom")
+        status = read_status(path)
+        for cat_name in categories:
+            status.setdefault("categories", {}).setdefault(cat_name, {})["last_success"] = format_status_time(clock.now())
+        write_status(status, path)
+    return crawl
+
+def test_run_scheduler_applies_jitter(tmp_path):
+    path = str(tmp_path / "status.json")
+    write_status(status_of(iPhone={"last_success": at(1, "10:00")}), path)
+    clock = FakeClock(at(2, "09:59", 30), until=at(2, "11:00"))
+    calls = []
+    jitter = 300
+    expected_delay = random.Random(7).uniform(0, jitter)
+    with pytest.raises(StopScheduler):
+        run_scheduler(make_crawl(clock, path, calls), {"iPhone": "1"}, {"*": ["10:00"]},
+                      jitter=jitter, path=path, clock=clock, rng=random.Random(7))
+    assert len(calls) == 1
+    assert calls[0][0] == at(2, "10:00") + datetime.timedelta(seconds=expected_delay)
+    assert read_status(path)["scheduler"]["state"] == "idle"
+
+def test_run_scheduler_retries_after_failure(tmp_path):
+    path = str(tmp_path / "status.json")
+    write_status(status_of(iPhone={"last_success": at(1, "10:00")}), path)
+    clock = FakeClock(at(2, "09:59", 30), until=at(2, "11:00"))
+    calls = []
+    with pytest.raises(StopScheduler):
+        run_scheduler(make_crawl(clock, path, calls, fail_times=1), {"iPhone": "1"}, {"*": ["10:00"]},
+                      path=path, clock=clock)
+    retry_at = at(2, "10:00") + datetime.timedelta(seconds=SCHEDULER_RETRY_DELAY)
+    assert [c[0] for c in calls] == [at(2, "10:00"), retry_at]
+    entry = read_status(path)["categories"]["iPhone"]
+    assert entry["last_attempt"] == format_status_time(at(2, "10:00"))
+    assert entry["last_success"] == format_status_time(retry_at)
@@ -0,0 +1,18 @@
+from delta_log import REMOVED_STATUS, diff_products
+
+def product(category, name, price="10,000원", url=None):
+    return {"category": category, "name": name, "price": price, "status": "판매중",
+            "url": url or f"https://fixcon.co.kr/product/{name}/"}
+
+def test_missing_product_marked_removed():
+    _, state = diff_products({}, [product("A", "p1"), product("A", "p2")], "t1", ["A"])
+    changes, new_state = diff_products(state, [product("A", "p1")], "t2", ["A"])
+    assert [(c["상품명"], c["상태"]) for c in changes] == [("p2", REMOVED_STATUS)]
+    assert len(new_state) == 1
+
+def test_empty_category_keeps_previous_state():
+    # 수집은 했지만 상품이 0개인 카테고리(차단/빈 페이지)는 '목록 제외'로 처리하지 않음
+    _, state = diff_products({}, [product("A", "p1"), product("B", "p2")], "t1", ["A", "B"])
+    changes, new_state = diff_products(state, [product("A", "p1")], "t2", ["A", "B"])
+    assert changes == []
+    assert set(new_state) == set(state)
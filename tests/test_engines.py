@@ -0,0 +1,189 @@
+import hashlib
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import scraper_async
+import scraper_main
+from crawl_state import CrawlState
+
+# 로컬 스텁 서버: 5개 카테고리 x 30페이지, 페이지마다 응답 지연을 줘서 실제 사이트처럼 대기 시간이 생기게 함
+CATEGORIES = {f"Cat{i}": str(100 + i) for i in range(5)}
+PAGES = 30
+ITEMS_PER_PAGE = 12
+LATENCY = 0.01
+MISSING_CATEGORY = "900" # 404 응답
+EXPIRED_CATEGORY = "901" # 로그인 페이지로 리다이렉트
+ETAG_CATEGORY = "902" # ETag를 주고 조건부 요청에 304로 응답
+
+def render_page(cat_id, page):
+    if page > PAGES:
+        return "<html><body><ul class='prdList'></ul></body></html>"
+    items = "".join(
+        f"<li class='xans-record-'><div class='name'><a href='/product/detail.html?product_no={cat_id}{page:02d}{i:02d}'>"
+        f"상품 {cat_id}-{page}-{i}</a></div><div class='description'>{(page * 100 + i) * 10:,}원</div></li>"
+        for i in range(ITEMS_PER_PAGE)
+    )
+    paging = "".join(f"<a href='?cate_no={cat_id}&page={p}'>{p}</a>" for p in (1, PAGES))
+    return f"<html><body><ul class='prdList'>{items}</ul><div class='xans-product-normalpaging'>{paging}</div></body></html>"
+
+class StubHandler(BaseHTTPRequestHandler):
+    # 서버가 동시에 처리 중인 요청 수 (엔진별 동시성은 시간 대신 이 최댓값으로 확인)
+    lock = threading.Lock()
+    inflight = 0
+    peak = 0
+
+    @classmethod
+    def reset_peak(cls):
+        with cls.lock:
+            cls.peak = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.inflight += 1
+            cls.peak = max(cls.peak, cls.inflight)
+        try:
+            self._respond()
+        finally:
+            with cls.lock:
+                cls.inflight -= 1
+
+    def _respond(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path.startswith("/member/login"):
+            body = "<html><body><form id='member_form'></form></body></html>".encode("utf-8")
+        elif query["cate_no"][0] == MISSING_CATEGORY:
+            self.send_error(404)
+            return
+        elif query["cate_no"][0] == EXPIRED_CATEGORY:
+            # 세션이 만료되면 목록 페이지가 로그인 페이지로 리다이렉트됨
+            self.send_response(302)
+            self.send_header("Location", "/member/login.html?noMemberOrder=&returnUrl=%2Fproduct%2Flist.html")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        else:
+            body = render_page(query["cate_no"][0], int(query["page"][0])).encode("utf-8")
+        threading.Event().wait(LATENCY)
+        etag = None
+        if query.get("cate_no", [""])[0] == ETAG_CATEGORY:
+            # 검증자를 주는 카테고리: 같은 ETag로 다시 요청하면 304 (그 외 카테고리는 매번 같은 본문의 200)
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+        self.send_response(200)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+@pytest.fixture(scope="module")
+def stub_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+@pytest.fixture
+def stub_site(stub_url, monkeypatch):
+    def list_page_url(cat_id, page):
+        return f"{stub_url}/product/list.html?cate_no={cat_id}&page={page}"
+
+    async def login_ok(*args):
+        return True
+
+    monkeypatch.setattr(scraper_main, "list_page_url", list_page_url)
+    monkeypatch.setattr(scraper_async, "list_page_url", list_page_url)
+    monkeypatch.setattr(scraper_async, "ensure_login_async", login_ok)
+    # 순차 엔진의 예의상 대기(페이지 0.5초, 카테고리 1초)는 빼고 요청 처리 시간만 비교
+    monkeypatch.setattr(scraper_main, "time", types.SimpleNamespace(sleep=lambda s: None, monotonic=time.monotonic, time=time.time))
+
+def crawl_sequential():
+    session = scraper_main.requests.Session()
+    return {name: scraper_main.scrape_category(session, name, cat_id) for name, cat_id in CATEGORIES.items()}
+
+def crawl_threads():
+    session = scraper_main.requests.Session()
+    return scraper_main.scrape_categories_concurrent(session, CATEGORIES, workers=8, rps=0, per_host=8)
+
+def crawl_async():
+    return scraper_async.run_async_crawl("id", "pw", CATEGORIES, concurrency=8, rps=0)
+
+def timed(crawl):
+    """(결과, 걸린 시간, 서버에서 관찰한 최대 동시 요청 수)"""
+    StubHandler.reset_peak()
+    start = time.perf_counter()
+    results = crawl()
+    return results, time.perf_counter() - start, StubHandler.peak
+
+def test_engines_match_sequential_and_run_concurrently(stub_site, capsys):
+    expected, sequential, sequential_peak = timed(crawl_sequential)
+    assert sum(len(p) for p in expected.values()) == len(CATEGORIES) * PAGES * ITEMS_PER_PAGE
+
+    threads_result, threads, threads_peak = timed(crawl_threads)
+    async_result, async_time, async_peak = timed(crawl_async)
+    assert threads_result == expected
+    assert async_result == expected
+
+    with capsys.disabled():
+        print(f"\n[bench] {len(CATEGORIES)}개 카테고리 x {PAGES}페이지 (응답 지연 {LATENCY * 1000:.0f}ms)")
+        print(f"[bench] sequential {sequential:.2f}s / threads {threads:.2f}s / async {async_time:.2f}s "
+              f"(최대 동시 요청 {sequential_peak} / {threads_peak} / {async_peak})")
+    # 걸린 시간은 CI 부하에 따라 흔들리므로 서버가 실제로 동시에 받은 요청 수로 확인
+    assert sequential_peak == 1
+    assert threads_peak > 1
+    assert async_peak > 1
+
+def test_error_and_login_redirect_pages_fail_the_category(stub_site):
+    categories = {"Cat0": CATEGORIES["Cat0"], "Missing": MISSING_CATEGORY, "Expired": EXPIRED_CATEGORY}
+    session = scraper_main.requests.Session()
+    threads_result = scraper_main.scrape_categories_concurrent(session, categories, workers=4, rps=0, per_host=4)
+    async_result = scraper_async.run_async_crawl("id", "pw", categories, concurrency=4, rps=0)
+    assert list(threads_result) == ["Cat0"]
+    assert list(async_result) == ["Cat0"]
+
+def test_pool_is_mounted_once_per_session():
+    session = scraper_main.make_session(pool_size=16)
+    adapter = session.get_adapter("https://")
+    scraper_main.ensure_pool_size(session, 16)
+    assert session.get_adapter("https://") is adapter
+
+    plain = scraper_main.requests.Session() # 기본 어댑터 풀(10)보다 크게 요청 -> 한 번만 교체
+    scraper_main.ensure_pool_size(plain, 16)
+    sized = plain.get_adapter("https://")
+    assert sized._pool_maxsize == 16 and plain.get_adapter("http://") is sized
+    scraper_main.ensure_pool_size(plain, 16)
+    assert plain.get_adapter("https://") is sized
+
+def test_crawl_state_reuses_unchanged_pages(stub_site, tmp_path):
+    categories = {"Cat0": CATEGORIES["Cat0"], "Tagged": ETAG_CATEGORY}
+    session = scraper_main.requests.Session()
+
+    def crawl(state):
+        return {name: scraper_main.scrape_category(session, name, cat_id, state) for name, cat_id in categories.items()}
+
+    first_state = CrawlState(str(tmp_path / "crawl_state.json"))
+    first = crawl(first_state)
+    assert first_state.stats == {"not_modified": 0, "hash_hit": 0, "parsed": 2 * PAGES}
+    first_state.save()
+
+    # 파일에서 다시 읽은 상태: ETag 카테고리는 304, 나머지는 본문 해시 일치로 파싱 없이 재사용
+    second_state = CrawlState(str(tmp_path / "crawl_state.json"))
+    second = crawl(second_state)
+    assert second == first
+    assert second_state.stats == {"not_modified": PAGES, "hash_hit": PAGES, "parsed": 0}
+    assert second_state.summary().startswith(f"캐시 재사용 {2 * PAGES}페이지")
@@ -0,0 +1,41 @@
+import pandas as pd
+
+from history_diff import HistoryDiffCache, daily_snapshots
+from price_store import concat_frames, products_to_frame
+
+def frame(ts, category, prices):
+    return products_to_frame([{"category": category, "name": name, "price": price, "status": "판매중",
+                               "url": f"https://fixcon.co.kr/{name}"} for name, price in prices.items()],
+                             pd.Timestamp(ts))
+
+def test_partial_run_diff_is_recomputed(tmp_path):
+    path = str(tmp_path / "history_diff_cache.json")
+    day1 = concat_frames([frame("2026-10-01 09:00", "A", {"a": "1,000원"}),
+                          frame("2026-10-01 09:00", "B", {"b": "2,000원"})])
+    # 수집 중: 당일 회차에 A만 저장된 상태
+    partial = concat_frames([day1, frame("2026-10-02 09:00", "A", {"a": "1,000원"})])
+    _, history = HistoryDiffCache(path).build_history(partial)
+    assert history == []
+
+    # B까지 저장된 뒤에는 (파일에서 다시 읽은 캐시라도) 새로 비교해야 함
+    complete = concat_frames([partial, frame("2026-10-02 09:00", "B", {"b": "1,500원"})])
+    cache = HistoryDiffCache(path)
+    _, history = cache.build_history(complete)
+    assert len(history) == 1 and "b" in history[0]["changes"][0]
+    assert len(cache.pairs) == 1
+
+def test_daily_snapshot_uses_last_run_per_category(tmp_path):
+    df = concat_frames([
+        frame("2026-10-01 09:00", "A", {"a": "1,000원"}),
+        frame("2026-10-01 09:00", "B", {"b": "2,000원"}),
+        frame("2026-10-02 09:00", "A", {"a": "1,000원"}),
+        frame("2026-10-02 09:00", "B", {"b": "2,500원"}),
+        # 당일 마지막 회차는 A만 수집 -> B는 같은 날 09시 회차로 비교
+        frame("2026-10-02 15:00", "A", {"a": "900원"}),
+    ])
+    runs = daily_snapshots(df)
+    assert runs[["카테고리", "행수"]].astype(str).values.tolist() == [["A", "1"], ["B", "1"], ["A", "1"], ["B", "1"]]
+    _, history = HistoryDiffCache(str(tmp_path / "history_diff_cache.json")).build_history(df)
+    changes = history[0]["changes"]
+    assert len(changes) == 2
+    assert any("**a**" in c for c in changes) and any("**b**" in c for c in changes)
@@ -0,0 +1,51 @@
+import pytest
+
+from conftest import read_fixture
+from list_parser import LXML_AVAILABLE, parse_last_page_bs4, parse_list_page_bs4, parse_page_bs4
+
+pytestmark = pytest.mark.skipif(not LXML_AVAILABLE, reason="lxml 미설치 (bs4 경로만 사용)")
+
+if LXML_AVAILABLE:
+    from list_parser import parse_last_page_lxml, parse_list_page_lxml, parse_page_lxml
+
+# 픽스콘(Cafe24 스킨) 목록 페이지 저장본: (파일, 상품 수, 마지막 페이지)
+FIXTURES = [
+    ("cafe24_list_first.html", 5, 7),
+    ("cafe24_list_last.html", 2, 7),
+    ("cafe24_list_empty.html", 0, None),
+    ("cafe24_listnormal_nopaging.html", 2, None),
+]
+
+@pytest.mark.parametrize("name, product_count, last_page", FIXTURES)
+def test_lxml_matches_bs4(name, product_count, last_page):
+    html = read_fixture(name)
+    expected = parse_list_page_bs4(html, "iPhone")
+    assert parse_list_page_lxml(html, "iPhone") == expected
+    assert len(expected[1]) == product_count
+
+@pytest.mark.parametrize("name, product_count, last_page", FIXTURES)
+def test_last_page_parsers_agree(name, product_count, last_page):
+    html = read_fixture(name)
+    assert parse_last_page_bs4(html) == last_page
+    assert parse_last_page_lxml(html) == last_page
+
+@pytest.mark.parametrize("name, product_count, last_page", FIXTURES)
+def test_single_parse_matches_separate_parsers(name, product_count, last_page):
+    html = read_fixture(name)
+    count, products = parse_list_page_bs4(html, "iPhone")
+    expected_last = last_page if count else None
+    for parse_page in (parse_page_bs4, parse_page_lxml):
+        assert parse_page(html, "iPhone") == (count, products, expected_last)
+        assert parse_page(html, "iPhone", with_last_page=False) == (count, products, None)
+
+def test_first_page_fields():
+    _, products = parse_list_page_lxml(read_fixture("cafe24_list_first.html"), "iPhone")
+    first = products[0]
+    assert first["name"] == "iPhone 15Pro-Max 액정(정품) 블랙"
+    assert first["price"] == "385,000원"
+    assert first["status"] == "판매중"
+    assert first["url"].startswith("https://fixcon.co.kr/product/detail.html?product_no=1201")
+    assert first["img_url"] == "https://fixcon.co.kr/web/product/medium/2024/1201.jpg"
+    assert [p["status"] for p in products] == ["판매중", "품절", "판매중", "판매중", "품절"]
+    assert products[3]["price"] == "Unknown" # 회원공개
+    assert products[3]["img_url"] == ""
@@ -0,0 +1,30 @@
+import pandas as pd
+
+from card_render import render_card
+from part_index import build_part_index, compute_data_version
+from price_store import concat_frames, products_to_frame
+
+def frame(ts, rows):
+    df = products_to_frame([{"category": "iPhone", "name": name, "price": price, "status": "판매중",
+                             "url": f"https://fixcon.co.kr/{name}"} for name, price in rows], pd.Timestamp(ts))
+    df["모델"] = "iPhone 15"
+    df["부품"] = "액정"
+    return df
+
+def test_unpriced_rows_kept_after_priced_rows():
+    df = concat_frames([
+        frame("2026-10-01 09:00", [("a", "10,000원"), ("b", "20,000원")]),
+        frame("2026-10-02 09:00", [("a", "12,000원"), ("c", "가격문의"), ("d", "Unknown"), ("e", "5,000원")]),
+    ])
+    rows = build_part_index(df)[("iPhone 15", "액정")]
+    # 최신 회차 우선 중복 제거 -> 가격순, 정수 가격이 없는 상품은 맨 뒤, 'Unknown'은 제외
+    assert [(r["상품명"], r["가격"]) for r in rows] == [
+        ("b", "20,000원"), ("a", "12,000원"), ("e", "5,000원"), ("c", "가격문의"),
+    ]
+    assert "가격문의" in render_card(rows[-1])
+    assert "💳 13,200원" in render_card(rows[1])
+
+def test_data_version_changes_per_category():
+    df = frame("2026-10-01 09:00", [("a", "10,000원")])
+    newer = concat_frames([df, frame("2026-10-02 09:00", [("a", "10,000원")])])
+    assert compute_data_version(df) != compute_data_version(newer)
@@ -0,0 +1,132 @@
+import os
+
+import pandas as pd
+import pytest
+
+from price_store import IncrementalLoader, ParquetStore, SQLiteStore, concat_frames, parse_price_series, products_to_frame
+
+@pytest.mark.parametrize("text, expected", [
+    ("42,000원", 42000),
+    (" 1,250,000 원 ", 1250000),
+    ("0원", 0),
+    ("Unknown", None),
+    ("가격문의", None),
+    ("품절 (1,000원 할인)", None),
+    ("42,000", None),
+    ("", None),
+])
+def test_parse_price_series(text, expected):
+    value = parse_price_series(pd.Series([text])).iloc[0]
+    assert (pd.isna(value) if expected is None else value == expected)
+
+def frame(ts, category, names):
+    return products_to_frame([{"category": category, "name": n, "price": "1,000원", "status": "판매중",
+                               "url": f"https://fixcon.co.kr/{n}"} for n in names], pd.Timestamp(ts))
+
+@pytest.mark.parametrize("store_cls", [ParquetStore, SQLiteStore])
+def test_read_latest_keeps_categories_missing_from_recent_runs(tmp_path, store_cls):
+    store = store_cls(str(tmp_path / ("prices" if store_cls is ParquetStore else "prices.sqlite")))
+    # 나누지 않은 회차 파일 (카테고리 A, B) -> 이후 회차는 카테고리별 파일
+    store.append(concat_frames([frame("2026-10-01 09:00", "A", ["a1"]), frame("2026-10-01 09:00", "B", ["b1"])]))
+    store.append(frame("2026-10-02 09:00", "A", ["a2"]), part="A")
+    store.append(frame("2026-10-03 09:00", "A", ["a3"]), part="A")
+    store.append(frame("2026-10-03 09:00", "C", ["c3"]), part="C")
+
+    latest = store.read_latest()
+    assert sorted(latest["상품명"]) == ["a3", "b1", "c3"]
+    latest = store.read_latest(runs=2)
+    assert sorted(latest["상품명"]) == ["a2", "a3", "b1", "c3"]
+
+def make_store(tmp_path, store_cls):
+    return store_cls(str(tmp_path / ("prices" if store_cls is ParquetStore else "prices.sqlite")))
+
+@pytest.mark.parametrize("store_cls", [ParquetStore, SQLiteStore])
+def test_read_tail_returns_only_rows_after_cursor(tmp_path, store_cls):
+    store = make_store(tmp_path, store_cls)
+    store.append(frame("2026-10-01 09:00", "A", ["a1", "a2"]), part="A")
+    tail, cursor = store.read_tail()
+    assert sorted(tail["상품명"]) == ["a1", "a2"]
+
+    tail, cursor = store.read_tail(cursor)
+    assert tail.empty
+    store.append(frame("2026-10-02 09:00", "A", ["a3"]), part="A")
+    store.append(frame("2026-10-02 09:00", "B", ["b3"]), part="B")
+    tail, cursor = store.read_tail(cursor)
+    assert sorted(tail["상품명"]) == ["a3", "b3"]
+    tail, _ = store.read_tail(cursor)
+    assert tail.empty
+
+@pytest.mark.parametrize("store_cls", [ParquetStore, SQLiteStore])
+def test_incremental_loader_keeps_since_floor(tmp_path, store_cls):
+    store = make_store(tmp_path, store_cls)
+    store.append(frame("2026-10-01 09:00", "A", ["old"]), part="A")
+    store.append(frame("2026-10-02 09:00", "A", ["mid"]), part="A")
+    loader = IncrementalLoader(store, since="2026-10-02")
+    assert list(loader.load()["상품명"]) == ["mid"]
+
+    store.append(frame("2026-10-03 09:00", "A", ["new"]), part="A")
+    assert list(loader.load()["상품명"]) == ["new", "mid"]
+    # 기간 제한이 없으면 전체 이력
+    assert list(IncrementalLoader(store).load()["상품명"]) == ["new", "mid", "old"]
+
+def records(page, columns):
+    """저장소마다 다른 dtype(카테고리형 등)을 빼고 값만 비교"""
+    return [[None if pd.isna(v) else v for v in row] for row in page[columns].astype(object).itertuples(index=False)]
+
+def filled_stores(tmp_path):
+    stores = [make_store(tmp_path, ParquetStore), make_store(tmp_path, SQLiteStore)]
+    runs = [
+        ("2026-10-01 09:00", "A", [("a1", "3,000원"), ("a2", "1,000원")]),
+        ("2026-10-01 09:00", "B", [("b1", "가격문의"), ("b2", "2,000원")]),
+        ("2026-10-02 09:00", "A", [("a1", "3,000원"), ("a2", "1,500원"), ("a3", "2,000원")]),
+        ("2026-10-03 09:00", "B", [("b1", "5,000원"), ("b2", "2,000원")]),
+    ]
+    for ts, category, rows in runs:
+        df = products_to_frame([{"category": category, "name": n, "price": p, "status": "판매중",
+                                 "url": f"https://fixcon.co.kr/{n}"} for n, p in rows], pd.Timestamp(ts))
+        for store in stores:
+            store.append(df, part=category)
+    return stores
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"limit": 3},
+    {"offset": 3, "limit": 3},
+    {"offset": 8, "limit": 3}, # 마지막 페이지가 잘림
+    {"offset": 9, "limit": 3}, # 전체 행 수와 같은 위치
+    {"offset": 20, "limit": 3}, # 범위 밖
+    {"offset": 2}, # limit 없이 offset만
+    {"limit": 0},
+    {"sort_by": "가격_숫자", "limit": 4}, # 가격 없는 행은 맨 뒤
+    {"sort_by": "가격_숫자", "ascending": True},
+    {"sort_by": "상품명", "ascending": True, "offset": 1, "limit": 5},
+    {"sort_by": None},
+    {"since": "2026-10-02", "limit": 2},
+    {"since": "2026-10-01", "until": "2026-10-03", "sort_by": "가격_숫자"},
+    {"where": {"카테고리": ["B"]}, "limit": 2},
+    {"where": {"카테고리": []}, "limit": 2}, # 빈 값 목록은 조건 무시
+    {"where": {"카테고리": ["C"]}}, # 없는 카테고리
+    {"where": {"카테고리": ["A"], "상품명": ["a2"]}, "columns": ["상품명", "가격_숫자"]},
+])
+def test_read_page_matches_between_stores(tmp_path, kwargs):
+    parquet, sqlite = filled_stores(tmp_path)
+    columns = kwargs.get("columns", ["수집일시", "카테고리", "상품명", "가격", "가격_숫자"])
+    parquet_page, parquet_total = parquet.read_page(**kwargs)
+    sqlite_page, sqlite_total = sqlite.read_page(**kwargs)
+    assert parquet_total == sqlite_total
+    assert records(parquet_page, columns) == records(sqlite_page, columns)
+
+@pytest.mark.parametrize("store_cls", [ParquetStore, SQLiteStore])
+def test_read_page_empty_store(tmp_path, store_cls):
+    page, total = make_store(tmp_path, store_cls).read_page(where={"카테고리": ["A"]}, limit=10)
+    assert page.empty and total == 0
+
+def test_parquet_part_with_path_characters(tmp_path):
+    store = make_store(tmp_path, ParquetStore)
+    store.append(frame("2026-10-01 09:00", "Acc_케이스/필름", ["f1"]), part="Acc_케이스/필름")
+    store.append(frame("2026-10-02 09:00", "Acc_케이스/필름", ["f2"]), part="Acc_케이스/필름")
+    files = [f for _, _, names in os.walk(store.root) for f in names]
+    assert len(files) == 2 and all("/" not in f for f in files)
+    # 파일명의 part를 되돌려 카테고리로 사용
+    assert {part for _, part, _ in store._run_parts()} == {"Acc_케이스/필름"}
+    assert list(store.read_latest()["상품명"]) == ["f2"]
@@ -0,0 +1,53 @@
+import threading
+import time
+
+from scrape_coordinator import ScrapeCoordinator
+
+def wait_finished(job, timeout=5):
+    deadline = time.time() + timeout
+    while job.running and time.time() < deadline:
+        time.sleep(0.01)
+    assert not job.running
+
+def test_second_submit_joins_running_job():
+    coordinator = ScrapeCoordinator()
+    release = threading.Event()
+    calls = []
+
+    def target(job):
+        calls.append(job.id)
+        job.report({"type": "category", "category": "iPhone"})
+        release.wait(5)
+        return True, "완료"
+
+    job, started = coordinator.submit(target)
+    again, started_again = coordinator.submit(target, trigger="auto")
+    assert started and not started_again
+    assert again is job and coordinator.current() is job
+    assert job.running and job.success is None
+
+    release.set()
+    wait_finished(job)
+    assert calls == [job.id]
+    assert job.success is True and job.output == "완료"
+    assert job.finished_categories == ["iPhone"]
+
+def test_error_is_reported_on_job():
+    coordinator = ScrapeCoordinator()
+
+    def target(job):
+        raise RuntimeError("로그인 실패")
+
+    job, _ = coordinator.submit(target)
+    wait_finished(job)
+    assert job.success is False and job.output == "로그인 실패"
+
+def test_cooldown_after_finished_job():
+    coordinator = ScrapeCoordinator()
+    job, _ = coordinator.submit(lambda job: (False, "실패"))
+    wait_finished(job)
+    same, started = coordinator.submit(lambda job: (True, ""), trigger="auto", cooldown=60)
+    assert same is job and not started
+    new, started = coordinator.submit(lambda job: (True, ""))
+    assert started and new.id == job.id + 1
+    wait_finished(new)
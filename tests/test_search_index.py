@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from part_index import build_search_rows
+from price_store import concat_frames, products_to_frame
+from search_index import MODEL_ALIASES, SearchIndex
+
+def row(category, name, model, part, price=10000):
+    return {"카테고리": category, "상품명": name, "모델": model, "부품": part, "가격_숫자": price}
+
+ROWS = [
+    row("iPhone", "X 액정 (정품)", "iPhone X", "액정"),
+    row("iPhone", "XS Max 액정", "iPhone XS Max", "액정"),
+    row("iPhone", "15Pro-Max 액정", "iPhone 15 Pro Max", "액정"),
+    row("iPhone", "8 배터리", "iPhone 8", "배터리"),
+    row("iPhone", "8+ 배터리", "iPhone 8 Plus", "배터리"),
+    row("iPhone", "16 배터리", "iPhone 16", "배터리"),
+    row("iPhone", "16 배터리 (대용량)", "iPhone 16", "배터리", price=None), # 가격문의 -> 가격 있는 상품 뒤
+]
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    index.update("v1", ROWS)
+    return index
+
+def names(results):
+    return [r["상품명"] for r in results]
+
+def test_single_char_model_alias(index):
+    assert MODEL_ALIASES["x"] == "iPhone X"
+    assert names(index.search("x")) == ["X 액정 (정품)"]
+    assert names(index.search("X 액정")) == ["X 액정 (정품)"]
+    assert names(index.search("8 배터리")) == ["8 배터리"]
+
+def test_multi_char_terms(index):
+    assert set(names(index.search("8+ 배터리"))) >= {"8+ 배터리"}
+    assert names(index.search("15 프로맥스"))[0] == "15Pro-Max 액정"
+
+def test_removed_products_leave_index(index):
+    index.update("v2", [ROWS[0]])
+    assert names(index.search("8 배터리")) == []
+    assert names(index.search("x")) == ["X 액정 (정품)"]
+
+def test_unpriced_rows_rank_after_priced(index):
+    assert names(index.search("16 배터리")) == ["16 배터리", "16 배터리 (대용량)"]
+
+def test_indexes_unpriced_and_unclassified_rows():
+    def snapshot(ts, rows):
+        df = products_to_frame([{"category": "iPhone", "name": name, "price": price, "status": "판매중",
+                                 "url": f"https://fixcon.co.kr/{name}"} for name, _, price in rows], pd.Timestamp(ts))
+        df["모델"] = [model for _, model, _ in rows]
+        df["부품"] = ["액정" if model else None for _, model, _ in rows]
+        return df
+
+    df = concat_frames([
+        snapshot("2026-10-01 09:00", [("15 액정", "iPhone 15", "10,000원")]),
+        snapshot("2026-10-02 09:00", [
+            ("15 액정", "iPhone 15", "12,000원"),
+            ("15 액정 (재고확인)", "iPhone 15", "Unknown"), # part_index에서는 빠지는 가격
+            ("수리 공구 세트", None, "가격문의"), # 분류되지 않은 상품
+        ]),
+    ])
+    index = SearchIndex()
+    index.update("v1", build_search_rows(df))
+    results = index.search("15 액정")
+    assert names(results) == ["15 액정", "15 액정 (재고확인)"]
+    assert results[0]["가격"] == "12,000원" # 같은 상품은 최신 행
+    assert names(index.search("공구")) == ["수리 공구 세트"]
@@ -0,0 +1,50 @@
+import os
+import stat
+import time
+
+import requests
+
+import session_cache
+from session_cache import clear_session_cache, load_cookies, save_cookies
+
+def logged_in_jar():
+    jar = requests.cookies.RequestsCookieJar()
+    jar.set("ECSESSID", "abc123", domain="fixcon.co.kr", path="/")
+    return jar
+
+def test_round_trip_and_file_mode(tmp_path):
+    path = str(tmp_path / "session.json")
+    # 예전 방식으로 남은 임시 파일이 있어도 새 캐시 파일은 0600
+    with open(path + ".tmp", "w") as f:
+        f.write("{}")
+    os.chmod(path + ".tmp", 0o644)
+    save_cookies(logged_in_jar(), "user", path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert "user" not in open(path, encoding="utf-8").read() # 아이디는 해시로만 저장
+
+    jar = requests.cookies.RequestsCookieJar()
+    assert load_cookies(jar, "user", path)
+    assert jar.get("ECSESSID") == "abc123"
+
+def test_account_mismatch(tmp_path):
+    path = str(tmp_path / "session.json")
+    save_cookies(logged_in_jar(), "user", path)
+    jar = requests.cookies.RequestsCookieJar()
+    assert not load_cookies(jar, "other", path)
+    assert len(jar) == 0
+
+def test_ttl_expiry(tmp_path, monkeypatch):
+    path = str(tmp_path / "session.json")
+    save_cookies(logged_in_jar(), "user", path)
+    now = time.time()
+    monkeypatch.setattr(session_cache.time, "time", lambda: now + session_cache.SESSION_TTL + 1)
+    jar = requests.cookies.RequestsCookieJar()
+    assert not load_cookies(jar, "user", path)
+    assert len(jar) == 0
+
+def test_clear(tmp_path):
+    path = str(tmp_path / "session.json")
+    save_cookies(logged_in_jar(), "user", path)
+    clear_session_cache(path)
+    assert not os.path.exists(path)
+    assert not load_cookies(requests.cookies.RequestsCookieJar(), "user", path)